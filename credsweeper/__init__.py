@@ -1,3 +1,5 @@
+from typing import Any, TYPE_CHECKING
+
 from credsweeper.app import CredSweeper
 from credsweeper.common.constants import ThresholdPreset, Severity, Confidence
 from credsweeper.file_handler.byte_content_provider import ByteContentProvider
@@ -7,7 +9,8 @@ from credsweeper.file_handler.diff_content_provider import DiffContentProvider
 from credsweeper.file_handler.string_content_provider import StringContentProvider
 from credsweeper.file_handler.text_content_provider import TextContentProvider
 
-from credsweeper.ml_model.ml_validator import MlValidator
+if TYPE_CHECKING:
+    from credsweeper.ml_model.ml_validator import MlValidator
 
 __all__ = [
     "ByteContentProvider",  #
@@ -25,3 +28,11 @@ __all__ = [
 ]
 
 __version__ = "1.17.4"
+
+
+def __getattr__(name: str) -> Any:
+    """MlValidator is imported on first access because onnxruntime import is slow"""
+    if "MlValidator" == name:
+        from credsweeper.ml_model.ml_validator import MlValidator  # pylint: disable=import-outside-toplevel
+        return MlValidator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,31 +1,61 @@
 import json
 import logging
 import multiprocessing
+import os
+import pickle
 import signal
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional, Union, Dict, Sequence, Tuple
+from typing import Any, List, Optional, Union, Dict, Sequence, Tuple, Iterator, TYPE_CHECKING
 
-import pandas as pd
-from colorama import Style
+from humanfriendly import parse_size
 
 # Directory of credsweeper sources MUST be placed before imports to avoid circular import error
-APP_PATH = Path(__file__).resolve().parent
+APP_PATH: Path = Path(__file__).resolve().parent
 
-from credsweeper.scanner.scanner import Scanner
-from credsweeper.common.constants import Severity, ThresholdPreset, DiffRowType, DEFAULT_ENCODING
+import credsweeper
+from credsweeper.scanner.scanner import Scanner, RULES_PATH
+from credsweeper.common.constants import Severity, ThresholdPreset, DiffRowType, JOB_TASK_SIZE, JOB_TASK_LEN, \
+    JOB_TASKS_PER_PROCESS, JOB_TASKS_IN_FLIGHT, JOB_CONTAINER_SIZE, STREAM_BATCH_SIZE
 from credsweeper.config.config import Config
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.credentials.candidate_key import CandidateKey
+from credsweeper.credentials.candidates_serializer import CandidatesSerializer
 from credsweeper.credentials.credential_manager import CredentialManager
 from credsweeper.deep_scanner.deep_scanner import DeepScanner
+from credsweeper.deep_scanner.tar_scanner import TarScanner
+from credsweeper.deep_scanner.zip_scanner import ZipScanner
+from credsweeper.file_handler.byte_content_provider import ByteContentProvider
 from credsweeper.file_handler.content_provider import ContentProvider
 from credsweeper.file_handler.file_path_extractor import FilePathExtractor
 from credsweeper.file_handler.abstract_provider import AbstractProvider
-from credsweeper.ml_model.ml_validator import MlValidator
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.profiler import Profiler
+from credsweeper.utils.report_writer import ReportWriter
+from credsweeper.utils.scan_cache import ScanCache
 from credsweeper.utils.util import Util
 
+if TYPE_CHECKING:
+    from credsweeper.ml_model.ml_validator import MlValidator
+
 logger = logging.getLogger(__name__)
 
+# the instance is sent to a job process once with pool initializer
+_POOL_CRED_SWEEPER: Optional["CredSweeper"] = None
+
+
+@dataclass(frozen=True)
+class MembersTask:
+    """Members of an archive file which are opened and scanned in a job"""
+    container: int  # position of the archive in the scan
+    part: int  # position of the task for the archive
+    content_provider: ContentProvider
+    positions: List[int]
+    depth: int
+    recursive_limit_size: int
+
 
 class CredSweeper:
     """Advanced credential analyzer base class.
@@ -52,22 +82,34 @@ class CredSweeper:
         sort_output: bool = False,
         use_filters: bool = True,
         pool_count: int = 1,
+        jobs_start_method: str = "spawn",
         ml_batch_size: Optional[int] = None,
         ml_threshold: Union[int, float, ThresholdPreset] = ThresholdPreset.medium,
         ml_config: Union[None, str, Path] = None,
         ml_model: Union[None, str, Path] = None,
         ml_providers: Optional[str] = None,
         ml_threads_limit: Optional[int] = None,
+        ml_in_jobs: bool = False,
         find_by_ext: bool = False,
         pedantic: bool = False,
         depth: int = 0,
         doc: bool = False,
+        whole_file: bool = False,
         severity: Union[Severity, str] = Severity.INFO,
         size_limit: Optional[str] = None,
+        parser_timeout: Optional[int] = None,
+        pattern_timeout: Optional[float] = None,
+        adaptive_filters: bool = False,
+        filter_profile: Union[None, str, Path] = None,
+        profile: bool = False,
         exclude_lines: Optional[List[str]] = None,
         exclude_values: Optional[List[str]] = None,
         thrifty: bool = False,
         log_level: Optional[str] = None,
+        cache_path: Union[None, str, Path] = None,
+        cache_size_limit: Optional[str] = None,
+        cache_age_limit: Optional[int] = None,
+        stream: bool = False,
     ) -> None:
         """Initialize Advanced credential scanner.
 
@@ -84,25 +126,40 @@ class CredSweeper:
             subtext: use subtext of line near variable-value like it performed in ML
             use_filters: boolean variable, specifying the need of rule filters
             pool_count: int value, number of parallel processes to use
+            jobs_start_method: str - multiprocessing start method of the parallel processes: spawn or forkserver
             ml_batch_size: int value, size of the batch for model inference
             ml_threshold: float or string value to specify threshold for the ml model
             ml_config: str or Path to set custom config of ml model
             ml_model: str or Path to set custom ml model
             ml_providers: str - comma separated list with providers
             ml_threads_limit: int | None - throttling prevention limit
+            ml_in_jobs: boolean - ML validation is performed in job processes during multi-job scan
             find_by_ext: boolean - files will be reported by extension
             pedantic: boolean - scan all files
             depth: int - how deep container files will be scanned
             doc: boolean - document-specific scanning
+            whole_file: boolean - pattern rules are located with single regex pass over whole file
             severity: Severity - minimum severity level of rule
             size_limit: optional string integer or human-readable format to skip oversize files
+            parser_timeout: optional int - seconds to parse a document, the data is scanned as strings after timeout
+            pattern_timeout: optional float - seconds to scan a line with a rule, the rule is interrupted after the time
+                and it is skipped after Scanner.RULE_OVERRUNS_LIMIT overruns in a process
+            adaptive_filters: filters of every rule are reordered by measured cost and rejection rate during the scan
+            filter_profile: optional path of JSON file with order of filters, the file is updated with measured
+                statistics after the scan with adaptive filters
+            profile: count calls and time of rules, filters, deep scanners and ML validation in Profiler
             exclude_lines: lines to omit in scan. Will be added to the lines already in config
             exclude_values: values to omit in scan. Will be added to the values already in config
             thrifty: free provider resources after scan to reduce memory consumption
             log_level: str - level for pool initializer according logging levels (UPPERCASE)
+            cache_path: optional directory of persistent cache to skip scan of unchanged content
+            cache_size_limit: optional string integer or human-readable format of maximal cache size
+            cache_age_limit: optional int - days to keep cache entries since last access
+            stream: export credentials by batches during the scan to keep memory usage bounded
 
         """
         self.pool_count: int = max(1, int(pool_count))
+        self.jobs_start_method = jobs_start_method
         if not (_severity := Severity.get(severity)):
             raise RuntimeError(f"Severity level provided: {severity}"
                                f" -- must be one of: {' | '.join([i.value for i in Severity])}")
@@ -112,14 +169,32 @@ class CredSweeper:
                                             pedantic=pedantic,
                                             depth=depth,
                                             doc=doc,
+                                            whole_file=whole_file,
                                             severity=_severity,
                                             size_limit=size_limit,
+                                            parser_timeout=parser_timeout,
+                                            pattern_timeout=pattern_timeout,
                                             exclude_lines=exclude_lines,
                                             exclude_values=exclude_values)
         self.config = Config(config_dict)
         self.scanner = Scanner(self.config, rule_path)
+        self.profile = profile
+        if profile:
+            Profiler.enabled = True
+        self.adaptive_filters = adaptive_filters
+        self.filter_profile = filter_profile
+        if adaptive_filters or filter_profile:
+            # the order of filters does not change results, so the settings are not a part of the fingerprint
+            profile = Util.json_load(filter_profile) if filter_profile and Path(filter_profile).is_file() else None
+            self.scanner.set_filters_order(profile if isinstance(profile, dict) else None, adaptive_filters)
         self.deep_scanner = DeepScanner(self.config, self.scanner)
+        # candidates from job processes and cache refer to the config and the rule patterns of current process
+        pattern_lists = [rule.patterns for rule, _ in self.scanner.rules_scanners]
+        self.candidates_serializer = CandidatesSerializer(self.config, pattern_lists)
         self.credential_manager = CredentialManager()
+        # settings for the fingerprint which is calculated on demand because ML model is read for it
+        self.__fingerprint_settings = (config_dict, rule_path)
+        self.__fingerprint: Optional[str] = None
         self.json_filename: Union[None, str, Path] = json_filename
         self.xlsx_filename: Union[None, str, Path] = xlsx_filename
         self.stdout = stdout
@@ -133,9 +208,22 @@ class CredSweeper:
         self.ml_model = ml_model
         self.ml_providers = ml_providers
         self.ml_threads_limit = ml_threads_limit
+        self.ml_in_jobs = ml_in_jobs
+        # whether ML validation of current candidates was performed in job processes
+        self.__ml_validated = False
         self.thrifty = thrifty
         self.log_level = log_level
-        self.__ml_validator: Optional[MlValidator] = None
+        self.stream = stream
+        self.__ml_validator: Optional["MlValidator"] = None
+        self.scan_cache: Optional[ScanCache] = None
+        if cache_path:
+            self.scan_cache = ScanCache(
+                path=cache_path,  #
+                fingerprint=self.fingerprint,  #
+                config=self.config,  #
+                size_limit=parse_size(cache_size_limit) if cache_size_limit is not None else None,  #
+                age_limit=86400 * cache_age_limit if cache_age_limit is not None else None,  #
+                pattern_lists=pattern_lists)
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -155,17 +243,23 @@ class CredSweeper:
             pedantic: bool,  #
             depth: int,  #
             doc: bool,  #
+            whole_file: bool,  #
             severity: Severity,  #
             size_limit: Optional[str],  #
+            parser_timeout: Optional[int],  #
+            pattern_timeout: Optional[float],  #
             exclude_lines: Optional[List[str]],  #
             exclude_values: Optional[List[str]]) -> Dict[str, Any]:
         config_dict = Util.json_load(self._get_config_path(config_path))
         config_dict["use_filters"] = use_filters
         config_dict["find_by_ext"] = find_by_ext
         config_dict["size_limit"] = size_limit
+        config_dict["parser_timeout"] = parser_timeout
+        config_dict["pattern_timeout"] = pattern_timeout
         config_dict["pedantic"] = pedantic
         config_dict["depth"] = depth
         config_dict["doc"] = doc
+        config_dict["whole_file"] = whole_file
         config_dict["severity"] = severity.value
 
         if exclude_lines is not None:
@@ -177,6 +271,30 @@ class CredSweeper:
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def _get_fingerprint(self, config_dict: Dict[str, Any], rule_path: Union[None, str, Path]) -> str:
+        """Returns hash of the version, rules, config and ML model which affect scan results"""
+        ml_config_path = self.ml_config or APP_PATH / "ml_model" / "ml_config.json"
+        ml_model_path = self.ml_model or APP_PATH / "ml_model" / "ml_model.onnx"
+        return ScanCache.get_fingerprint(
+            # the version is defined after import of the module, so it is read at the call
+            credsweeper.__version__,  #
+            Util.read_data(rule_path or RULES_PATH),  #
+            json.dumps(config_dict, sort_keys=True, default=str),  #
+            str(self.ml_threshold),  #
+            Util.read_data(ml_config_path) if Path(ml_config_path).is_file() else None,  #
+            Util.read_data(ml_model_path) if Path(ml_model_path).is_file() else None)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of all settings which affect scan results, to validate persistent results"""
+        if self.__fingerprint is None:
+            self.__fingerprint = self._get_fingerprint(*self.__fingerprint_settings)
+        return self.__fingerprint
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def _use_ml_validation(self) -> bool:
         if isinstance(self.ml_threshold, int) and 0 == self.ml_threshold:
             logger.info("ML validation is disabled")
@@ -194,9 +312,11 @@ class CredSweeper:
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     @property
-    def ml_validator(self) -> MlValidator:
+    def ml_validator(self) -> "MlValidator":
         """ml_validator getter"""
         if not self.__ml_validator:
+            # the import is deferred because onnxruntime is not required when ML validation is disabled
+            from credsweeper.ml_model.ml_validator import MlValidator  # pylint: disable=import-outside-toplevel
             self.__ml_validator = MlValidator(
                 threshold=self.ml_threshold,  #
                 ml_config=self.ml_config,  #
@@ -210,11 +330,174 @@ class CredSweeper:
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def reset_ml_state(self) -> None:
+        """Marks the collected candidates as not validated with ML, so post processing performs the validation"""
+        self.__ml_validated = False
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     @staticmethod
-    def pool_initializer(log_kwargs) -> None:
-        """Ignore SIGINT in child processes."""
+    def pool_initializer(log_kwargs, bootstrap: Optional[bytes] = None) -> None:
+        """Ignore SIGINT in child processes and keep the instance for tasks.
+
+        The instance is pickled once in main process, so only the bytes are sent to every job.
+
+        """
+        global _POOL_CRED_SWEEPER  # pylint: disable=global-statement
         logging.basicConfig(**log_kwargs)
         signal.signal(signal.SIGINT, signal.SIG_IGN)
+        cred_sweeper: Optional[CredSweeper] = pickle.loads(bootstrap) if bootstrap is not None else None
+        if cred_sweeper is not None and cred_sweeper.ml_in_jobs:
+            # candidates of tasks are not validated yet
+            cred_sweeper.reset_ml_state()
+            if cred_sweeper.ml_threads_limit is None:
+                # every job has own inference session, so the threads are limited to avoid oversubscription
+                cred_sweeper.ml_threads_limit = 1
+        if cred_sweeper is not None and cred_sweeper.adaptive_filters:
+            # statistics of the main process are kept there, so the job sends only own statistics
+            cred_sweeper.scanner.reset_filters_profile()
+        if cred_sweeper is not None and cred_sweeper.profile:
+            Profiler.enabled = True
+        _POOL_CRED_SWEEPER = cred_sweeper
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def pool_warm_up_initializer(log_kwargs, bootstrap: Optional[bytes] = None) -> None:
+        """Initializes the job like pool_initializer and creates ML validator in advance for long living jobs"""
+        CredSweeper.pool_initializer(log_kwargs, bootstrap)
+        cred_sweeper = _POOL_CRED_SWEEPER
+        if cred_sweeper is not None and cred_sweeper.ml_in_jobs \
+                and not (isinstance(cred_sweeper.ml_threshold, int) and 0 == cred_sweeper.ml_threshold):
+            _ = cred_sweeper.ml_validator
+
+    # # ## # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def pool_files_scan(content_providers: Sequence[ContentProvider]) -> Tuple[int, float, bytes]:
+        """Scans a task in a job process with the instance from pool initializer
+
+        Return:
+            process id, time of the scan in seconds and serialized found candidates
+
+        """
+        if _POOL_CRED_SWEEPER is None:
+            raise RuntimeError("The job process was not initialized!")
+        start_time = time.perf_counter()
+        candidates = _POOL_CRED_SWEEPER.files_scan(content_providers)
+        if _POOL_CRED_SWEEPER.ml_in_jobs:
+            # candidates of a file are in the same task, so the groups for ML are complete
+            candidates = _POOL_CRED_SWEEPER.validate_task(candidates)
+        return os.getpid(), time.perf_counter() - start_time, _POOL_CRED_SWEEPER.candidates_serializer.dumps(candidates)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def pool_members_scan(task: MembersTask) -> Tuple[int, float, Optional[bytes]]:
+        """Scans members of an archive in a job process with the instance from pool initializer
+
+        Return:
+            process id, time of the scan in seconds and serialized found candidates in order of the members
+            or None when the archive has to be scanned in whole
+
+        """
+        if _POOL_CRED_SWEEPER is None:
+            raise RuntimeError("The job process was not initialized!")
+        start_time = time.perf_counter()
+        scan_results: Optional[bytes] = None
+        try:
+            candidates = _POOL_CRED_SWEEPER.deep_scanner.container_members_scan(task.content_provider, task.positions,
+                                                                                task.depth, task.recursive_limit_size)
+            scan_results = _POOL_CRED_SWEEPER.candidates_serializer.dumps(candidates)
+        except Exception as exc:
+            logger.warning("Cannot scan members of %s: %s", task.content_provider.file_path, exc)
+        return os.getpid(), time.perf_counter() - start_time, scan_results
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def pool_task_scan(
+            indexed_task: Tuple[int, Union[List[ContentProvider], MembersTask]]
+    ) -> Tuple[int, int, float, Optional[bytes], Optional[Dict[str, List[Dict[str, Any]]]],
+               Optional[Dict[str, Dict[str, Dict[str, Any]]]]]:  # yapf: disable
+        """Scans files or members of an archive, so all tasks are in the same queue of the pool
+
+        Return:
+            index of the task, results of pool_files_scan or pool_members_scan,
+            statistics of adaptive filters and profiler counters of the job since start
+
+        """
+        index, task = indexed_task
+        if isinstance(task, MembersTask):
+            result = CredSweeper.pool_members_scan(task)
+        else:
+            result = CredSweeper.pool_files_scan(task)
+        filters_profile = None
+        if _POOL_CRED_SWEEPER is not None and _POOL_CRED_SWEEPER.adaptive_filters:
+            filters_profile = _POOL_CRED_SWEEPER.scanner.get_filters_profile()
+        return (index, *result, filters_profile, Profiler.get_counters() if Profiler.enabled else None)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def validate_task(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Performs post processing with ML validation for candidates of a task apart from collected credentials"""
+        collected_credentials = self.credential_manager.get_credentials()
+        ml_validated = self.__ml_validated
+        self.__ml_validated = False
+        try:
+            self.credential_manager.set_credentials(candidates)
+            self.post_processing()
+            return self.credential_manager.get_credentials()
+        finally:
+            self.credential_manager.set_credentials(collected_credentials)
+            self.__ml_validated = ml_validated
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def get_provider_size(content_provider: ContentProvider) -> int:
+        """Returns size of the provider data without reading of a file or 0 when the size is unknown"""
+        if isinstance(content_provider, ByteContentProvider):
+            return len(content_provider.data) if content_provider.data else 0
+        try:
+            return os.path.getsize(content_provider.file_path)
+        except (OSError, ValueError):
+            return 0
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def get_pool_tasks(content_providers: Sequence[ContentProvider], pool_count: int) -> List[List[ContentProvider]]:
+        """Splits the providers to tasks for the pool.
+
+        The largest providers are scheduled first and the smallest are grouped at the end of the queue,
+        so idle jobs take the rest of the work in small portions until all providers are scanned.
+
+        Args:
+            content_providers: providers to scan
+            pool_count: number of jobs
+
+        Return:
+            list of tasks - the providers sorted by size in descending order and grouped
+            up to JOB_TASK_SIZE bytes and JOB_TASK_LEN providers
+
+        """
+        task_len = max(1, min(JOB_TASK_LEN, len(content_providers) // (JOB_TASKS_PER_PROCESS * pool_count)))
+        sized_providers = sorted(((CredSweeper.get_provider_size(x), n) for n, x in enumerate(content_providers)),
+                                 key=lambda x: (-x[0], x[1]))
+        tasks: List[List[ContentProvider]] = []
+        task: List[ContentProvider] = []
+        task_size = 0
+        for size, n in sized_providers:
+            if task and (JOB_TASK_SIZE < task_size + size or task_len <= len(task)):
+                tasks.append(task)
+                task = []
+                task_size = 0
+            task.append(content_providers[n])
+            task_size += size
+        if task:
+            tasks.append(task)
+        return tasks
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -230,10 +513,12 @@ class CredSweeper:
         if not file_extractors:
             logger.info("No scannable targets for %s paths", len(content_provider.paths))
             return 0
-        self.scan(file_extractors)
-        self.post_processing()
         # PatchesProvider has the attribute. Circular import error appears with using the isinstance
         change_type = content_provider.change_type if hasattr(content_provider, "change_type") else None
+        if self.stream:
+            return self.stream_scan(file_extractors, change_type)
+        self.scan(file_extractors)
+        self.post_processing()
         self.export_results(change_type)
         return self.credential_manager.len_credentials()
 
@@ -246,10 +531,76 @@ class CredSweeper:
             content_providers: file objects to scan
 
         """
-        if 1 < self.pool_count and 1 < len(content_providers):
-            self.__multi_jobs_scan(content_providers)
+        if self.__is_multi_jobs(content_providers):
+            for candidates in self.__multi_jobs_scan(content_providers):
+                for cred in candidates:
+                    self.credential_manager.add_credential(cred)
+            self.__ml_validated = self.ml_in_jobs
         else:
             self.__single_job_scan(content_providers)
+            self.__ml_validated = False
+        if self.scan_cache is not None:
+            self.scan_cache.evict()
+        self.__save_filters_profile()
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def stream_scan(self,
+                    content_providers: Sequence[ContentProvider],
+                    change_type: Optional[DiffRowType] = None) -> int:
+        """Run scanning with export of credentials by batches to keep memory usage bounded.
+
+        Duplicates and groups for ML validation are defined within a file, so every batch contains all candidates
+        of scanned files and is post processed separately. Output is sorted within a batch only.
+
+        Args:
+            content_providers: file objects to scan
+            change_type: flag to know which file should be created for a patch
+
+        Return:
+            number of exported credentials
+
+        """
+        if self.__is_multi_jobs(content_providers):
+            scan_results = self.__multi_jobs_scan(content_providers)
+            self.__ml_validated = self.ml_in_jobs
+        else:
+            logger.info("Scan for %s providers", len(content_providers))
+            scan_results = self.__files_scan_iter(content_providers)
+            self.__ml_validated = False
+        with self.__get_report_writer(change_type) as report_writer:
+            batch: List[Candidate] = []
+            for candidates in scan_results:
+                batch.extend(candidates)
+                if STREAM_BATCH_SIZE <= len(batch):
+                    self.__export_batch(batch, report_writer)
+                    batch = []
+            if batch:
+                self.__export_batch(batch, report_writer)
+        if self.scan_cache is not None:
+            self.scan_cache.evict()
+        self.__save_filters_profile()
+        return report_writer.count
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __save_filters_profile(self) -> None:
+        """Writes measured statistics of adaptive filters to the profile file for next scans"""
+        if self.adaptive_filters and self.filter_profile:
+            Util.json_dump(self.scanner.get_filters_profile(), self.filter_profile)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __export_batch(self, candidates: List[Candidate], report_writer: ReportWriter) -> None:
+        """Post processes the candidates and writes them to reports. The credential manager is released after"""
+        self.credential_manager.set_credentials(candidates)
+        self.post_processing()
+        credentials = self.credential_manager.get_credentials()
+        logger.info("Exporting %s credentials", len(credentials))
+        if self.sort_output:
+            self.sort_credentials(credentials)
+        report_writer.write(credentials)
+        self.credential_manager.set_credentials([])
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -261,45 +612,245 @@ class CredSweeper:
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __multi_jobs_scan(self, content_providers: Sequence[ContentProvider]) -> None:
-        """Performs scan with multiple jobs"""
-        # use this separation to satisfy YAPF formatter
-        yapfix = "%(asctime)s | %(levelname)s | %(processName)s:%(threadName)s | %(filename)s:%(lineno)s | %(message)s"
-        log_kwargs = {"format": yapfix}
-        if isinstance(self.log_level, str):
-            # is not None
-            if "SILENCE" == self.log_level:
-                logging.addLevelName(60, "SILENCE")
-            log_kwargs["level"] = self.log_level
-        pool_count = min(self.pool_count, len(content_providers))
+    def __is_multi_jobs(self, content_providers: Sequence[ContentProvider]) -> bool:
+        """Returns True when the providers or members of single large archive may be scanned in several jobs"""
+        if 1 >= self.pool_count or not content_providers:
+            return False
+        return 1 < len(content_providers) or self.__is_pool_container(content_providers[0])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __multi_jobs_scan(self, content_providers: Sequence[ContentProvider]) -> Iterator[List[Candidate]]:
+        """Performs scan with multiple jobs and yields candidates of every task.
+
+        Members of large archives are opened and scanned in the jobs. The member tasks and the tasks of other
+        providers are in the same queue, so the jobs are busy until all tasks are done. Candidates of an archive
+        are yielded when all its members are scanned.
+        Number of tasks which are sent to the jobs but are not consumed is limited to keep memory usage bounded.
+
+        """
+        containers: List[ContentProvider] = []
+        # candidates of member tasks for every container, the list is released after the container is completed
+        containers_results: List[List[Optional[List[Candidate]]]] = []
+        containers_keys: List[Optional[str]] = []
+        tasks: List[Union[List[ContentProvider], MembersTask]] = []
+        other_providers: List[ContentProvider] = []
+        for provider in content_providers:
+            members_tasks, cache_key, cached_candidates = self.__get_members_tasks(provider, len(containers))
+            if cached_candidates is not None:
+                logger.debug("Cache hit for %s %s", provider.file_path, provider.info)
+                yield self.validate_task(cached_candidates) if self.ml_in_jobs else cached_candidates
+            elif members_tasks:
+                logger.info("Scan %s members tasks of %s in jobs", len(members_tasks), provider.file_path)
+                containers.append(provider)
+                containers_results.append([None] * len(members_tasks))
+                containers_keys.append(cache_key)
+                tasks.extend(members_tasks)
+            else:
+                other_providers.append(provider)
+        if other_providers:
+            tasks.extend(self.get_pool_tasks(other_providers, min(self.pool_count, len(other_providers))))
+        if not tasks:
+            return
+        pool_count = min(self.pool_count, len(tasks))
         logger.info("Scan in %s processes for %s providers", pool_count, len(content_providers))
-        with multiprocessing.get_context("spawn").Pool(processes=pool_count,
-                                                       initializer=CredSweeper.pool_initializer,
-                                                       initargs=(log_kwargs,)) as pool:  # yapf: disable
+        containers_pending = [len(x) for x in containers_results]
+        # process id: number of tasks and busy time
+        utilization: Dict[int, Tuple[int, float]] = {}
+        # process id: last statistics of adaptive filters and last profiler counters
+        jobs_filters_profiles: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        jobs_counters: Dict[int, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        in_flight = threading.Semaphore(JOB_TASKS_IN_FLIGHT * pool_count)
+
+        def bounded_tasks() -> Iterator[Tuple[int, Union[List[ContentProvider], MembersTask]]]:
+            """The generator is consumed by the task handler thread of the pool"""
+            for indexed_task in enumerate(tasks):
+                in_flight.acquire()  # pylint: disable=consider-using-with
+                yield indexed_task
+
+        start_time = time.perf_counter()
+        with self.get_pool_context().Pool(processes=pool_count,
+                                          initializer=CredSweeper.pool_initializer,
+                                          initargs=self.get_pool_initargs()) as pool:  # yapf: disable
             try:
-                for scan_results in pool.imap_unordered(self.files_scan,
-                                                        (content_providers[x::pool_count] for x in range(pool_count))):
-                    for cred in scan_results:
-                        self.credential_manager.add_credential(cred)
-            except KeyboardInterrupt:
+                for index, pid, busy_time, scan_results, filters_profile, counters in pool.imap_unordered(
+                        CredSweeper.pool_task_scan, bounded_tasks()):
+                    in_flight.release()
+                    tasks_count, pid_busy_time = utilization.get(pid, (0, 0.0))
+                    utilization[pid] = (1 + tasks_count, busy_time + pid_busy_time)
+                    if filters_profile is not None:
+                        jobs_filters_profiles[pid] = filters_profile
+                    if counters is not None:
+                        jobs_counters[pid] = counters
+                    task = tasks[index]
+                    if not isinstance(task, MembersTask):
+                        yield self.candidates_serializer.loads(scan_results)
+                        continue
+                    if scan_results is not None:
+                        containers_results[task.container][task.part] = self.candidates_serializer.loads(scan_results)
+                    containers_pending[task.container] -= 1
+                    if 0 == containers_pending[task.container]:
+                        yield self.__merge_members(containers[task.container], containers_results[task.container],
+                                                   containers_keys[task.container])
+                        containers_results[task.container] = []
+            except BaseException:
+                # unblock the task handler thread to terminate the pool
+                for _ in tasks:
+                    in_flight.release()
                 pool.terminate()
                 pool.join()
                 raise
             pool.close()
             pool.join()
+        for filters_profile in jobs_filters_profiles.values():
+            self.scanner.merge_filters_profile(filters_profile)
+        for counters in jobs_counters.values():
+            Profiler.merge(counters)
+        self.__log_utilization(utilization, time.perf_counter() - start_time, pool_count, len(tasks))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_pool_initargs(self) -> Tuple[Dict[str, Any], bytes]:
+        """Returns arguments of pool_initializer: logging settings and the pickled instance"""
+        # use this separation to satisfy YAPF formatter
+        yapfix = "%(asctime)s | %(levelname)s | %(processName)s:%(threadName)s | %(filename)s:%(lineno)s | %(message)s"
+        log_kwargs: Dict[str, Any] = {"format": yapfix}
+        if isinstance(self.log_level, str):
+            # is not None
+            if "SILENCE" == self.log_level:
+                logging.addLevelName(60, "SILENCE")
+            log_kwargs["level"] = self.log_level
+        return log_kwargs, pickle.dumps(self)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def get_pool_context(self) -> Any:
+        """Returns multiprocessing context for the jobs. Spawn is used when the start method is not supported"""
+        start_method = self.jobs_start_method
+        if start_method not in multiprocessing.get_all_start_methods():
+            logger.warning("Start method %s is not supported, spawn is used", start_method)
+            start_method = "spawn"
+        context = multiprocessing.get_context(start_method)
+        if "forkserver" == start_method:
+            # the server imports the package once, so the jobs are forked without the import
+            context.set_forkserver_preload([__name__])
+        return context
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __is_pool_container(self, content_provider: ContentProvider) -> bool:
+        """Returns True for a large archive file whose members may be opened and scanned in the jobs"""
+        if 0 >= self.config.depth or not isinstance(content_provider, TextContentProvider) \
+                or FilePathExtractor.is_find_by_ext_file(self.config, content_provider.file_type) \
+                or JOB_CONTAINER_SIZE > self.get_provider_size(content_provider):
+            return False
+        try:
+            with open(content_provider.file_path, "rb") as f:
+                head = f.read(512)
+        except OSError:
+            return False
+        return ZipScanner.match(head) or TarScanner.match(head)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __get_members_tasks(self, content_provider: ContentProvider,
+                            container: int) -> Tuple[List[MembersTask], Optional[str], Optional[List[Candidate]]]:
+        """Splits members of a large archive to tasks like get_pool_tasks does for the providers.
+
+        Only the index of the archive is used in main process, the members are read in the jobs.
+
+        Return:
+            the tasks or empty list when the provider is scanned as usual, key of cache entry for the archive
+            and the cached candidates of the archive which need no scan
+
+        """
+        if not self.__is_pool_container(content_provider):
+            return [], None, None
+        cache_key: Optional[str] = None
+        if self.scan_cache is not None and (cache_key := self.scan_cache.get_key(content_provider)):
+            if (cached_candidates := self.scan_cache.get(cache_key)) is not None:
+                content_provider.free()
+                return [], cache_key, cached_candidates
+        depth = self.config.depth
+        members = self.deep_scanner.get_container_members(content_provider, depth, self.config.size_limit)
+        # the data are not sent to the jobs
+        content_provider.free()
+        if not members or not members[1]:
+            return [], None, None
+        recursive_limit_size, positions_sizes = members
+        tasks: List[MembersTask] = []
+        positions: List[int] = []
+        task_size = 0
+        for position, size in positions_sizes:
+            if positions and (JOB_TASK_SIZE < task_size + size or JOB_TASK_LEN <= len(positions)):
+                tasks.append(
+                    MembersTask(container, len(tasks), content_provider, positions, depth, recursive_limit_size))
+                positions = []
+                task_size = 0
+            positions.append(position)
+            task_size += size
+        tasks.append(MembersTask(container, len(tasks), content_provider, positions, depth, recursive_limit_size))
+        return tasks, cache_key, None
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __merge_members(self, content_provider: ContentProvider, results: List[Optional[List[Candidate]]],
+                        cache_key: Optional[str]) -> List[Candidate]:
+        """Merges candidates of the members in their order like serial scan of the archive does.
+
+        The archive is scanned in main process when a member could not be scanned, because serial scan would use
+        fallback scanners for the archive.
+
+        """
+        candidates: List[Candidate] = []
+        for member_candidates in results:
+            if member_candidates is None:
+                logger.info("Scan %s in main process", content_provider.file_path)
+                # the cache was looked up for the archive before the members tasks
+                candidates = self.__uncached_file_scan(content_provider)
+                break
+            candidates.extend(member_candidates)
+        if self.scan_cache is not None and cache_key:
+            self.scan_cache.put(cache_key, candidates)
+        content_provider.free()
+        if self.ml_in_jobs:
+            candidates = self.validate_task(candidates)
+        return candidates
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def __log_utilization(utilization: Dict[int, Tuple[int, float]], wall_time: float, pool_count: int,
+                          tasks_count: int) -> None:
+        """Reports busy time of each job process relative to wall time of the scan to choose number of jobs"""
+        wall_time = wall_time if 0 < wall_time else 1.0
+        jobs = ", ".join(f"{pid}: {count} tasks {busy:.2f}s {100 * busy / wall_time:.0f}%"
+                         for pid, (count, busy) in sorted(utilization.items()))
+        total_busy = sum(x[1] for x in utilization.values())
+        logger.info("Jobs utilization %.0f%% for %s tasks in %.2fs: %s", 100 * total_busy / (wall_time * pool_count),
+                    tasks_count, wall_time, jobs)
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     def files_scan(self, content_providers: Sequence[ContentProvider]) -> List[Candidate]:
         """Auxiliary method for scan one sequence"""
         all_cred: List[Candidate] = []
+        for candidates in self.__files_scan_iter(content_providers):
+            all_cred.extend(candidates)
+        return all_cred
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __files_scan_iter(self, content_providers: Sequence[ContentProvider]) -> Iterator[List[Candidate]]:
+        """Yields candidates of every provider in the sequence"""
+        candidates_count = 0
         for provider in content_providers:
             candidates = self.file_scan(provider)
             if self.thrifty:
                 provider.free()
-            all_cred.extend(candidates)
-        logger.info("Completed: processed %s providers with %s candidates", len(content_providers), len(all_cred))
-        return all_cred
+            candidates_count += len(candidates)
+            yield candidates
+        logger.info("Completed: processed %s providers with %s candidates", len(content_providers), candidates_count)
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -313,9 +864,29 @@ class CredSweeper:
             list of credential candidates from scanned file
 
         """
-        candidates: List[Candidate] = []
         logger.debug("Start scan file: %s %s", content_provider.file_path, content_provider.info)
 
+        cache_key: Optional[str] = None
+        if self.scan_cache is not None and not FilePathExtractor.is_find_by_ext_file(
+                self.config, content_provider.file_type):
+            if cache_key := self.scan_cache.get_key(content_provider):
+                if (cached_candidates := self.scan_cache.get(cache_key)) is not None:
+                    logger.debug("Cache hit for %s %s", content_provider.file_path, content_provider.info)
+                    return cached_candidates
+
+        candidates = self.__uncached_file_scan(content_provider)
+
+        if self.scan_cache is not None and cache_key:
+            self.scan_cache.put(cache_key, candidates)
+
+        # finally return result from 'file_scan'
+        return candidates
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __uncached_file_scan(self, content_provider: ContentProvider) -> List[Candidate]:
+        """Scans the provider without lookup in the cache"""
+        candidates: List[Candidate] = []
         if FilePathExtractor.is_find_by_ext_file(self.config, content_provider.file_type):
             # Skip the file scanning and create fake candidate because the extension is suspicious
             dummy_candidate = Candidate.get_dummy_candidate(self.config, content_provider.file_path,
@@ -331,8 +902,6 @@ class CredSweeper:
                 if content_provider.file_type not in self.config.exclude_containers:
                     # Regular file scanning
                     candidates = self.scanner.scan(content_provider)
-
-        # finally return result from 'file_scan'
         return candidates
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -341,7 +910,9 @@ class CredSweeper:
         """Machine learning validation for received credential candidates."""
         if purged := self.credential_manager.purge_duplicates():
             logger.info("Purged %s duplicates", purged)
-        if self._use_ml_validation():
+        if self.__ml_validated:
+            logger.info("ML validation was performed in jobs")
+        elif self._use_ml_validation():
             logger.info("Grouping %s candidates", len(self.credential_manager.candidates))
             new_cred_list: List[Candidate] = []
             cred_groups = self.credential_manager.group_credentials()
@@ -388,60 +959,33 @@ class CredSweeper:
         logger.info("Exporting %s credentials", len(credentials))
 
         if self.sort_output:
-            credentials.sort(key=lambda x: (  #
-                x.line_data_list[0].path,  #
-                x.line_data_list[0].line_num,  #
-                x.severity,  #
-                x.rule_name,  #
-                x.line_data_list[0].value_start,  #
-                x.line_data_list[0].value_end  #
-            ))
-
-        if self.json_filename:
-            json_path = Path(self.json_filename)
-            if isinstance(change_type, DiffRowType):
-                # add suffix for appropriated reports to create two files for the patch scan
-                json_path = json_path.with_suffix(f".{change_type.value}{json_path.suffix}")
-            with open(json_path, 'w', encoding=DEFAULT_ENCODING) as f:
-                # use the approach to reduce total memory usage in case of huge data
-                first_item = True
-                f.write('[\n')
-                for credential in credentials:
-                    if first_item:
-                        first_item = False
-                    else:
-                        f.write(",\n")
-                    f.write(json.dumps(credential.to_json(hashed=self.hashed, subtext=self.subtext), indent=4))
-                f.write("\n]")
-
-        if self.xlsx_filename:
-            data_list = []
-            for credential in credentials:
-                data_list.extend(credential.to_dict_list(hashed=self.hashed, subtext=self.subtext))
-            df = pd.DataFrame(data=data_list)
-            if isinstance(change_type, DiffRowType):
-                if Path(self.xlsx_filename).exists():
-                    with pd.ExcelWriter(self.xlsx_filename, mode='a', engine="openpyxl",
-                                        if_sheet_exists="replace") as writer:
-                        df.to_excel(writer, sheet_name=change_type.value, index=False)
-                else:
-                    df.to_excel(self.xlsx_filename, sheet_name=change_type.value, index=False)
-            else:
-                df.to_excel(self.xlsx_filename, sheet_name="report", index=False)
-
-        if self.color:
-            for credential in credentials:
-                for line_data in credential.line_data_list:
-                    # bright rule name and path or info
-                    if isinstance(credential.ml_probability, float):
-                        ml_probability_info = f" {credential.ml_probability:.6f}"
-                    else:
-                        ml_probability_info = ""
-                    print(Style.BRIGHT + credential.rule_name +
-                          f" {line_data.info or line_data.path}:{line_data.line_num}{ml_probability_info}" +
-                          Style.RESET_ALL)
-                    print(line_data.get_colored_line(hashed=self.hashed, subtext=self.subtext))
-
-        if self.stdout:
-            for credential in credentials:
-                print(credential.to_str(hashed=self.hashed, subtext=self.subtext))
+            self.sort_credentials(credentials)
+
+        with self.__get_report_writer(change_type) as report_writer:
+            report_writer.write(credentials)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @staticmethod
+    def sort_credentials(credentials: List[Candidate]) -> None:
+        """Sorts the credentials in place by path, line number, severity, rule name and position of value"""
+        credentials.sort(key=lambda x: (  #
+            x.line_data_list[0].path,  #
+            x.line_data_list[0].line_num,  #
+            x.severity,  #
+            x.rule_name,  #
+            x.line_data_list[0].value_start,  #
+            x.line_data_list[0].value_end  #
+        ))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __get_report_writer(self, change_type: Optional[DiffRowType]) -> ReportWriter:
+        """Creates writer of the reports according to the settings"""
+        return ReportWriter(json_filename=self.json_filename,
+                            xlsx_filename=self.xlsx_filename,
+                            stdout=self.stdout,
+                            color=self.color,
+                            hashed=self.hashed,
+                            subtext=self.subtext,
+                            change_type=change_type)
@@ -0,0 +1,86 @@
+import json
+import logging
+import sys
+import tempfile
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import List, Optional
+
+from credsweeper.bench.benchmark import Benchmark, BENCH_CASES
+from credsweeper.bench.corpus import CorpusGenerator
+from credsweeper.common.constants import DEFAULT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+
+def get_arguments(args: Optional[List[str]] = None) -> Namespace:
+    """Parses arguments of the benchmark"""
+    parser = ArgumentParser(prog="python -m credsweeper.bench",
+                            description="Runs CredSweeper on a generated corpus and reports performance metrics")
+    parser.add_argument("--path", help="directory for the corpus (temporary by default)", dest="path")
+    parser.add_argument("--seed", help="seed of the corpus generator (default: 0)", type=int, default=0, dest="seed")
+    parser.add_argument("--scale", help="scale of the corpus (default: 1)", type=int, default=1, dest="scale")
+    parser.add_argument("--cases",
+                        nargs="+",
+                        choices=list(BENCH_CASES.keys()),
+                        help="benchmark cases (default: all)",
+                        dest="cases")
+    parser.add_argument("--repeat",
+                        help="number of runs of every case, the fastest is reported (default: 1)",
+                        type=int,
+                        default=1,
+                        dest="repeat")
+    parser.add_argument("--no-startup",
+                        help="skip measurement of startup time",
+                        action="store_false",
+                        dest="startup",
+                        default=True)
+    parser.add_argument("--output", help="json file to save the report", dest="output")
+    parser.add_argument("--baseline", help="json report to compare with", dest="baseline")
+    parser.add_argument("--tolerance",
+                        help="allowed relative increase of time and memory (default: 0.2)",
+                        type=float,
+                        default=0.2,
+                        dest="tolerance")
+    return parser.parse_args(args)
+
+
+def run_benchmark(path: Path, args: Namespace) -> int:
+    """Generates the corpus, runs the benchmark and compares with baseline
+
+    Return:
+        0 when there are no regressions, 1 otherwise
+
+    """
+    corpus_stats = CorpusGenerator(seed=args.seed, scale=args.scale).generate(path)
+    logger.info("Corpus %s: %s", path, corpus_stats)
+    report = Benchmark(path, corpus_stats, args.repeat).run(args.cases, args.startup)
+    report["seed"] = args.seed
+    report["scale"] = args.scale
+    report_text = json.dumps(report, indent=4)
+    if args.output:
+        Path(args.output).write_text(report_text, encoding=DEFAULT_ENCODING)
+    else:
+        print(report_text)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding=DEFAULT_ENCODING))
+        if regressions := Benchmark.compare(report, baseline, args.tolerance):
+            for regression in regressions:
+                logger.error("Regression: %s", regression)
+            return 1
+        logger.info("No regressions against %s", args.baseline)
+    return 0
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Entry point of the benchmark"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+    arguments = get_arguments(args)
+    if arguments.path:
+        return run_benchmark(Path(arguments.path), arguments)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return run_benchmark(Path(tmp_dir), arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,230 @@
+import logging
+import multiprocessing
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, Set, Tuple
+
+from credsweeper import __version__
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import DEFAULT_ENCODING, JOBS_START_METHODS
+from credsweeper.file_handler.files_provider import FilesProvider
+
+logger = logging.getLogger(__name__)
+
+# fixed configurations of CredSweeper for benchmark cases. ML is disabled to measure scanning only
+BENCH_CASES: Dict[str, Dict[str, Any]] = {
+    "plain": {
+        "ml_threshold": 0,
+        "depth": 0
+    },
+    "deep": {
+        "ml_threshold": 0,
+        "depth": 3
+    },
+    "doc": {
+        "ml_threshold": 0,
+        "doc": True
+    },
+}
+
+# metrics which are compared with baseline: greater value is worse
+REGRESSION_METRICS = ["time", "peak_rss"]
+
+# command line arguments of the runs whose time is mostly startup: imports and initialization
+STARTUP_CASES: Dict[str, List[str]] = {
+    "version": ["--version"],
+    "trivial_scan": ["--path", "{path}", "--ml_threshold", "0", "--no-stdout"],
+}
+# a file for trivial scan
+TRIVIAL_SCAN_TEXT = 'password = "Xdj@jcN834b"\n'
+# number of jobs to measure startup of the pool for every start method
+POOL_STARTUP_JOBS = 4
+
+
+def get_peak_rss() -> Optional[int]:
+    """Returns peak resident set size of current process in bytes or None if it is not supported"""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # the value is in kilobytes on Linux and in bytes on macOS
+    return max_rss if "darwin" == sys.platform else 1024 * max_rss
+
+
+def run_case(path: Union[str, Path], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Scans the path with CredSweeper created with kwargs and measures time of every stage of run()"""
+    stages: Dict[str, float] = {}
+    start_time = time.perf_counter()
+    cred_sweeper = CredSweeper(**kwargs)
+    stages["init"] = time.perf_counter() - start_time
+    stage_time = time.perf_counter()
+    content_providers = FilesProvider([path]).get_scannable_files(cred_sweeper.config)
+    stages["discovery"] = time.perf_counter() - stage_time
+    stage_time = time.perf_counter()
+    cred_sweeper.scan(content_providers)
+    stages["scan"] = time.perf_counter() - stage_time
+    stage_time = time.perf_counter()
+    cred_sweeper.post_processing()
+    stages["post_processing"] = time.perf_counter() - stage_time
+    stage_time = time.perf_counter()
+    cred_sweeper.export_results()
+    stages["export"] = time.perf_counter() - stage_time
+    return {
+        "time": time.perf_counter() - start_time,
+        "stages": stages,
+        "providers": len(content_providers),
+        "credentials": cred_sweeper.credential_manager.len_credentials(),
+        "peak_rss": get_peak_rss(),
+    }
+
+
+def run_startup(args: List[str]) -> float:
+    """Runs the command line of CredSweeper in a new process and returns elapsed time in seconds"""
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "credsweeper", *args],
+                   check=True,
+                   stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start_time
+
+
+def run_pool_startup(start_method: str, pool_count: int) -> float:
+    """Starts the pool of jobs like multi-job scan does and returns elapsed time until every job is ready to scan"""
+    cred_sweeper = CredSweeper(ml_threshold=0, pool_count=pool_count, jobs_start_method=start_method)
+    start_time = time.perf_counter()
+    with cred_sweeper.get_pool_context().Pool(processes=pool_count,
+                                              initializer=CredSweeper.pool_initializer,
+                                              initargs=cred_sweeper.get_pool_initargs()) as pool:  # yapf: disable
+        ready_jobs: Set[int] = set()
+        # an empty task is taken by any ready job, so the tasks are sent until all jobs respond
+        while len(ready_jobs) < pool_count:
+            for pid, _, _ in pool.imap_unordered(CredSweeper.pool_files_scan, [[]] * pool_count):
+                ready_jobs.add(pid)
+        elapsed_time = time.perf_counter() - start_time
+    return elapsed_time
+
+
+class Benchmark:
+    """Runs benchmark cases over a corpus and compares results with a baseline"""
+
+    def __init__(self, path: Union[str, Path], corpus_stats: Dict[str, int], repeat: int = 1) -> None:
+        """
+        Args:
+            path: directory with generated corpus
+            corpus_stats: number of files, bytes and lines of the corpus
+            repeat: number of runs of every case - the fastest run is reported
+
+        """
+        self.__path = Path(path)
+        self.__corpus_stats = corpus_stats
+        self.__repeat = max(1, repeat)
+
+    @staticmethod
+    def get_scanned_volume(corpus_stats: Dict[str, int], kwargs: Dict[str, Any]) -> Tuple[int, int]:
+        """Returns number of lines and bytes of the corpus text which is scanned with the configuration
+
+        Text inside archives is scanned only with depth.
+
+        """
+        if kwargs.get("depth"):
+            return (corpus_stats["lines"] + corpus_stats["archived_lines"],
+                    corpus_stats["bytes"] + corpus_stats["archived_bytes"])
+        return corpus_stats["lines"], corpus_stats["bytes"]
+
+    def run(self, cases: Optional[List[str]] = None, startup: bool = True) -> Dict[str, Any]:
+        """Runs the cases and returns machine-readable report
+
+        Every run is performed in a new process to measure peak memory of the case only.
+        Lines/sec and MB/sec are computed for the scan stage.
+
+        """
+        results: Dict[str, Any] = {}
+        for name in cases or list(BENCH_CASES.keys()):
+            repeats: List[Dict[str, Any]] = []
+            for _ in range(self.__repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    repeats.append(executor.submit(run_case, self.__path, BENCH_CASES[name]).result())
+            if repeats:
+                # the fastest run is reported
+                case_result: Dict[str, Any] = min(repeats, key=lambda x: x["time"])
+                scan_time = case_result["stages"]["scan"] or 1e-9
+                lines, size = self.get_scanned_volume(self.__corpus_stats, BENCH_CASES[name])
+                case_result["lines_per_sec"] = lines / scan_time
+                case_result["mb_per_sec"] = size / (1 << 20) / scan_time
+                logger.info("%s: %.2fs %.0f lines/s %.2f MB/s", name, case_result["time"], case_result["lines_per_sec"],
+                            case_result["mb_per_sec"])
+                results[name] = case_result
+        return {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus": self.__corpus_stats,
+            "cases": results,
+            "startup": self.run_startup() if startup else {},
+        }
+
+    def run_startup(self) -> Dict[str, float]:
+        """Measures time of command line runs which are dominated by startup and time of the jobs pool startup.
+
+        The fastest run is reported.
+
+        """
+        results: Dict[str, float] = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "trivial.py"
+            path.write_text(TRIVIAL_SCAN_TEXT, encoding=DEFAULT_ENCODING)
+            for name, args in STARTUP_CASES.items():
+                case_args = [x.format(path=path) for x in args]
+                results[name] = min(run_startup(case_args) for _ in range(self.__repeat))
+                logger.info("startup %s: %.3fs", name, results[name])
+        for start_method in JOBS_START_METHODS:
+            if start_method not in multiprocessing.get_all_start_methods():
+                continue
+            name = f"pool_{start_method}"
+            results[name] = min(run_pool_startup(start_method, POOL_STARTUP_JOBS) for _ in range(self.__repeat))
+            logger.info("startup %s of %s jobs: %.3fs", name, POOL_STARTUP_JOBS, results[name])
+        return results
+
+    @staticmethod
+    def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+        """Compares report with baseline
+
+        Args:
+            report: current benchmark report
+            baseline: stored benchmark report
+            tolerance: allowed relative increase of a metric, e.g. 0.2 for 20%
+
+        Return:
+            list of found regressions, empty when the report is not worse than baseline
+
+        """
+        regressions: List[str] = []
+        if report.get("corpus") != baseline.get("corpus"):
+            regressions.append(f"corpus {report.get('corpus')} differs from baseline {baseline.get('corpus')}")
+            return regressions
+        for name, case_result in report.get("cases", {}).items():
+            if not (base_result := baseline.get("cases", {}).get(name)):
+                continue
+            if case_result["credentials"] != base_result["credentials"]:
+                regressions.append(f"{name}: credentials {case_result['credentials']}"
+                                   f" differ from baseline {base_result['credentials']}")
+            for metric in REGRESSION_METRICS:
+                value = case_result.get(metric)
+                base_value = base_result.get(metric)
+                if value is None or base_value is None:
+                    continue
+                if base_value * (1 + tolerance) < value:
+                    regressions.append(f"{name}: {metric} {value:.6g} is over baseline {base_value:.6g}"
+                                       f" by {100 * (value / base_value - 1):.0f}%")
+        for name, value in report.get("startup", {}).items():
+            base_value = baseline.get("startup", {}).get(name)
+            if base_value is not None and base_value * (1 + tolerance) < value:
+                regressions.append(f"startup {name}: time {value:.6g} is over baseline {base_value:.6g}"
+                                   f" by {100 * (value / base_value - 1):.0f}%")
+        return regressions
@@ -0,0 +1,171 @@
+import base64
+import gzip
+import io
+import random
+import string
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+from credsweeper.common.constants import UTF_8
+
+# fixed timestamp of archive members to get the same bytes for the same seed
+ZIP_DATE_TIME = (2020, 1, 1, 0, 0, 0)
+
+
+class CorpusGenerator:
+    """Generates deterministic corpus of files for benchmark.
+
+    The same seed and scale produce the same files, so results of benchmark runs are comparable. The corpus contains
+    source tree with credentials, long single line minified files, nested zip/tar/gzip archives and base64 data.
+
+    """
+
+    WORDS = [
+        "account", "buffer", "client", "config", "data", "default", "handler", "index", "item", "key", "list",
+        "manager", "message", "name", "object", "path", "request", "response", "result", "service", "session", "status",
+        "token", "user", "value"
+    ]
+
+    def __init__(self, seed: int = 0, scale: int = 1) -> None:
+        """
+        Args:
+            seed: seed of the pseudo random generator
+            scale: multiplier of number and size of generated files
+
+        """
+        self.__random = random.Random(seed)
+        self.__scale = max(1, scale)
+        # text inside archives is scanned only with depth, so it is accounted separately
+        self.stats: Dict[str, int] = {"files": 0, "bytes": 0, "lines": 0, "archived_bytes": 0, "archived_lines": 0}
+
+    def __word(self) -> str:
+        return self.__random.choice(self.WORDS)
+
+    def __identifier(self) -> str:
+        return f"{self.__word()}_{self.__word()}"
+
+    def __secret(self, length: int = 16) -> str:
+        return ''.join(self.__random.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+    def __credential(self) -> str:
+        """Returns a line with fake credential of a random kind"""
+        kind = self.__random.randrange(4)
+        if 0 == kind:
+            return f'{self.__word()}_password = "{self.__secret(12)}"'
+        if 1 == kind:
+            return f'github_token = "ghp_{self.__secret(36)}"'
+        if 2 == kind:
+            aws_id = ''.join(self.__random.choice(string.ascii_uppercase + "234567") for _ in range(16))
+            return f'aws_access_key_id = "AKIA{aws_id}"'
+        return f'api_key: {self.__secret(32)}'
+
+    def __code_line(self) -> str:
+        """Returns a line of source code without credentials"""
+        kind = self.__random.randrange(5)
+        if 0 == kind:
+            return f"def {self.__identifier()}({self.__word()}, {self.__word()}):"
+        if 1 == kind:
+            # the random calls are in the same order as in the f-string
+            identifier, word = self.__identifier(), self.__word()
+            return f"    {identifier} = {word}.get('{self.__word()}', {self.__random.randrange(1000)})"
+        if 2 == kind:
+            return f"    # {' '.join(self.__word() for _ in range(self.__random.randrange(3, 12)))}"
+        if 3 == kind:
+            return f"    return {self.__word()}[{self.__random.randrange(100)}]"
+        return ''
+
+    def get_source(self, lines_count: int) -> str:
+        """Returns source code text with credentials in some lines"""
+        lines: List[str] = []
+        for _ in range(lines_count):
+            if 0 == self.__random.randrange(50):
+                lines.append(self.__credential())
+            else:
+                lines.append(self.__code_line())
+        return '\n'.join(lines) + '\n'
+
+    def get_minified(self, statements_count: int) -> str:
+        """Returns single line javascript-like text"""
+        statements: List[str] = []
+        for _ in range(statements_count):
+            if 0 == self.__random.randrange(500):
+                statements.append(f'var {self.__word()}Token="{self.__secret(40)}"')
+            else:
+                statements.append(f"var {self.__word()}{self.__random.randrange(100)}="
+                                  f"{self.__word()}.{self.__word()}({self.__random.randrange(1000)})")
+        return ';'.join(statements) + '\n'
+
+    def get_base64(self, size: int) -> str:
+        """Returns base64 encoded random data with encoded credentials wrapped by 76 symbols"""
+        data = bytearray(self.__random.randbytes(size))
+        for _ in range(1 + size // 4096):
+            credential = f"\n{self.__credential()}\n".encode(UTF_8)
+            offset = self.__random.randrange(max(1, len(data) - len(credential)))
+            data[offset:offset + len(credential)] = credential
+        text = base64.b64encode(bytes(data)).decode(UTF_8)
+        return '\n'.join(text[x:x + 76] for x in range(0, len(text), 76)) + '\n'
+
+    def __account(self, text: str, archived: bool = False) -> bytes:
+        data = text.encode(UTF_8)
+        prefix = "archived_" if archived else ''
+        self.stats[f"{prefix}bytes"] += len(data)
+        self.stats[f"{prefix}lines"] += text.count('\n')
+        return data
+
+    def __write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.stats["files"] += 1
+
+    @staticmethod
+    def get_tar_gz(members: Dict[str, bytes]) -> bytes:
+        """Returns gzip compressed tar archive with the members"""
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w") as tf:
+            for name, data in members.items():
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = len(data)
+                tar_info.mtime = 0
+                tf.addfile(tar_info, io.BytesIO(data))
+        return gzip.compress(tar_buffer.getvalue(), mtime=0)
+
+    @staticmethod
+    def get_zip(members: Dict[str, bytes]) -> bytes:
+        """Returns zip archive with the members"""
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, data in members.items():
+                zf.writestr(zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME), data)
+        return zip_buffer.getvalue()
+
+    def generate(self, path: Union[str, Path]) -> Dict[str, int]:
+        """Writes the corpus to the directory
+
+        Return:
+            number of files, bytes and lines of generated text, bytes and lines of text in archives
+
+        """
+        root = Path(path)
+        for package in range(4 * self.__scale):
+            for module in range(10):
+                text = self.get_source(self.__random.randrange(50, 500))
+                self.__write(root / "src" / f"package_{package}" / f"module_{module}.py", self.__account(text))
+        for n in range(2 * self.__scale):
+            text = self.get_minified(5000)
+            self.__write(root / "minified" / f"bundle_{n}.min.js", self.__account(text))
+        for n in range(2 * self.__scale):
+            text = self.get_base64(1 << 16)
+            self.__write(root / "data" / f"blob_{n}.b64", self.__account(text))
+        for n in range(self.__scale):
+            inner_members = {
+                f"app/{self.__word()}_{x}.py": self.__account(self.get_source(self.__random.randrange(50, 200)), True)
+                for x in range(10)
+            }
+            outer_members = {
+                "layer.tar.gz": self.get_tar_gz(inner_members),
+                "settings.yaml": self.__account(self.get_source(100), True),
+            }
+            self.__write(root / "archives" / f"nested_{n}.zip", self.get_zip(outer_members))
+        return self.stats
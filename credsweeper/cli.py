@@ -4,7 +4,7 @@ from argparse import BooleanOptionalAction, Namespace, ArgumentParser, ArgumentT
 from typing import Any, Union, List
 
 from credsweeper import __version__
-from credsweeper.common.constants import ML_HUNK, ThresholdPreset, Severity, RuleType
+from credsweeper.common.constants import ML_HUNK, ThresholdPreset, Severity, RuleType, JOBS_START_METHODS
 from credsweeper.logger.logger import Logger
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,15 @@ def positive_int(value: Any) -> int:
     return int_value
 
 
+def positive_float(value: Any) -> float:
+    """Check if number of seconds is not a positive number."""
+    float_value = float(value)
+    if float_value <= 0:
+        logger.error("Number of seconds should be a positive number: %s", value)
+        raise ArgumentTypeError(f"{value} should be greater than 0")
+    return float_value
+
+
 def threshold_or_float_or_zero(arg: str) -> Union[int, float, ThresholdPreset]:
     """Return ThresholdPreset or a float from the input string
 
@@ -94,10 +103,19 @@ def parse_arguments(argv: List[str]) -> Namespace:
                        dest="export_log_config",
                        metavar="PATH")
     group.add_argument("--git", help="git repo to scan", dest="git", metavar="PATH")
+    group.add_argument("--serve",
+                       help="run scan server on local HTTP HOST:PORT or PORT, or on Unix socket PATH",
+                       dest="serve",
+                       metavar="ADDRESS")
     parser.add_argument("--ref",
                         help="scan git repo from the ref, otherwise - all branches were scanned (slow)",
                         dest="ref",
                         type=str)
+    parser.add_argument("--git_index",
+                        help="sqlite file of scanned commits and blobs to scan only new history of git repos",
+                        default=None,
+                        dest="git_index_path",
+                        metavar="PATH")
     parser.add_argument("--rules",
                         help="path of rule config file (default: credsweeper/rules/config.yaml). "
                         f"severity:{[i.value for i in Severity]} "
@@ -143,6 +161,21 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         metavar="POSITIVE_INT")
     parser.add_argument("--no-filters", help="disable filters", dest="no_filters", action="store_false")
     parser.add_argument("--doc", help="document-specific scanning", dest="doc", action="store_true")
+    parser.add_argument("--whole-file",
+                        help="locate lines for pattern rules with single regex pass over whole file (experimental)",
+                        dest="whole_file",
+                        action=BooleanOptionalAction,
+                        default=False)
+    parser.add_argument("--adaptive_filters",
+                        help="reorder filters of every rule by measured cost and rejection rate during the scan",
+                        dest="adaptive_filters",
+                        action="store_true")
+    parser.add_argument("--filter_profile",
+                        help="JSON file with order of filters for every rule; the file is updated with measured"
+                        " statistics after the scan with --adaptive_filters",
+                        default=None,
+                        dest="filter_profile",
+                        metavar="PATH")
     parser.add_argument("--ml_threshold",
                         help="setup threshold for the ml model. "
                         "The lower the threshold - the more credentials will be reported. "
@@ -188,6 +221,10 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         dest="ml_threads_limit",
                         default=None,
                         metavar="POSITIVE_INT")
+    parser.add_argument("--ml_in_jobs",
+                        help="run ML validation in parallel processes during the scan with --jobs",
+                        dest="ml_in_jobs",
+                        action="store_true")
     parser.add_argument("--jobs",
                         "-j",
                         help="number of parallel processes to use (default: 1)",
@@ -195,6 +232,12 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         dest="jobs",
                         default=1,
                         metavar="POSITIVE_INT")
+    parser.add_argument("--jobs_start_method",
+                        help="start method of the parallel processes: forkserver imports the package once and forks"
+                        " the processes from the server where it is supported (default: spawn)",
+                        choices=JOBS_START_METHODS,
+                        dest="jobs_start_method",
+                        default="spawn")
     parser.add_argument("--thrifty",
                         help="clear objects after scan to reduce memory consumption",
                         action=BooleanOptionalAction,
@@ -209,7 +252,7 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         default=False)
     parser.add_argument("--save-json",
                         nargs="?",
-                        help="save result to json file (default: output.json)",
+                        help="save result to json file or to json lines file with .jsonl suffix (default: output.json)",
                         const="output.json",
                         dest="json_filename",
                         metavar="PATH")
@@ -234,6 +277,10 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         dest="sort_output",
                         action=BooleanOptionalAction,
                         default=False)
+    parser.add_argument("--stream",
+                        help="export results by batches during the scan to keep memory usage bounded",
+                        action=BooleanOptionalAction,
+                        default=False)
     parser.add_argument("--log",
                         "-l",
                         help=(f"provide logging level of {list(Logger.LEVELS.keys())}"
@@ -243,9 +290,46 @@ def parse_arguments(argv: List[str]) -> Namespace:
                         metavar="LOG_LEVEL",
                         type=logger_levels)
     parser.add_argument("--size_limit",
-                        help="set size limit of files that for scanning (eg. 1GB / 10MiB / 1000)",
+                        help="skip files over the size (eg. 1GB / 10MiB / 1000); large text files are mapped"
+                        " to memory, so the limit is not required to bound memory of scan without --depth and --doc",
                         dest="size_limit",
                         default=None)
+    parser.add_argument("--parser_timeout",
+                        help="interrupt parsing of a document (pdf, docx, xlsx, html etc.) after the seconds"
+                        " and scan the data as strings instead",
+                        type=positive_int,
+                        dest="parser_timeout",
+                        default=None,
+                        metavar="POSITIVE_INT")
+    parser.add_argument("--pattern_timeout",
+                        help="interrupt a rule which scans a line longer than the seconds and skip the rule"
+                        " after 3 overruns in a process",
+                        type=positive_float,
+                        dest="pattern_timeout",
+                        default=None,
+                        metavar="SECONDS")
+    parser.add_argument("--cache",
+                        help="directory of persistent cache to skip scan of unchanged content",
+                        default=None,
+                        dest="cache_path",
+                        metavar="PATH")
+    parser.add_argument("--cache_size",
+                        help="set size limit of the cache (eg. 1GB / 10MiB / 1000)",
+                        dest="cache_size",
+                        default=None)
+    parser.add_argument("--cache_age",
+                        help="remove cache entries which were not used for the days",
+                        type=positive_int,
+                        dest="cache_age",
+                        default=None,
+                        metavar="POSITIVE_INT")
+    parser.add_argument("--profile",
+                        nargs="?",
+                        help="count calls, hits and time of rules, filters, deep scanners and ML validation;"
+                        " print the table and save the counters to json file (default: profile.json)",
+                        const="profile.json",
+                        dest="profile",
+                        metavar="PATH")
     parser.add_argument("--banner",
                         help="show version and crc32 sum of CredSweeper files at start",
                         action="store_const",
@@ -142,6 +142,10 @@ MAX_LINE_LENGTH = 8000
 CHUNK_SIZE = 4000
 OVERLAP_SIZE = 1000
 CHUNK_STEP_SIZE = CHUNK_SIZE - OVERLAP_SIZE
+# text files which are larger are mapped to memory and lines are decoded on access
+MMAP_SIZE_THRESHOLD = 1 << 24
+# files are hashed by chunks of the size without reading whole data
+DIGEST_CHUNK_SIZE = 1 << 20
 # ML hunk size to limit of variable or value size and get substring near value
 ML_HUNK = 64
 
@@ -160,6 +164,30 @@ AVAILABLE_ENCODINGS = [UTF_8, LATIN_1]
 
 # to limit memory usage in case of recursive scan
 RECURSIVE_SCAN_LIMITATION = 1 << 30
+# decompressed plain text which is larger is scanned by windows of lines instead of whole data to bound memory
+STREAM_SCAN_SIZE = 1 << 24
+# last lines of a window which are scanned again in next window to find multiline credentials on the border
+STREAM_OVERLAP_LINES = 100
+# size of the beginning of streamed data to recognize the format
+STREAM_HEAD_SIZE = 1 << 16
+
+# limits of a task for a job: providers are grouped until the total size or the number is reached
+JOB_TASK_SIZE = 1 << 20
+JOB_TASK_LEN = 64
+# minimal number of tasks per job to balance load between the jobs
+JOB_TASKS_PER_PROCESS = 16
+# maximal number of tasks per job which are sent and whose results are not consumed yet
+JOB_TASKS_IN_FLIGHT = 4
+# archives which are larger are opened in main process and their members are scanned in the jobs
+JOB_CONTAINER_SIZE = 1 << 24
+# start methods of the jobs: the package is imported in every job with spawn and once in the server with forkserver
+JOBS_START_METHODS = ["spawn", "forkserver"]
+# minimal number of candidates which are post processed and exported together in stream mode
+STREAM_BATCH_SIZE = 4096
+# maximal size of a request body of the scan server
+SERVE_REQUEST_SIZE_LIMIT = 1 << 28
+# hosts which the scan server may listen: the server reads any path which is accessible for the process
+SERVE_LOCAL_HOSTS = ["127.0.0.1", "localhost", "::1"]
 
 # default value for config and ValuePatternCheck
 DEFAULT_PATTERN_LEN = 4
@@ -2,6 +2,7 @@ from functools import cached_property
 from typing import Set, List
 
 from credsweeper.app import APP_PATH
+from credsweeper.utils.substring_matcher import SubstringMatcher
 
 
 class KeywordChecklist:
@@ -15,6 +16,7 @@ class KeywordChecklist:
         # used suggested text read style. split() is preferred because it strips 0x0A on end the file
         self.__keyword_list = self.KEYWORD_PATH.read_text().split()
         self.__keyword_list.sort(key=str.__len__, reverse=True)
+        self.__keyword_order = {x: i for i, x in reversed(list(enumerate(self.__keyword_list)))}
         self.__keyword_set = set(self.KEYWORD_PATH.read_text().split())
         # The list of morphemes can be combined to form words.
         # The value is considered a variable if at least two exist.
@@ -50,6 +52,38 @@ class KeywordChecklist:
         """Length of morpheme_set"""
         return len(self.__morpheme_set)
 
+    @cached_property
+    def keyword_matcher(self) -> SubstringMatcher:
+        """Matcher of all keywords which is compiled on first use"""
+        return SubstringMatcher(self.__keyword_set)
+
+    @cached_property
+    def morpheme_matcher(self) -> SubstringMatcher:
+        """Matcher of all morphemes which is compiled on first use"""
+        return SubstringMatcher(self.__morpheme_set)
+
+    def get_keywords(self, line_lower: str) -> List[str]:
+        """Returns all keywords found in the line.
+
+        Args:
+            line_lower: input line - MUST be in lower
+
+        Return:
+            List of the keywords in order of keyword_list
+        """
+        return sorted(self.keyword_matcher.find_all(line_lower), key=self.__keyword_order.__getitem__)
+
+    def get_morphemes(self, line_lower: str) -> Set[str]:
+        """Returns all morphemes found in the line.
+
+        Args:
+            line_lower: input line - MUST be in lower
+
+        Return:
+            Set of the morphemes
+        """
+        return self.morpheme_matcher.find_all(line_lower)
+
     def check_morphemes(self, line_lower: str, threshold: int) -> bool:
         """Checks limit of morphemes limit in line.
 
@@ -60,10 +94,9 @@ class KeywordChecklist:
         Return:
             True - if number of morphemes exceeds the threshold
         """
-        matches = 0
-        for keyword in self.morpheme_set:
-            if keyword in line_lower:
-                matches += 1
-                if threshold < matches:
-                    return True
+        morphemes: Set[str] = set()
+        for _pos, morpheme in self.morpheme_matcher.find_iter(line_lower):
+            morphemes.add(morpheme)
+            if threshold < len(morphemes):
+                return True
         return False
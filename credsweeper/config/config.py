@@ -38,7 +38,10 @@ class Config:
         self.pedantic: bool = bool(config["pedantic"])
         self.depth: int = int(config["depth"])
         self.doc: bool = config["doc"]
+        self.whole_file: bool = bool(config.get("whole_file", False))
         self.severity: Severity = Severity.get(config.get("severity"))
+        self.parser_timeout: Optional[int] = config.get("parser_timeout")
+        self.pattern_timeout: Optional[float] = config.get("pattern_timeout")
 
         self.max_url_cred_value_length: int = int(config["max_url_cred_value_length"])
         self.max_password_value_length: int = int(config["max_password_value_length"])
@@ -1,7 +1,8 @@
 import copy
 import re
+import sys
 from json.encoder import py_encode_basestring_ascii
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from credsweeper.common.constants import Severity, Confidence
 from credsweeper.config.config import Config
@@ -25,6 +26,10 @@ class Candidate:
 
     DUMMY_PATTERN = re.compile(r"^")
 
+    # slots reduce memory usage for numerous objects and define compact pickle state
+    __slots__ = ("line_data_list", "patterns", "rule_name", "severity", "config", "use_ml", "confidence",
+                 "ml_probability")
+
     def __init__(self,
                  line_data_list: List[LineData],
                  patterns: List[re.Pattern],
@@ -44,6 +49,16 @@ class Candidate:
         # Note: -1.0 is possible too for some activation functions in ml model, so let avoid negative values
         self.ml_probability: Optional[float] = None
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Values of the slots in their order are the state"""
+        return tuple(getattr(self, x) for x in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restores the slots, the rule name is interned to be shared between candidates"""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        self.rule_name = sys.intern(self.rule_name)
+
     def compare(self, other: 'Candidate') -> bool:
         """Comparison method - checks only result of final cred"""
         if self.rule_name == other.rule_name \
@@ -0,0 +1,119 @@
+import io
+import pickle
+import re
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+from credsweeper.config.config import Config
+from credsweeper.credentials.candidate import Candidate
+
+# persistent id of current config in pickled candidates
+CONFIG_PERSISTENT_ID = "config"
+# persistent id prefixes of rule patterns list and a pattern from the list
+PATTERNS_PERSISTENT_ID = "patterns"
+PATTERN_PERSISTENT_ID = "pattern"
+
+# globals which are pickled with candidates - others are rejected because cache entries may be modified by others
+ALLOWED_GLOBALS = frozenset([
+    ("credsweeper.common.constants", "Confidence"),
+    ("credsweeper.common.constants", "Severity"),
+    ("credsweeper.credentials.candidate", "Candidate"),
+    ("credsweeper.credentials.line_data", "LineData"),
+    # patterns which are not in the rules lists
+    ("re", "_compile"),
+    # ML probability
+    ("numpy", "dtype"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "scalar"),
+])
+
+PersistentId = Union[str, Tuple[str, int], Tuple[str, int, int]]
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler which stores shared objects as references"""
+
+    def __init__(self, file: BinaryIO, persistent_ids: Dict[int, PersistentId]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__persistent_ids = persistent_ids
+
+    def persistent_id(self, obj: Any) -> Optional[PersistentId]:
+        """config, rule patterns lists and patterns are not stored"""
+        return self.__persistent_ids.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler which restores current objects for the references and allows only classes of candidates"""
+
+    def __init__(self, file: BinaryIO, persistent_objects: Dict[PersistentId, Any]) -> None:
+        super().__init__(file)
+        self.__persistent_objects = persistent_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        """returns current object for the reference"""
+        if (obj := self.__persistent_objects.get(pid)) is not None:
+            return obj
+        raise pickle.UnpicklingError(f"Unsupported persistent id {pid}")
+
+    def find_class(self, module: str, name: str) -> Any:
+        """prevents code execution with crafted data"""
+        if (module, name) in ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Forbidden global {module}.{name}")
+
+
+class CandidatesSerializer:
+    """Compact serialization of candidates for job results and cache entries.
+
+    Config, lists of rule patterns and the patterns are the same for all candidates of a process, so they are stored
+    as short references and restored with the objects of current process. Candidates and line data are pickled with
+    tuples of slots values.
+
+    """
+
+    def __init__(self, config: Config, pattern_lists: Optional[Sequence[List[re.Pattern]]] = None) -> None:
+        """
+        Args:
+            config: current config
+            pattern_lists: lists of patterns of the rules in the same order for all processes
+
+        """
+        self.__config = config
+        self.__pattern_lists: List[List[re.Pattern]] = list(pattern_lists) if pattern_lists else []
+        self.__init_ids()
+
+    def __init_ids(self) -> None:
+        """Builds references of the objects. Id of an object is valid only in the process"""
+        self.__persistent_objects: Dict[PersistentId, Any] = {CONFIG_PERSISTENT_ID: self.__config}
+        for i, patterns in enumerate(self.__pattern_lists):
+            self.__persistent_objects[(PATTERNS_PERSISTENT_ID, i)] = patterns
+            for j, pattern in enumerate(patterns):
+                # the same pattern may be in several lists, the first reference is used
+                self.__persistent_objects.setdefault((PATTERN_PERSISTENT_ID, i, j), pattern)
+        self.__persistent_ids: Dict[int, PersistentId] = {}
+        for pid, obj in self.__persistent_objects.items():
+            self.__persistent_ids.setdefault(id(obj), pid)
+
+    def __getstate__(self) -> Tuple[Config, List[List[re.Pattern]]]:
+        """The references are rebuilt after unpickling because ids of objects differ in another process"""
+        return self.__config, self.__pattern_lists
+
+    def __setstate__(self, state: Tuple[Config, List[List[re.Pattern]]]) -> None:
+        self.__config, self.__pattern_lists = state
+        self.__init_ids()
+
+    def dumps(self, candidates: List[Candidate]) -> bytes:
+        """Returns serialized candidates"""
+        buffer = io.BytesIO()
+        _Pickler(buffer, self.__persistent_ids).dump(candidates)
+        return buffer.getvalue()
+
+    def loads(self, data: bytes) -> List[Candidate]:
+        """Returns candidates from serialized data"""
+        return self.load(io.BytesIO(data))
+
+    def load(self, file: BinaryIO) -> List[Candidate]:
+        """Reads candidates from the file"""
+        candidates = _Unpickler(file, self.__persistent_objects).load()
+        if not isinstance(candidates, list):
+            raise pickle.UnpicklingError(f"Unexpected type {type(candidates).__name__} of candidates")
+        return candidates
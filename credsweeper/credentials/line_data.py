@@ -2,17 +2,19 @@ import contextlib
 import hashlib
 import re
 import string
-from functools import cached_property
+import sys
 from typing import Any, Dict, Optional, Tuple
 
 from colorama import Fore, Style
 
 from credsweeper.common.constants import MAX_LINE_LENGTH, UTF_8, StartEnd, ML_HUNK
 from credsweeper.config.config import Config
+from credsweeper.credentials.value_analytics import ValueAnalytics
 from credsweeper.utils.util import Util
 
 
-class LineData:
+# the positions and parts of a line are flat slots to avoid an extra object for numerous candidates
+class LineData:  # pylint: disable=too-many-instance-attributes
     """Object to treat and store scanned line related data.
 
     Parameters:
@@ -48,6 +50,16 @@ class LineData:
     INITIAL_WRONG_POSITION = -3
     EXCEPTION_POSITION = -2
 
+    # slots reduce memory usage for numerous objects and define compact pickle state
+    __slots__ = ("config", "line", "line_pos", "line_num", "path", "file_type", "info", "pattern", "value_start",
+                 "value_end", "key", "separator", "separator_start", "separator_end", "value", "variable",
+                 "variable_start", "variable_end", "value_leftquote", "value_rightquote", "url_part", "wrap",
+                 "_3d_escaped_separator", "_is_well_quoted_value", "_is_quoted", "_value_analytics")
+    # the analytics are calculated again on demand, so they are not a part of the state
+    _STATE_SLOTS = __slots__[:-1]
+    # the strings are common for many objects from a file
+    _INTERNED_SLOTS = ("path", "file_type", "info")
+
     def __init__(
             self,  #
             config: Config,  #
@@ -86,10 +98,33 @@ class LineData:
         self.url_part = False
         self.wrap = None
         self._3d_escaped_separator = False
+        self._is_well_quoted_value: Optional[bool] = None
+        self._is_quoted: Optional[bool] = None
+        self._value_analytics: Optional[ValueAnalytics] = None
         self.initialize(match_obj)
         # the line is very useful for debug breakpoint
         pass  # pylint: disable=W0107
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Values of the slots in their order are the state"""
+        return tuple(getattr(self, x) for x in self._STATE_SLOTS)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restores the slots and interns strings to share them between objects from different tasks"""
+        for name, value in zip(self._STATE_SLOTS, state):
+            if name in self._INTERNED_SLOTS and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+        self._value_analytics = None
+
+    @property
+    def value_analytics(self) -> ValueAnalytics:
+        """Memoized analytics of current value. The value must not be None"""
+        if self._value_analytics is None or self._value_analytics.value is not self.value:
+            assert self.value is not None
+            self._value_analytics = ValueAnalytics(self.value)
+        return self._value_analytics
+
     def compare(self, other: 'LineData') -> bool:
         """Comparison method - skip whole line and checks only when variable and value are the same"""
         if self.path == other.path \
@@ -275,9 +310,15 @@ class LineData:
                 return True
         return False
 
-    @cached_property
+    @property
     def is_well_quoted_value(self) -> bool:
-        """Well quoted value - means the value has been quoted or has line wrap"""
+        """Well quoted value - means the value has been quoted or has line wrap. The result is calculated once"""
+        if self._is_well_quoted_value is None:
+            self._is_well_quoted_value = self._get_well_quoted_value()
+        return self._is_well_quoted_value
+
+    def _get_well_quoted_value(self) -> bool:
+        """Calculates whether the value is well quoted"""
         result = False
         if self.value_leftquote and self.value_rightquote:
             if self.value_leftquote == self.value_rightquote:
@@ -317,14 +358,20 @@ class LineData:
 
         return result
 
-    @cached_property
+    @property
     def is_quoted(self) -> bool:
-        """Check if variable and value in a quoted string.
+        """Check if variable and value in a quoted string. The result is calculated once
 
         Return:
             True if candidate in a quoted string, False otherwise
 
         """
+        if self._is_quoted is None:
+            self._is_quoted = self._get_quoted()
+        return self._is_quoted
+
+    def _get_quoted(self) -> bool:
+        """Calculates whether variable and value are in a quoted string"""
         left_quote = None
         if 0 < self.variable_start:
             for i in self.line[:self.variable_start]:
@@ -424,7 +471,7 @@ class LineData:
         cut_pos = StartEnd(self.variable_start if 0 <= self.variable_start else self.value_start,
                            self.value_end) if subtext else None
         if isinstance(self.value, str):
-            entropy = round(Util.get_shannon_entropy(self.value), 5)
+            entropy = round(self.value_analytics.entropy, 5)
         else:
             entropy = None
         full_output = {
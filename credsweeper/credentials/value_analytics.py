@@ -0,0 +1,78 @@
+from types import EllipsisType
+from typing import Optional, Set, Tuple, Union
+
+from credsweeper.common import static_keyword_checklist
+from credsweeper.utils.hop_stat import HopStat
+from credsweeper.utils.util import Util
+
+
+class ValueAnalytics:
+    """Properties of a candidate value which are calculated on demand once for filters, ML features and report.
+
+    LineData keeps the object for current value only, so the properties of a changed value are calculated again.
+
+    """
+
+    # the distances are precalculated, so one instance serves all values
+    HOP_STAT = HopStat()
+
+    __slots__ = ("__value", "__lower", "__entropy", "__base64_decoded", "__morphemes", "__hop_stat")
+
+    def __init__(self, value: str) -> None:
+        self.__value = value
+        self.__lower: Optional[str] = None
+        self.__entropy: Optional[float] = None
+        # Ellipsis marks the properties which were not calculated yet, because None is a valid result
+        self.__base64_decoded: Union[None, bytes, EllipsisType] = ...
+        self.__morphemes: Optional[Set[str]] = None
+        self.__hop_stat: Union[None, Tuple[float, float], EllipsisType] = ...
+
+    @property
+    def value(self) -> str:
+        """The analysed value"""
+        return self.__value
+
+    @property
+    def lower(self) -> str:
+        """Lowercase value"""
+        if self.__lower is None:
+            self.__lower = self.__value.lower()
+        return self.__lower
+
+    @property
+    def entropy(self) -> float:
+        """Shannon entropy of the value"""
+        if self.__entropy is None:
+            self.__entropy = Util.get_shannon_entropy(self.__value)
+        return self.__entropy
+
+    @property
+    def base64_decoded(self) -> Optional[bytes]:
+        """Data decoded from standard or urlsafe base64 with or without padding, None if the value is not base64"""
+        if isinstance(self.__base64_decoded, EllipsisType):
+            try:
+                self.__base64_decoded = Util.decode_base64(self.__value, padding_safe=True, urlsafe_detect=True)
+            except Exception:
+                self.__base64_decoded = None
+        return self.__base64_decoded
+
+    @property
+    def morphemes(self) -> Set[str]:
+        """Morphemes found in lowercase value"""
+        if self.__morphemes is None:
+            self.__morphemes = static_keyword_checklist.get_morphemes(self.lower)
+        return self.__morphemes
+
+    def check_morphemes(self, threshold: int) -> bool:
+        """Returns True if number of morphemes exceeds the threshold like KeywordChecklist.check_morphemes"""
+        return threshold < len(self.morphemes)
+
+    @property
+    def hop_stat(self) -> Optional[Tuple[float, float]]:
+        """Average and deviation of distances between symbols on keyboard, None if it cannot be calculated"""
+        if isinstance(self.__hop_stat, EllipsisType):
+            try:
+                self.__hop_stat = ValueAnalytics.HOP_STAT.stat(self.__value)
+            except Exception:
+                self.__hop_stat = None
+        return self.__hop_stat
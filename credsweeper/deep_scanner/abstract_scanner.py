@@ -1,17 +1,14 @@
 import contextlib
 import datetime
-import io
 import logging
+import time
 from abc import abstractmethod, ABC
-from bz2 import BZ2File
 from collections.abc import Sized
-from gzip import GzipFile
-from lzma import LZMAFile
 from types import CodeType, EllipsisType
-from typing import List, Optional, Tuple, Any, Generator, Union
+from typing import List, Optional, Tuple, Any, Generator, Iterable, IO
 
 from credsweeper.common.constants import RECURSIVE_SCAN_LIMITATION, MIN_DATA_LEN, DEFAULT_ENCODING, UTF_8, \
-    MIN_VALUE_LENGTH
+    MIN_VALUE_LENGTH, STREAM_SCAN_SIZE, STREAM_OVERLAP_LINES, STREAM_HEAD_SIZE
 from credsweeper.config.config import Config
 from credsweeper.credentials.augment_candidates import augment_candidates
 from credsweeper.credentials.candidate import Candidate
@@ -25,6 +22,8 @@ from credsweeper.file_handler.string_content_provider import StringContentProvid
 from credsweeper.file_handler.struct_content_provider import StructContentProvider
 from credsweeper.file_handler.text_content_provider import TextContentProvider
 from credsweeper.scanner.scanner import Scanner
+from credsweeper.utils.profiler import Profiler
+from credsweeper.utils.time_limit import TimeLimit
 from credsweeper.utils.util import Util
 
 logger = logging.getLogger(__name__)
@@ -33,6 +32,9 @@ logger = logging.getLogger(__name__)
 class AbstractScanner(ABC):
     """Base abstract class for all recursive scanners"""
 
+    # document parsers which may run too long with pathological data are limited with parser_timeout of the config
+    SLOW_PARSER = False
+
     @property
     @abstractmethod
     def config(self) -> Config:
@@ -66,6 +68,12 @@ class AbstractScanner(ABC):
         """Returns possibly scan methods for the data depends on content and fallback scanners"""
         raise NotImplementedError(__name__)
 
+    @staticmethod
+    @abstractmethod
+    def is_plain_text(data: bytes, descriptor: Descriptor, depth: int) -> bool:
+        """Returns True when the data looks like a text which is scanned only as lines at the depth"""
+        raise NotImplementedError(__name__)
+
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     def recursive_scan(
@@ -115,6 +123,144 @@ class AbstractScanner(ABC):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def stream_scan(
+            self,  #
+            file: IO[bytes],  #
+            size: Optional[int],  #
+            file_path: str,  #
+            file_type: str,  #
+            info: str,  #
+            depth: int,  #
+            recursive_limit_size: int,  #
+            size_label: str = "") -> List[Candidate]:
+        """Scans data of a decompressed file or an archive member like recursive_scan of the whole data does.
+
+            Plain text over STREAM_SCAN_SIZE is scanned by windows of lines, so only a window is resident in memory.
+            Other data are read fully and scanned recursively. The data are read from the file only once.
+
+            Args:
+                file: file object opened at the beginning of the data
+                size: size of the data or None when the size is known only after reading of decompressed data
+                file_path: path of the file for candidates
+                file_type: extension of the data
+                info: info of the data
+                depth: maximal level of recursion
+                recursive_limit_size: maximal bytes of opened files to prevent recursive zip-bomb attack
+                size_label: label to add the size of the data to the info, e.g. GZIP
+
+            Returns: list with candidates
+
+            Raises:
+                LimitError: when the data of unknown size exceeds recursive_limit_size
+
+        """
+        data = b''
+        if size is None:
+            data = AbstractScanner.read_with_limit(file, recursive_limit_size, STREAM_SCAN_SIZE + 1)
+            if STREAM_SCAN_SIZE >= len(data):
+                # the whole data is read already
+                size = len(data)
+        if (size is None or (STREAM_SCAN_SIZE < size and MIN_DATA_LEN <= recursive_limit_size - size)) \
+                and 0 <= depth and not FilePathExtractor.is_find_by_ext_file(self.config, file_type):
+            if STREAM_HEAD_SIZE > len(data):
+                data += file.read(STREAM_HEAD_SIZE - len(data))
+            # recursive_scan would choose the scanners for the decremented depth
+            if self.is_plain_text(data[:STREAM_HEAD_SIZE], Descriptor(file_path, file_type, info), depth - 1):
+                logger.debug("Stream scan: size=%s, path=%s, info=%s", size, file_path, info)
+                return self.__text_windows_scan(data, file, file_path, file_type, info, size_label,
+                                                recursive_limit_size - MIN_DATA_LEN)
+        if size is None:
+            data += AbstractScanner.read_with_limit(file, recursive_limit_size - len(data))
+            size = len(data)
+        else:
+            data += file.read(size - len(data))
+        data_provider = DataContentProvider(data=data,
+                                            file_path=file_path,
+                                            file_type=file_type,
+                                            info=f"{info}|{size_label}:{size}" if size_label else info)
+        return self.recursive_scan(data_provider, depth, recursive_limit_size)
+
+    @staticmethod
+    def __count_lines(data: bytes) -> int:
+        """Returns number of line ends in the data like Util.split_text does"""
+        return data.count(b'\n') + data.count(b'\r') - data.count(b"\r\n")
+
+    def __text_windows_scan(self, head: bytes, file: IO[bytes], file_path: str, file_type: str, info: str,
+                            size_label: str, limit: int) -> List[Candidate]:
+        """Scans the text by windows of lines like ByteScanner does for the whole text.
+
+            Last STREAM_OVERLAP_LINES lines of a window are scanned again at the beginning of next window, so a
+            multiline credential on the border is found. Candidates from the overlap are taken from next window only.
+            The size for size_label is known at the end of the text, so the info of candidates is updated after scan.
+
+        """
+        candidates: List[Candidate] = []
+        buffer = head
+        size = len(head)
+        # number of lines before the window
+        offset = 0
+        eof = False
+        while not eof:
+            chunk = file.read(STREAM_SCAN_SIZE)
+            eof = STREAM_SCAN_SIZE > len(chunk)
+            size += len(chunk)
+            AbstractScanner.check_limit(size, limit)
+            window = buffer + chunk
+            cut = window.rfind(b'\n') + 1
+            whole = eof or 0 == cut
+            if whole:
+                # the last window or a part of a long line without line end is scanned as is
+                cut = overlap_start = len(window)
+            else:
+                overlap_start = cut
+                for _ in range(STREAM_OVERLAP_LINES):
+                    line_start = window.rfind(b'\n', 0, overlap_start - 1) + 1
+                    if 0 == line_start or STREAM_SCAN_SIZE < 2 * (cut - line_start):
+                        break
+                    overlap_start = line_start
+            window_lines = AbstractScanner.__count_lines(window[:overlap_start])
+            byte_content_provider = ByteContentProvider(content=window[:cut],
+                                                        file_path=file_path,
+                                                        file_type=file_type,
+                                                        info=f"{info}|RAW")
+            for candidate in self.scanner.scan(byte_content_provider):
+                if whole or candidate.line_data_list[0].line_num <= window_lines:
+                    for line_data in candidate.line_data_list:
+                        line_data.line_num += offset
+                        line_data.line_pos += offset
+                    candidates.append(candidate)
+            offset += window_lines
+            buffer = window[overlap_start:]
+        if size_label:
+            for candidate in candidates:
+                for line_data in candidate.line_data_list:
+                    line_data.info = f"{info}|{size_label}:{size}|RAW"
+        return candidates
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def members_scan(
+            self,  #
+            members: Iterable[DataContentProvider],  #
+            depth: int,  #
+            recursive_limit_size: int) -> List[Candidate]:
+        """Scans members of a container with recursive scan and merges the candidates in order of the members.
+
+            Args:
+                members: DataContentProvider objects of the container members
+                depth: maximal level of recursion
+                recursive_limit_size: maximal bytes of opened files to prevent recursive zip-bomb attack
+
+            Returns: list with candidates of all members
+
+        """
+        candidates: List[Candidate] = []
+        for member in members:
+            candidates.extend(self.recursive_scan(member, depth, recursive_limit_size))
+        return candidates
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     @staticmethod
     def key_value_combination(structure: dict) -> Generator[Tuple[Any, Any], None, None]:
         """Combine items by `key` and `value` from a dictionary for augmentation
@@ -290,8 +436,15 @@ class AbstractScanner(ABC):
         deep_scanners, fallback_scanners = self.get_deep_scanners(data_provider.data, data_provider.descriptor, depth,
                                                                   recursive_limit_size)
         fallback = True
+        profiling = Profiler.enabled
+        start_time = 0.0
         for scan_class in deep_scanners:
-            new_candidates = scan_class.data_scan(self, data_provider, depth, recursive_limit_size)
+            if profiling:
+                start_time = time.perf_counter()
+            new_candidates = self.__limited_data_scan(scan_class, data_provider, depth, recursive_limit_size)
+            if profiling:
+                Profiler.add("deep_scanner", scan_class.__name__,
+                             time.perf_counter() - start_time, new_candidates is not None)
             if new_candidates is None:
                 # scanner did not recognise the content type
                 continue
@@ -300,7 +453,12 @@ class AbstractScanner(ABC):
             fallback = False
         if fallback:
             for scan_class in fallback_scanners:
+                if profiling:
+                    start_time = time.perf_counter()
                 fallback_candidates = scan_class.data_scan(self, data_provider, depth, recursive_limit_size)
+                if profiling:
+                    Profiler.add("deep_scanner", scan_class.__name__,
+                                 time.perf_counter() - start_time, fallback_candidates is not None)
                 if fallback_candidates is None:
                     continue
                 augment_candidates(candidates, fallback_candidates)
@@ -308,6 +466,30 @@ class AbstractScanner(ABC):
                 break
         return candidates
 
+    def __limited_data_scan(self, scan_class: Any, data_provider: DataContentProvider, depth: int,
+                            recursive_limit_size: int) -> Optional[List[Candidate]]:
+        """Launches data_scan of the scanner class with parser_timeout for slow document parsers
+
+            Returns: candidates or None when the content is not recognised or the time is over
+
+        """
+        candidates: Optional[List[Candidate]] = None
+        if not scan_class.SLOW_PARSER or not self.config.parser_timeout:
+            candidates = scan_class.data_scan(self, data_provider, depth, recursive_limit_size)
+            return candidates
+        time_limit = TimeLimit(self.config.parser_timeout)
+        try:
+            with time_limit:
+                candidates = scan_class.data_scan(self, data_provider, depth, recursive_limit_size)
+                return candidates
+        except TimeLimit.Expired as exc:
+            if exc.args[0] is not time_limit:
+                # the time of an outer parser is over
+                raise
+            logger.warning("%s: %s was interrupted after %s seconds", data_provider.descriptor, scan_class.__name__,
+                           self.config.parser_timeout)
+        return None
+
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     def scan(self,
@@ -354,10 +536,25 @@ class AbstractScanner(ABC):
         """Decompressed data exceeds configured limit"""
 
     @staticmethod
-    def read_compressed_with_limit(file: Union[LZMAFile, GzipFile, BZ2File], limit: int) -> bytes:
-        """Reads data with check limit for single compressed file"""
-        size = file.seek(0, io.SEEK_END)
+    def check_limit(size: int, limit: int) -> None:
+        """Raises LimitError when size of decompressed data exceeds the limit"""
         if limit < size:
             raise AbstractScanner.LimitError(f"Recursive size limit reached {limit} < {size}")
-        file.seek(0, io.SEEK_SET)
-        return file.read(size=limit)
+
+    @staticmethod
+    def read_with_limit(file: IO[bytes], limit: int, size: Optional[int] = None) -> bytes:
+        """Reads decompressed data with check limit for single compressed file without decompression in advance.
+
+            Args:
+                file: file object of decompressed data
+                limit: maximal size of the data
+                size: maximal size to read, the rest of the file by default
+
+            Raises:
+                LimitError: when the data exceeds the limit
+
+        """
+        # the limit may be exhausted, so negative size must not read the whole file
+        data = file.read(max(0, limit + 1 if size is None else min(size, limit + 1)))
+        AbstractScanner.check_limit(len(data), limit)
+        return data
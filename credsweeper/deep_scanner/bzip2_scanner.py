@@ -38,13 +38,8 @@ class Bzip2Scanner(AbstractScanner, ABC):
             else:
                 file_type = data_provider.file_type
             with bz2.open(io.BytesIO(data_provider.data), "rb") as f:
-                data = AbstractScanner.read_compressed_with_limit(f, recursive_limit_size)
-                bzip2_content_provider = DataContentProvider(data=data,
-                                                             file_path=data_provider.file_path,
-                                                             file_type=file_type,
-                                                             info=f"{data_provider.info}|BZIP2:{len(data)}")
-                bzip2_candidates = self.recursive_scan(bzip2_content_provider, depth, recursive_limit_size)
-                return bzip2_candidates
+                return self.stream_scan(f, None, data_provider.file_path, file_type, data_provider.info, depth,
+                                        recursive_limit_size, "BZIP2")
         except AbstractScanner.LimitError as bzip2_limit_exc:
             logger.warning("%s %s", data_provider.descriptor, bzip2_limit_exc)
             return []
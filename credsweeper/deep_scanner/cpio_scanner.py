@@ -142,15 +142,12 @@ class CpioScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts data file from .ar (cpioian) archive and launches data_scan"""
         try:
-            candidates: List[Candidate] = []
-            for data_start, name, data in CpioScanner.walk_cpio(data_provider.data, recursive_limit_size):
-                cpio_content_provider = DataContentProvider(data=data,
-                                                            file_path=data_provider.file_path,
-                                                            file_type=Util.get_type(name),
-                                                            info=f"{data_provider.info}|CPIO:0x{data_start:x}:{name}")
-                cpio_candidates = self.recursive_scan(cpio_content_provider, depth, recursive_limit_size)
-                candidates.extend(cpio_candidates)
-            return candidates
+            members = (DataContentProvider(data=data,
+                                           file_path=data_provider.file_path,
+                                           file_type=Util.get_type(name),
+                                           info=f"{data_provider.info}|CPIO:0x{data_start:x}:{name}")
+                       for data_start, name, data in CpioScanner.walk_cpio(data_provider.data, recursive_limit_size))
+            return self.members_scan(members, depth, recursive_limit_size)
         except Exception as exc:
             logger.warning(exc)
         return None
@@ -47,15 +47,12 @@ class DebScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts data file from .ar (debian) archive and launches data_scan"""
         try:
-            candidates: List[Candidate] = []
-            for offset, name, data in DebScanner.walk_deb(data_provider.data):
-                deb_content_provider = DataContentProvider(data=data,
-                                                           file_path=data_provider.file_path,
-                                                           file_type=Util.get_type(name),
-                                                           info=f"{data_provider.info}|DEB:0x{offset:x}:{name}")
-                deb_candidates = self.recursive_scan(deb_content_provider, depth, recursive_limit_size)
-                candidates.extend(deb_candidates)
-            return candidates
+            members = (DataContentProvider(data=data,
+                                           file_path=data_provider.file_path,
+                                           file_type=Util.get_type(name),
+                                           info=f"{data_provider.info}|DEB:0x{offset:x}:{name}")
+                       for offset, name, data in DebScanner.walk_deb(data_provider.data))
+            return self.members_scan(members, depth, recursive_limit_size)
         except Exception as exc:
             logger.warning(exc)
         return None
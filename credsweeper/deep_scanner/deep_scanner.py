@@ -1,9 +1,13 @@
+import io
 import logging
 import re
-from typing import List, Any, Tuple, Union, Dict
+import tarfile
+from typing import List, Any, Tuple, Union, Dict, Optional, Sequence
+from zipfile import ZipFile
 
-from credsweeper.common.constants import MIN_DATA_LEN
+from credsweeper.common.constants import MIN_DATA_LEN, RECURSIVE_SCAN_LIMITATION
 from credsweeper.config.config import Config
+from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.byte_scanner import ByteScanner
 from credsweeper.deep_scanner.bzip2_scanner import Bzip2Scanner
 from credsweeper.deep_scanner.cpio_scanner import CpioScanner
@@ -48,6 +52,7 @@ from credsweeper.deep_scanner.xml_scanner import XmlScanner
 from credsweeper.deep_scanner.zip_scanner import ZipScanner
 from credsweeper.deep_scanner.zlib_scanner import ZlibScanner
 from credsweeper.deep_scanner.zstd_scanner import ZstdScanner
+from credsweeper.file_handler.content_provider import ContentProvider
 from credsweeper.file_handler.descriptor import Descriptor
 from credsweeper.scanner.scanner import Scanner
 from credsweeper.utils.util import Util
@@ -119,6 +124,85 @@ class DeepScanner(
     def scanner(self) -> Scanner:
         return self.__scanner
 
+    def get_container_members(
+            self,  #
+            content_provider: ContentProvider,  #
+            depth: int,  #
+            recursive_limit_size: Optional[int] = None) -> Optional[Tuple[int, List[Tuple[int, int]]]]:
+        """Lists members of a file which is plain zip or tar archive to scan them apart.
+
+            Args:
+                content_provider: provider of the file
+                depth: maximal level of recursion like in `scan`
+                recursive_limit_size: maximal bytes of opened files like in `scan`
+
+            Returns: recursive limit for the members and positions with sizes of the members which `scan` would
+             scan with recursive scan, or None when the file is scanned in another way
+
+        """
+        data = content_provider.data
+        if not data:
+            return None
+        if not isinstance(recursive_limit_size, int):
+            recursive_limit_size = RECURSIVE_SCAN_LIMITATION
+        recursive_limit_size -= len(data)
+        descriptor = Descriptor(content_provider.file_path, Util.get_type(content_provider.file_path),
+                                content_provider.info or f"FILE:{content_provider.file_path}")
+        deep_scanners, _ = self.get_deep_scanners(data, descriptor, depth, recursive_limit_size)
+        try:
+            if [ZipScanner] == deep_scanners:
+                with ZipFile(io.BytesIO(data)) as zf:
+                    members = [(n, x.file_size) for n, x in self.get_zip_members(zf, depth, recursive_limit_size)]
+            elif [TarScanner] == deep_scanners:
+                with tarfile.TarFile(fileobj=io.BytesIO(data)) as tf:
+                    members = [(n, x.size) for n, x in self.get_tar_members(tf, depth, recursive_limit_size)]
+            else:
+                return None
+        except Exception as exc:
+            # broken archive is processed with fallback scanners
+            logger.debug("%s:%s", content_provider.file_path, exc)
+            return None
+        return recursive_limit_size, members
+
+    def container_members_scan(
+            self,  #
+            content_provider: ContentProvider,  #
+            positions: Sequence[int],  #
+            depth: int,  #
+            recursive_limit_size: int) -> List[Candidate]:
+        """Opens the archive file and scans the members from `get_container_members` like `scan` does.
+
+            An exception means that `scan` of the whole file would use fallback scanners instead.
+
+            Args:
+                content_provider: provider of the file
+                positions: positions of the members in the archive
+                depth: maximal level of recursion like in `scan`
+                recursive_limit_size: the limit for the members from `get_container_members`
+
+            Returns: candidates of the members in their order
+
+        """
+        candidates: List[Candidate] = []
+        file_path = content_provider.file_path
+        info = content_provider.info or f"FILE:{file_path}"
+        with open(file_path, "rb") as f:
+            head = f.read(512)
+            f.seek(0)
+            if ZipScanner.match(head):
+                with ZipFile(f) as zf:
+                    zip_infos = zf.infolist()
+                    for position in positions:
+                        candidates.extend(
+                            self.zip_member_scan(zf, zip_infos[position], file_path, info, depth, recursive_limit_size))
+            else:
+                with tarfile.TarFile(fileobj=f) as tf:
+                    tar_infos = tf.getmembers()
+                    for position in positions:
+                        candidates.extend(
+                            self.tar_member_scan(tf, tar_infos[position], file_path, info, depth, recursive_limit_size))
+        return candidates
+
     # manually crafted dict to detect a media format with first byte, prefix and optionally pattern
     MEDIA_PATTERNS: Dict[int, List[Tuple[bytes, re.Pattern]]] = {
         0x00: [
@@ -356,6 +440,7 @@ class DeepScanner(
             pass
         elif PdfScanner.match(data):
             deep_scanners.append(PdfScanner)
+            fallback_scanners.append(StringsScanner)
         elif PngScanner.match(data):
             deep_scanners.append(PngScanner)
         elif JclassScanner.match(data):
@@ -371,6 +456,7 @@ class DeepScanner(
             deep_scanners.append(PkcsScanner)
         elif XlsScanner.match(data):
             deep_scanners.append(PandasScanner)
+            fallback_scanners.append(StringsScanner)
         elif CrxScanner.match(data):
             if 0 < depth:
                 deep_scanners.append(CrxScanner)
@@ -442,21 +528,7 @@ class DeepScanner(
             deep_scanners.append(CpioScanner)
             fallback_scanners.append(StringsScanner)
         elif XmlScanner.match(data):
-            if HtmlScanner.match(data):
-                deep_scanners.append(HtmlScanner)
-                deep_scanners.append(XmlScanner)
-                fallback_scanners.append(ByteScanner)
-            elif MxfileScanner.match(data):
-                deep_scanners.append(MxfileScanner)
-                deep_scanners.append(XmlScanner)
-                fallback_scanners.append(ByteScanner)
-            elif TmxScanner.match(data):
-                deep_scanners.append(TmxScanner)
-                fallback_scanners.append(XmlScanner)
-                fallback_scanners.append(ByteScanner)
-            else:
-                deep_scanners.append(XmlScanner)
-                fallback_scanners.append(ByteScanner)
+            deep_scanners, fallback_scanners = DeepScanner.__get_xml_scanners(data)
         elif EmlScanner.match(data):
             if descriptor.extension in (".eml", ".mht"):
                 deep_scanners.append(EmlScanner)
@@ -471,18 +543,7 @@ class DeepScanner(
             if 0 < depth:
                 fallback_scanners.append(StringsScanner)
         elif not Util.is_binary(data):
-            # keep ByteScanner first to apply real value position if possible
-            deep_scanners.append(ByteScanner)
-            if 0 < depth:
-                deep_scanners.append(PatchScanner)
-                deep_scanners.append(LangScanner)
-                deep_scanners.append(LexerScanner)
-                if CsvScanner.match(data):
-                    deep_scanners.append(CsvScanner)
-                if EncoderScanner.match(data):
-                    deep_scanners.append(EncoderScanner)
-                if ZlibScanner.match(data):
-                    deep_scanners.append(ZlibScanner)
+            deep_scanners = DeepScanner.__get_text_scanners(data, depth)
         else:
             unknown_warning = not (descriptor.info.endswith("|BASE64") or "|PROTO:" in descriptor.info)
             if 0 < depth:
@@ -499,3 +560,43 @@ class DeepScanner(
             if unknown_warning:
                 logger.warning("Cannot apply a deep scanner for data(%d) %s %s", len(data), repr(data[:32]), descriptor)
         return deep_scanners, fallback_scanners
+
+    @staticmethod
+    def __get_xml_scanners(data: bytes) -> Tuple[List[Any], List[Any]]:
+        """Returns scanners and fallback scanners for XML data which may be a document of known format"""
+        if HtmlScanner.match(data):
+            return [HtmlScanner, XmlScanner], [ByteScanner]
+        if MxfileScanner.match(data):
+            return [MxfileScanner, XmlScanner], [ByteScanner]
+        if TmxScanner.match(data):
+            return [TmxScanner], [XmlScanner, ByteScanner]
+        return [XmlScanner], [ByteScanner]
+
+    @staticmethod
+    def __get_text_scanners(data: bytes, depth: int) -> List[Any]:
+        """Returns scanners for text data, only ByteScanner is applied without depth"""
+        # keep ByteScanner first to apply real value position if possible
+        deep_scanners: List[Any] = [ByteScanner]
+        if 0 < depth:
+            deep_scanners.append(PatchScanner)
+            deep_scanners.append(LangScanner)
+            deep_scanners.append(LexerScanner)
+            if CsvScanner.match(data):
+                deep_scanners.append(CsvScanner)
+            if EncoderScanner.match(data):
+                deep_scanners.append(EncoderScanner)
+            if ZlibScanner.match(data):
+                deep_scanners.append(ZlibScanner)
+        return deep_scanners
+
+    @staticmethod
+    def is_plain_text(data: bytes, descriptor: Descriptor, depth: int) -> bool:
+        """Returns True when the data looks like a text which is scanned only as lines at the depth.
+
+        Zero bytes are not allowed because windows of UTF-16 text cannot be split by line ends.
+
+        """
+        if b'\x00' in data:
+            return False
+        deep_scanners, fallback_scanners = DeepScanner.get_deep_scanners(data, descriptor, depth, len(data) + 1)
+        return [ByteScanner] == deep_scanners and not fallback_scanners
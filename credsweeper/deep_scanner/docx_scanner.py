@@ -3,14 +3,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-import docx
-from docx.document import Document
-from docx.oxml import CT_P, CT_Tbl, CT_SectPr, CT_TcPr
-from docx.section import Section, _Header, _Footer
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
-from lxml.etree import _Element
-
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
 from credsweeper.file_handler.data_content_provider import DataContentProvider
@@ -22,6 +14,8 @@ logger = logging.getLogger(__name__)
 class DocxScanner(AbstractScanner, ABC):
     """Implements docx scanning"""
 
+    SLOW_PARSER = True
+
     @staticmethod
     def match(data: bytes | bytearray) -> bool:
         """Assume, ZIP prefix and common office files were checked before"""
@@ -31,6 +25,13 @@ class DocxScanner(AbstractScanner, ABC):
 
     @staticmethod
     def _iter_block_items(block):
+        # pylint: disable=import-outside-toplevel
+        from docx.document import Document
+        from docx.oxml import CT_P, CT_Tbl, CT_SectPr, CT_TcPr
+        from docx.section import Section, _Header, _Footer
+        from docx.table import _Cell, Table
+        from docx.text.paragraph import Paragraph
+        from lxml.etree import _Element
         if isinstance(block, Paragraph):
             yield block
             return
@@ -76,6 +77,7 @@ class DocxScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Tries to scan DOCX text with splitting by lines"""
         try:
+            import docx  # pylint: disable=import-outside-toplevel
             docx_lines: List[str] = []
 
             doc = docx.Document(io.BytesIO(data_provider.data))
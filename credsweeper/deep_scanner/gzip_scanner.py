@@ -2,7 +2,7 @@ import gzip
 import io
 import logging
 from abc import ABC
-from typing import List, Optional
+from typing import List, Optional, IO, cast
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -22,12 +22,29 @@ class GzipScanner(AbstractScanner, ABC):
             return True
         return False
 
+    @staticmethod
+    def get_size(data: bytes | bytearray) -> int:
+        """Returns minimal size of decompressed data from ISIZE field of the trailer without decompression.
+
+        ISIZE is the size of the last member modulo 2^32, so it does not exceed the size of a well-formed gzip data.
+
+        Returns: size or 0 when the data is too short"""
+        if 18 > len(data):
+            # header, trailer and empty deflate block
+            return 0
+        return int.from_bytes(data[-4:], "little")
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
             depth: int,  #
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts data from gzip archive and launches data_scan"""
+        if recursive_limit_size < (size_hint := GzipScanner.get_size(data_provider.data)):
+            # ISIZE is only a hint from the trailer, so the data are left to the fallback scanners
+            logger.warning("%s ISIZE %d exceeds recursive size limit %d", data_provider.descriptor, size_hint,
+                           recursive_limit_size)
+            return None
         try:
             with gzip.open(io.BytesIO(data_provider.data)) as f:
                 if data_provider.file_type.endswith(".gz"):
@@ -37,13 +54,9 @@ class GzipScanner(AbstractScanner, ABC):
                     file_type = data_provider.file_type[:-4]
                 else:
                     file_type = data_provider.file_type
-                data = AbstractScanner.read_compressed_with_limit(f, recursive_limit_size)
-                gzip_content_provider = DataContentProvider(data=data,
-                                                            file_path=data_provider.file_path,
-                                                            file_type=file_type,
-                                                            info=f"{data_provider.info}|GZIP:{len(data)}")
-                gzip_candidates = self.recursive_scan(gzip_content_provider, depth, recursive_limit_size)
-                return gzip_candidates
+                # the real size limit is checked during reading
+                return self.stream_scan(cast(IO[bytes], f), None, data_provider.file_path, file_type,
+                                        data_provider.info, depth, recursive_limit_size, "GZIP")
         except AbstractScanner.LimitError as gzip_limit_exc:
             logger.warning("%s %s", data_provider.descriptor, gzip_limit_exc)
             return []
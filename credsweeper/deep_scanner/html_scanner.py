@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class HtmlScanner(AbstractScanner, ABC):
     """Implements html scanning if possible"""
 
+    SLOW_PARSER = True
+
     @staticmethod
     def match(data: bytes | bytearray) -> bool:
         """Used to detect html format. Suppose, invocation of is_xml() was True before."""
@@ -2,8 +2,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-import jks
-
 from credsweeper.common.constants import Severity, Confidence
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -28,6 +26,7 @@ class JksScanner(AbstractScanner, ABC):
             depth: int,  #
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Tries to scan JKS to open with standard password"""
+        import jks  # pylint: disable=import-outside-toplevel
         for pw_probe in self.config.bruteforce_list:
             value = repr(pw_probe)
             try:
@@ -1,14 +1,6 @@
 import logging
 from abc import ABC
-from typing import List, Optional, Tuple
-
-from pygments.lexer import Lexer
-from pygments.lexers import guess_lexer, guess_lexer_for_filename
-from pygments.lexers.c_cpp import CppLexer, CLexer
-from pygments.lexers.dotnet import CSharpLexer
-from pygments.lexers.javascript import JavascriptLexer
-from pygments.lexers.jvm import JavaLexer
-from pygments.token import Comment, Token
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -16,18 +8,22 @@ from credsweeper.file_handler.data_content_provider import DataContentProvider
 from credsweeper.file_handler.descriptor import Descriptor
 from credsweeper.file_handler.string_content_provider import StringContentProvider
 
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+
 logger = logging.getLogger(__name__)
 
 
 class LexerScanner(AbstractScanner, ABC):
     """Implements C source scanning with lexical info"""
 
+    # names of pygments lexers - the lexers are imported on demand because the import is slow
     LEXER_MATCHER = {
-        (".c", ".h"): CLexer,
-        (".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"): CppLexer,
-        (".java", ): JavaLexer,
-        (".js", ): JavascriptLexer,
-        (".cs", ): CSharpLexer,
+        (".c", ".h"): "CLexer",
+        (".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"): "CppLexer",
+        (".java", ): "JavaLexer",
+        (".js", ): "JavascriptLexer",
+        (".cs", ): "CSharpLexer",
     }
     EASY_MATCHER = {i: y for x, y in LEXER_MATCHER.items() for i in x}
     SUPPORTED_EXTENSIONS = tuple(x for y in LEXER_MATCHER.keys() for x in y)
@@ -39,7 +35,7 @@ class LexerScanner(AbstractScanner, ABC):
         return True
 
     @staticmethod
-    def get_lexer(text: str, descriptor: Descriptor) -> Lexer:
+    def get_lexer(text: str, descriptor: Descriptor) -> "Lexer":
         """Select a lexer for the source text.
 
         A standard lexer is selected by file extension when available.
@@ -53,8 +49,12 @@ class LexerScanner(AbstractScanner, ABC):
 
         Returns:
             A Pygments lexer suitable for parsing the source text."""
-        lexer: Lexer
-        if lexer_cls := LexerScanner.EASY_MATCHER.get(descriptor.extension):
+        # pylint: disable=import-outside-toplevel
+        import pygments.lexers
+        from pygments.lexers import guess_lexer, guess_lexer_for_filename
+        lexer: "Lexer"
+        if lexer_name := LexerScanner.EASY_MATCHER.get(descriptor.extension):
+            lexer_cls = getattr(pygments.lexers, lexer_name)
             lexer = lexer_cls(stripnl=False, stripall=False, ensurenl=False)
         elif any(descriptor.path.endswith(x) for x in LexerScanner.SUPPORTED_EXTENSIONS):
             lexer = guess_lexer_for_filename(descriptor.path, text)
@@ -65,7 +65,7 @@ class LexerScanner(AbstractScanner, ABC):
         return lexer
 
     @staticmethod
-    def get_lines_semicolon(text: str, lexer: Lexer) -> Tuple[List[str], List[int]]:
+    def get_lines_semicolon(text: str, lexer: "Lexer") -> Tuple[List[str], List[int]]:
         """Build logical source lines terminated by semicolons.
 
         Joins consecutive physical lines until a semicolon terminating the
@@ -80,6 +80,7 @@ class LexerScanner(AbstractScanner, ABC):
             - logical source lines;
             - starting line number of each logical line in the original text.
         """
+        from pygments.token import Comment, Token  # pylint: disable=import-outside-toplevel
         lines: List[str] = []
         line_numbers: List[int] = []
         last_token_type = None
@@ -146,7 +147,7 @@ class LexerScanner(AbstractScanner, ABC):
         """Tries to scan C code with lexical structures"""
         try:
             lexer = LexerScanner.get_lexer(data_provider.text, data_provider.descriptor)
-            if type(lexer) in LexerScanner.SUPPORTED_LEXERS:
+            if type(lexer).__name__ in LexerScanner.SUPPORTED_LEXERS:
                 lines, line_numbers = LexerScanner.get_lines_semicolon(data_provider.text, lexer)
             else:
                 raise ValueError(f"Unsupported lexer {lexer}")
@@ -2,7 +2,7 @@ import io
 import logging
 import lzma
 from abc import ABC
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -21,12 +21,70 @@ class LzmaScanner(AbstractScanner, ABC):
             return True
         return False
 
+    @staticmethod
+    def __read_multibyte(data: bytes | bytearray, offset: int) -> Tuple[int, int]:
+        """Decodes multibyte integer of xz format
+
+        Returns: value and offset after the integer"""
+        value = 0
+        for n in range(9):
+            byte = data[offset + n]
+            value |= (byte & 0x7F) << (7 * n)
+            if not byte & 0x80:
+                return value, offset + n + 1
+        raise ValueError(f"Wrong multibyte integer at {offset}")
+
+    @staticmethod
+    def get_size(data: bytes | bytearray) -> int:
+        """Returns size of decompressed data from the header of lzma or from indexes of xz streams without
+        decompression. According https://tukaani.org/xz/xz-file-format.txt
+
+        Returns: size or 0 when the size is unknown or the data is broken"""
+        try:
+            if data.startswith(b"\x5D\x00\x00"):
+                # properties, dictionary size and uncompressed size which is -1 for unknown size
+                size = int.from_bytes(data[5:13], "little")
+                return 0 if 0xFFFFFFFFFFFFFFFF == size else size
+            result = 0
+            end = len(data)
+            while 0 < end:
+                # stream padding is a multiple of four null bytes
+                while data.endswith(b"\x00\x00\x00\x00", 0, end):
+                    end -= 4
+                # stream footer: CRC32, backward size, flags, magic bytes
+                if not data.endswith(b"YZ", 0, end):
+                    return 0
+                index_start = end - 12 - 4 * (1 + int.from_bytes(data[end - 8:end - 4], "little"))
+                if 0 > index_start or 0x00 != data[index_start]:
+                    return 0
+                records, offset = LzmaScanner.__read_multibyte(data, index_start + 1)
+                blocks_size = 0
+                for _ in range(records):
+                    unpadded_size, offset = LzmaScanner.__read_multibyte(data, offset)
+                    uncompressed_size, offset = LzmaScanner.__read_multibyte(data, offset)
+                    # blocks are padded to a multiple of four bytes
+                    blocks_size += (unpadded_size + 3) & ~3
+                    result += uncompressed_size
+                # stream header is 12 bytes
+                end = index_start - blocks_size - 12
+                if 0 > end or not data.startswith(b"\xFD7zXZ\x00", end):
+                    return 0
+            return result
+        except Exception as exc:
+            logger.debug("Cannot get size from xz index: %s", exc)
+        return 0
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
             depth: int,  #
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts data from lzma archive and launches data_scan"""
+        if recursive_limit_size < (size_hint := LzmaScanner.get_size(data_provider.data)):
+            # the size is only a hint from the header or the index, so the data are left to the fallback scanners
+            logger.warning("%s size %d exceeds recursive size limit %d", data_provider.descriptor, size_hint,
+                           recursive_limit_size)
+            return None
         try:
             if data_provider.file_type.endswith(".xz"):
                 file_type = data_provider.file_type[:-3]
@@ -38,13 +96,8 @@ class LzmaScanner(AbstractScanner, ABC):
             else:
                 file_type = data_provider.file_type
             with lzma.open(io.BytesIO(data_provider.data), "rb") as f:
-                data = AbstractScanner.read_compressed_with_limit(f, recursive_limit_size)
-                lzma_content_provider = DataContentProvider(data=data,
-                                                            file_path=data_provider.file_path,
-                                                            file_type=file_type,
-                                                            info=f"{data_provider.info}|LZMA:{len(data)}")
-                lzma_candidates = self.recursive_scan(lzma_content_provider, depth, recursive_limit_size)
-                return lzma_candidates
+                return self.stream_scan(f, None, data_provider.file_path, file_type, data_provider.info, depth,
+                                        recursive_limit_size, "LZMA")
         except Exception as lzma_exc:
             logger.warning("%s:%s", data_provider.file_path, lzma_exc)
         return None
@@ -2,9 +2,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-from bs4 import BeautifulSoup
-from lxml import etree
-
 from credsweeper.common.constants import MAX_LINE_LENGTH
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -17,6 +14,8 @@ logger = logging.getLogger(__name__)
 class MxfileScanner(AbstractScanner, ABC):
     """Scanner for drawio diagram"""
 
+    SLOW_PARSER = True
+
     @staticmethod
     def match(data: bytes | bytearray) -> bool:
         """Used to detect mxfile (drawio) format. Suppose, invocation of is_xml() was True before."""
@@ -34,6 +33,9 @@ class MxfileScanner(AbstractScanner, ABC):
         try:
             lines = []
             line_numbers = []
+            # pylint: disable=import-outside-toplevel
+            from bs4 import BeautifulSoup
+            from lxml import etree
             tree = etree.fromstring(data_provider.text)
             for element in tree.iter():
                 if "mxCell" == getattr(element, "tag"):
@@ -3,8 +3,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-import pandas as pd
-
 from credsweeper.credentials.augment_candidates import augment_candidates
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -18,6 +16,8 @@ logger = logging.getLogger(__name__)
 class PandasScanner(AbstractScanner, ABC):
     """Implements xlsx scanning"""
 
+    SLOW_PARSER = True
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
@@ -25,6 +25,8 @@ class PandasScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Tries to scan xlsx text elements for all slides"""
         try:
+            # pandas is imported on demand because the import is slow
+            import pandas as pd  # pylint: disable=import-outside-toplevel
             candidates = []
             book = pd.read_excel(io.BytesIO(data_provider.data), sheet_name=None, header=None)
             for sheet_name, sheet_data in book.items():
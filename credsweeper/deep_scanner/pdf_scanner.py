@@ -3,9 +3,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-from pdfminer.high_level import extract_pages
-from pdfminer.layout import LAParams, LTText, LTItem
-
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
 from credsweeper.file_handler.data_content_provider import DataContentProvider, MIN_DATA_LEN
@@ -17,6 +14,8 @@ logger = logging.getLogger(__name__)
 class PdfScanner(AbstractScanner, ABC):
     """Implements pdf scanning"""
 
+    SLOW_PARSER = True
+
     @staticmethod
     def match(data: bytes | bytearray) -> bool:
         """According https://en.wikipedia.org/wiki/List_of_file_signatures - pdf"""
@@ -33,6 +32,9 @@ class PdfScanner(AbstractScanner, ABC):
         # PyPDF2 - https://github.com/py-pdf/pypdf/issues/1328 text in table is merged without spaces
         # pdfminer.six - splits text in table to many lines. Allows to walk through elements
         try:
+            # pylint: disable=import-outside-toplevel
+            from pdfminer.high_level import extract_pages
+            from pdfminer.layout import LAParams, LTText, LTItem
             candidates = []
             for page in extract_pages(io.BytesIO(data_provider.data), laparams=LAParams()):
                 for element in page:
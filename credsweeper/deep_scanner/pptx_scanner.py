@@ -3,8 +3,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-from pptx import Presentation
-
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
 from credsweeper.file_handler.data_content_provider import DataContentProvider
@@ -16,6 +14,8 @@ logger = logging.getLogger(__name__)
 class PptxScanner(AbstractScanner, ABC):
     """Implements pptx scanning"""
 
+    SLOW_PARSER = True
+
     @staticmethod
     def match(data: bytes | bytearray) -> bool:
         """Assume, ZIP prefix and common office files were checked before"""
@@ -30,6 +30,7 @@ class PptxScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Tries to scan pptx text elements for all slides"""
         try:
+            from pptx import Presentation  # pylint: disable=import-outside-toplevel
             candidates = []
             pptx_lines = []
             presentation = Presentation(io.BytesIO(data_provider.data))
@@ -2,8 +2,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-from striprtf import striprtf
-
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
 from credsweeper.file_handler.data_content_provider import DataContentProvider
@@ -26,6 +24,7 @@ class RtfScanner(AbstractScanner, ABC):
     @staticmethod
     def get_lines(text: str) -> List[str]:
         """Extracts text lines from RTF format"""
+        from striprtf import striprtf  # pylint: disable=import-outside-toplevel
         rtf_text = striprtf.rtf_to_text(text)
         lines = Util.split_text(rtf_text)
         return lines
@@ -1,8 +1,6 @@
 import logging
 from abc import ABC
-from typing import List, Optional
-
-from PySquashfsImage import SquashFsImage
+from typing import List, Optional, Generator, TYPE_CHECKING
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -10,6 +8,9 @@ from credsweeper.file_handler.data_content_provider import DataContentProvider
 from credsweeper.file_handler.file_path_extractor import FilePathExtractor
 from credsweeper.utils.util import Util
 
+if TYPE_CHECKING:
+    from PySquashfsImage import SquashFsImage
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +27,28 @@ class SquashfsScanner(AbstractScanner, ABC):
                 return True
         return False
 
+    def __yield_members(
+            self,  #
+            image: "SquashFsImage",  #
+            data_provider: DataContentProvider,  #
+            depth: int,  #
+            recursive_limit_size: int) -> Generator[DataContentProvider, None, None]:
+        """Extracts files one by one from the image"""
+        for i in image:
+            # skip directory
+            if not i.is_file or i.is_symlink:
+                continue
+            if FilePathExtractor.check_exclude_file(self.config, i.path):
+                continue
+            if 0 > recursive_limit_size - i.size:
+                logger.warning("%s: size %s is over limit %s depth:%s", i.name, i.size, recursive_limit_size, depth)
+                continue
+            # Nevertheless, use extracted data size
+            yield DataContentProvider(data=image.read_file(i.inode),
+                                      file_path=data_provider.file_path,
+                                      file_type=Util.get_type(i.path),
+                                      info=f"{data_provider.info}|HSQS:{i.path}")
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
@@ -33,26 +56,10 @@ class SquashfsScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts files one by one from tar archive and launches data_scan"""
         try:
-            candidates = []
+            from PySquashfsImage import SquashFsImage  # pylint: disable=import-outside-toplevel
             with SquashFsImage.from_bytes(data_provider.data) as image:
-                for i in image:
-                    # skip directory
-                    if not i.is_file or i.is_symlink:
-                        continue
-                    if FilePathExtractor.check_exclude_file(self.config, i.path):
-                        continue
-                    if 0 > recursive_limit_size - i.size:
-                        logger.warning("%s: size %s is over limit %s depth:%s", i.name, i.size, recursive_limit_size,
-                                       depth)
-                        continue
-                    hsqs_content_provider = DataContentProvider(data=image.read_file(i.inode),
-                                                                file_path=data_provider.file_path,
-                                                                file_type=Util.get_type(i.path),
-                                                                info=f"{data_provider.info}|HSQS:{i.path}")
-                    # Nevertheless, use extracted data size
-                    hsqs_candidates = self.recursive_scan(hsqs_content_provider, depth, recursive_limit_size)
-                    candidates.extend(hsqs_candidates)
-            return candidates
+                members = self.__yield_members(image, data_provider, depth, recursive_limit_size)
+                return self.members_scan(members, depth, recursive_limit_size)
         except Exception as hsqs_exc:
             logger.error("%s:%s", data_provider.file_path, hsqs_exc)
         return None
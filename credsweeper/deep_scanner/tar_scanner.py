@@ -3,7 +3,7 @@ import io
 import logging
 import tarfile
 from abc import ABC
-from typing import List, Optional
+from typing import List, Optional, Generator, Tuple
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -30,6 +30,36 @@ class TarScanner(AbstractScanner, ABC):
                     return True
         return False
 
+    def get_tar_members(
+            self,  #
+            tf: tarfile.TarFile,  #
+            depth: int,  #
+            recursive_limit_size: int) -> Generator[Tuple[int, tarfile.TarInfo], None, None]:
+        """Yields positions in members list and infos of the files in tar archive which have to be scanned"""
+        for position, tfi in enumerate(tf.getmembers()):
+            # skip directory
+            if not tfi.isreg():
+                continue
+            if FilePathExtractor.check_exclude_file(self.config, tfi.name):
+                continue
+            if 0 > recursive_limit_size - tfi.size:
+                logger.warning("%s: size %s is over limit %s depth:%s", tfi.name, tfi.size, recursive_limit_size, depth)
+                continue
+            yield position, tfi
+
+    def tar_member_scan(
+            self,  #
+            tf: tarfile.TarFile,  #
+            tfi: tarfile.TarInfo,  #
+            file_path: str,  #
+            info: str,  #
+            depth: int,  #
+            recursive_limit_size: int) -> List[Candidate]:
+        """Extracts the file from tar archive and scans it"""
+        with tf.extractfile(tfi) as f:
+            return self.stream_scan(f, tfi.size, file_path, Util.get_type(tfi.name), f"{info}|TAR:{tfi.name}", depth,
+                                    recursive_limit_size)
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
@@ -37,26 +67,13 @@ class TarScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts files one by one from tar archive and launches data_scan"""
         try:
-            candidates = []
             with tarfile.TarFile(fileobj=io.BytesIO(data_provider.data)) as tf:
-                for tfi in tf.getmembers():
-                    # skip directory
-                    if not tfi.isreg():
-                        continue
-                    if FilePathExtractor.check_exclude_file(self.config, tfi.name):
-                        continue
-                    if 0 > recursive_limit_size - tfi.size:
-                        logger.warning("%s: size %s is over limit %s depth:%s", tfi.name, tfi.size,
-                                       recursive_limit_size, depth)
-                        continue
-                    with tf.extractfile(tfi) as f:
-                        tar_content_provider = DataContentProvider(data=f.read(),
-                                                                   file_path=data_provider.file_path,
-                                                                   file_type=Util.get_type(tfi.name),
-                                                                   info=f"{data_provider.info}|TAR:{tfi.name}")
-                        tar_candidates = self.recursive_scan(tar_content_provider, depth, recursive_limit_size)
-                        candidates.extend(tar_candidates)
-            return candidates
+                candidates: List[Candidate] = []
+                for _position, tfi in self.get_tar_members(tf, depth, recursive_limit_size):
+                    candidates.extend(
+                        self.tar_member_scan(tf, tfi, data_provider.file_path, data_provider.info, depth,
+                                             recursive_limit_size))
+                return candidates
         except Exception as tar_exc:
             # too many exception types might be produced with broken tar
             logger.warning("%s:%s", data_provider.file_path, tar_exc)
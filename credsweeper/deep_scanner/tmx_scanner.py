@@ -2,8 +2,6 @@ import logging
 from abc import ABC
 from typing import List, Optional
 
-from lxml import etree
-
 from credsweeper.common.constants import MIN_DATA_LEN, MAX_LINE_LENGTH
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -35,6 +33,7 @@ class TmxScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Tries to represent data as xml text and scan as text lines"""
         try:
+            from lxml import etree  # pylint: disable=import-outside-toplevel
             lines = []
             # the format is always in single line xlm, so line numbers are not actual
             tree = etree.fromstring(data_provider.data)
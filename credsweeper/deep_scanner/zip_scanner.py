@@ -1,8 +1,8 @@
 import io
 import logging
 from abc import ABC
-from typing import List, Optional
-from zipfile import ZipFile
+from typing import List, Optional, Generator, Tuple
+from zipfile import ZipFile, ZipInfo
 
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
@@ -53,6 +53,37 @@ class ZipScanner(AbstractScanner, ABC):
             logger.warning("%s", zip_exc)
         return -1
 
+    def get_zip_members(
+            self,  #
+            zf: ZipFile,  #
+            depth: int,  #
+            recursive_limit_size: int) -> Generator[Tuple[int, ZipInfo], None, None]:
+        """Yields positions in infolist and infos of the files in zip archive which have to be scanned"""
+        for position, zfl in enumerate(zf.infolist()):
+            # skip directory
+            if zfl.is_dir():
+                continue
+            if FilePathExtractor.check_exclude_file(self.config, zfl.filename):
+                continue
+            if 0 > recursive_limit_size - zfl.file_size:
+                logger.warning("%s: size %s is over limit %s depth:%s", zfl.filename, zfl.file_size,
+                               recursive_limit_size, depth)
+                continue
+            yield position, zfl
+
+    def zip_member_scan(
+            self,  #
+            zf: ZipFile,  #
+            zfl: ZipInfo,  #
+            file_path: str,  #
+            info: str,  #
+            depth: int,  #
+            recursive_limit_size: int) -> List[Candidate]:
+        """Extracts the file from zip archive and scans it"""
+        with zf.open(zfl) as f:
+            return self.stream_scan(f, zfl.file_size, file_path, Util.get_type(zfl.filename),
+                                    f"{info}|ZIP:{zfl.filename}", depth, recursive_limit_size)
+
     def data_scan(
             self,  #
             data_provider: DataContentProvider,  #
@@ -60,26 +91,13 @@ class ZipScanner(AbstractScanner, ABC):
             recursive_limit_size: int) -> Optional[List[Candidate]]:
         """Extracts files one by one from zip archives and launches data_scan"""
         try:
-            candidates = []
             with ZipFile(io.BytesIO(data_provider.data)) as zf:
-                for zfl in zf.infolist():
-                    # skip directory
-                    if zfl.is_dir():
-                        continue
-                    if FilePathExtractor.check_exclude_file(self.config, zfl.filename):
-                        continue
-                    if 0 > recursive_limit_size - zfl.file_size:
-                        logger.warning("%s: size %s is over limit %s depth:%s", zfl.filename, zfl.file_size,
-                                       recursive_limit_size, depth)
-                        continue
-                    with zf.open(zfl) as f:
-                        zip_content_provider = DataContentProvider(data=f.read(),
-                                                                   file_path=data_provider.file_path,
-                                                                   file_type=Util.get_type(zfl.filename),
-                                                                   info=f"{data_provider.info}|ZIP:{zfl.filename}")
-                        zip_candidates = self.recursive_scan(zip_content_provider, depth, recursive_limit_size)
-                        candidates.extend(zip_candidates)
-            return candidates
+                candidates: List[Candidate] = []
+                for _position, zfl in self.get_zip_members(zf, depth, recursive_limit_size):
+                    candidates.extend(
+                        self.zip_member_scan(zf, zfl, data_provider.file_path, data_provider.info, depth,
+                                             recursive_limit_size))
+                return candidates
         except Exception as zip_exc:
             # too many exception types might be produced with broken zip
             logger.warning("%s:%s", data_provider.file_path, zip_exc)
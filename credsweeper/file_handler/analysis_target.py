@@ -1,5 +1,5 @@
 from functools import cached_property
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from credsweeper.file_handler.descriptor import Descriptor
 
@@ -10,8 +10,8 @@ class AnalysisTarget:
     def __init__(
         self,
         line_pos: int,
-        lines: List[str],
-        line_nums: List[int],
+        lines: Sequence[str],
+        line_nums: Sequence[int],
         descriptor: Descriptor,
         line: Optional[str] = None,
         offset: Optional[int] = None,
@@ -64,7 +64,7 @@ class AnalysisTarget:
         return self.line_lower.strip()
 
     @cached_property
-    def lines(self) -> List[str]:
+    def lines(self) -> Sequence[str]:
         """cached value"""
         return self.__lines
 
@@ -84,7 +84,7 @@ class AnalysisTarget:
         return self.__line_nums[self.__line_pos]
 
     @cached_property
-    def line_nums(self) -> List[int]:
+    def line_nums(self) -> Sequence[int]:
         """cached value"""
         return self.__line_nums
 
@@ -1,7 +1,8 @@
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import List, Optional, Generator
+from typing import Optional, Generator, Sequence
 
 from credsweeper.common.constants import MAX_LINE_LENGTH
 from credsweeper.file_handler.analysis_target import AnalysisTarget
@@ -70,6 +71,11 @@ class ContentProvider(ABC):
         """abstract data getter"""
         raise NotImplementedError(__name__)
 
+    def get_digest(self) -> Optional[bytes]:
+        """Returns sha256 digest of the data or None when the data are absent"""
+        data = self.data
+        return hashlib.sha256(data).digest() if data is not None else None
+
     @abstractmethod
     def free(self) -> None:
         """free data after scan to reduce memory usage"""
@@ -78,15 +84,16 @@ class ContentProvider(ABC):
     def lines_to_targets(
             self,  #
             min_len: int,
-            lines: List[str],  #
-            line_nums: Optional[List[int]] = None) -> Generator[AnalysisTarget, None, None]:
+            lines: Sequence[str],  #
+            line_nums: Optional[Sequence[int]] = None) -> Generator[AnalysisTarget, None, None]:
         """Creates list of targets with multiline concatenation"""
         lines_range = range(len(lines))
         if line_nums is None or len(line_nums) != len(lines):
             if line_nums is not None:
                 logger.warning("Line numerations %s does not match lines %s. Plain numeration applied", len(line_nums),
                                len(lines))
-            line_nums = [1 + x for x in lines_range]
+            # the range does not keep the numbers in memory
+            line_nums = range(1, 1 + len(lines))
 
         for line_pos in lines_range:
             line = lines[line_pos]
@@ -2,17 +2,18 @@ import json
 import logging
 import warnings
 from functools import cached_property
-from typing import List, Optional, Any, Generator, Callable, Tuple
+from typing import List, Optional, Any, Generator, Callable, Tuple, TYPE_CHECKING
 
 import yaml
-from bs4 import BeautifulSoup, Tag, XMLParsedAsHTMLWarning
 
 from credsweeper.common.constants import MIN_DATA_LEN
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
 from credsweeper.utils.util import Util
 
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning, module='bs4')
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 logger = logging.getLogger(__name__)
 
 # <t>12345678</t> - minimal xml with a credential
@@ -159,7 +160,7 @@ class DataContentProvider(ContentProvider):
             logger.debug("Cannot parse as XML:%s %s", exc, self.data)
         return None
 
-    def _check_multiline_cell(self, cell: Tag) -> Optional[Tuple[int, str]]:
+    def _check_multiline_cell(self, cell: "Tag") -> Optional[Tuple[int, str]]:
         """multiline cell will be analysed as text or return single line from cell
         returns line number and one line for analysis
         If there are no text or the text will be analysed as multiline - it returns None"""
@@ -184,7 +185,7 @@ class DataContentProvider(ContentProvider):
         return None
 
     @staticmethod
-    def simple_html_representation(html: BeautifulSoup) -> Tuple[List[int], List[str], int]:
+    def simple_html_representation(html: "BeautifulSoup") -> Tuple[List[int], List[str], int]:
         """simple parse as it is displayed to user and appends the lines"""
         line_numbers: List[int] = []
         lines: List[str] = []
@@ -205,7 +206,8 @@ class DataContentProvider(ContentProvider):
         return line_numbers, lines, lines_size
 
     @staticmethod
-    def _table_depth_reached(table: Tag, depth: int) -> bool:
+    def _table_depth_reached(table: "Tag", depth: int) -> bool:
+        from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
         if parent := table.parent:
             if isinstance(parent, BeautifulSoup):
                 return False
@@ -218,7 +220,7 @@ class DataContentProvider(ContentProvider):
 
     def _table_representation(
             self,  #
-            table: Tag,  #
+            table: "Tag",  #
             depth: int,  #
             recursive_limit_size: int,  #
             keywords_required_substrings_check: Callable[[str], bool]):
@@ -333,7 +335,7 @@ class DataContentProvider(ContentProvider):
 
     def _html_tables_representation(
             self,  #
-            html: BeautifulSoup,  #
+            html: "BeautifulSoup",  #
             depth: int,  #
             recursive_limit_size: int,  #
             keywords_required_substrings_check: Callable[[str], bool]):
@@ -362,6 +364,10 @@ class DataContentProvider(ContentProvider):
         """
         try:
             if "</" in self.text and ">" in self.text:
+                # bs4 is imported on demand because the import is slow
+                # pylint: disable=import-outside-toplevel
+                from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+                warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning, module='bs4')
                 if html := BeautifulSoup(self.text, features="html.parser"):
                     line_numbers, lines, lines_size = self.simple_html_representation(html)
                     self.line_numbers.extend(line_numbers)
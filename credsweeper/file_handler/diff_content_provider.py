@@ -3,8 +3,6 @@ from dataclasses import dataclass
 from functools import cached_property
 from typing import List, Tuple, Generator, TypedDict, Optional, Union, Any, Dict, cast
 
-import whatthepatch
-
 from credsweeper.common.constants import DiffRowType
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
@@ -119,6 +117,7 @@ class DiffContentProvider(ContentProvider):
         if not raw_patch:
             return {}
 
+        import whatthepatch  # pylint: disable=import-outside-toplevel
         added_files: Dict[str, List[DiffDict]] = {}
         deleted_files: Dict[str, List[DiffDict]] = {}
         try:
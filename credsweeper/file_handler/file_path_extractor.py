@@ -2,14 +2,15 @@ import io
 import logging
 import os
 from pathlib import Path
-from typing import List, Dict, Union, Tuple
-
-from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+from typing import List, Dict, Union, Tuple, TYPE_CHECKING
 
 from credsweeper.common.constants import MIN_DATA_LEN
 from credsweeper.config.config import Config
 from credsweeper.utils.util import Util
 
+if TYPE_CHECKING:
+    from git import Repo
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +18,7 @@ class FilePathExtractor:
     """Util class to browse files in directories"""
 
     FIND_BY_EXT_RULE = "Suspicious File Extension"
-    located_repos: Dict[Path, Repo] = {}
+    located_repos: Dict[Path, "Repo"] = {}
 
     @staticmethod
     def apply_gitignore(detected_files: List[str]) -> List[str]:
@@ -77,6 +78,7 @@ class FilePathExtractor:
             False if file is ignored by git. True otherwise
 
         """
+        from git import InvalidGitRepositoryError, NoSuchPathError, Repo  # pylint: disable=import-outside-toplevel
         parent_directory = Path(path).parent
 
         # Iterate over file path to find nearest ".git" directory
@@ -174,7 +176,21 @@ class FilePathExtractor:
         else:
             logger.error("Unknown path type: %s", path)
             return True
+        return FilePathExtractor.check_size(config, path, file_size)
+
+    @staticmethod
+    def check_size(config: Config, path: Union[str, Path, io.BytesIO], file_size: int) -> bool:
+        """
+        Checks whether the size is over the size limit from configuration or less MIN_DATA_LEN
 
+        Args:
+            config: Config
+            path: reference of the file for logging
+            file_size: size of the file in bytes
+
+        Return:
+            True when the file is oversize or less than MIN_DATA_LEN
+        """
         if MIN_DATA_LEN > file_size:
             logger.debug("Size (%s) of the file '%s' is too small", file_size, path)
             return True
@@ -1,11 +1,15 @@
+import hashlib
 import io
 import logging
+import os
 from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Union, Tuple, Generator
+from typing import List, Optional, Union, Tuple, Generator, Sequence
 
+from credsweeper.common.constants import MMAP_SIZE_THRESHOLD, DIGEST_CHUNK_SIZE
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
+from credsweeper.utils.mapped_lines import MappedLines
 from credsweeper.utils.util import Util
 
 logger = logging.getLogger(__name__)
@@ -26,7 +30,7 @@ class TextContentProvider(ContentProvider):
         _path = str(file_path[0]) if isinstance(file_path, tuple) else str(file_path)
         self.__io = file_path[1] if isinstance(file_path, tuple) else None
         self.__data: Optional[bytes] = None
-        self.__lines: Optional[List[str]] = None
+        self.__lines: Optional[Sequence[str]] = None
         super().__init__(file_path=_path, file_type=file_type, info=info)
 
     @cached_property
@@ -39,20 +43,51 @@ class TextContentProvider(ContentProvider):
                 self.__data = Util.read_data(self.file_path)
         return self.__data
 
+    def get_digest(self) -> Optional[bytes]:
+        """Returns sha256 digest of the content. A file is hashed by chunks, so large file is mapped later"""
+        if self.__io is not None or self.__data is not None:
+            return super().get_digest()
+        sha256 = hashlib.sha256()
+        try:
+            with open(self.file_path, "rb") as file:
+                while chunk := file.read(DIGEST_CHUNK_SIZE):
+                    sha256.update(chunk)
+        except OSError as exc:
+            logger.debug("Cannot read %s: %s", self.file_path, exc)
+            return None
+        return sha256.digest()
+
     def free(self) -> None:
         """free data after scan to reduce memory usage"""
         self.__data = None
         if "data" in self.__dict__:
             delattr(self, "data")
+        if isinstance(self.__lines, MappedLines):
+            self.__lines.close()
         self.__lines = None
         if "lines" in self.__dict__:
             delattr(self, "lines")
         if isinstance(self.__io, io.BytesIO) and self.__io and not self.__io.closed:
             self.__io.close()
 
+    def __map_lines(self) -> Optional[MappedLines]:
+        """Maps a large file to memory to avoid reading and decoding of whole data"""
+        try:
+            if MMAP_SIZE_THRESHOLD > os.path.getsize(self.file_path):
+                return None
+        except OSError:
+            return None
+        if (mapped_lines := MappedLines.open(self.file_path)) is not None:
+            if not mapped_lines.encoding:
+                logger.warning("Binary file detected %s %s", self.file_path, self.info)
+            return mapped_lines
+        return None
+
     @cached_property
-    def lines(self) -> Optional[List[str]]:
+    def lines(self) -> Sequence[str]:
         """lines getter for TextContentProvider"""
+        if self.__lines is None and self.__io is None and self.__data is None:
+            self.__lines = self.__map_lines()
         if self.__lines is None:
             text = Util.decode_text(self.data)
             if isinstance(text, str):
@@ -73,7 +108,7 @@ class TextContentProvider(ContentProvider):
             list of analysis targets based on every row in file
 
         """
-        lines: Optional[List[str]] = None
+        lines: Optional[Sequence[str]] = None
         line_nums: Optional[List[int]] = None
 
         if Util.get_extension(self.file_path) == ".xml":
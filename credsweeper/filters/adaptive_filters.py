@@ -0,0 +1,119 @@
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from credsweeper.credentials.line_data import LineData
+from credsweeper.file_handler.analysis_target import AnalysisTarget
+from credsweeper.filters.filter import Filter
+from credsweeper.utils.profiler import Profiler
+
+
+class AdaptiveFilters(List[Filter]):
+    """Filters of a rule which are reordered by measured cost and rejection rate.
+
+    The filters are independent checks and the first rejection stops the filtering, so the order affects only
+    the time. Expected time of the filtering is minimal when the filters are sorted by average time of a call
+    divided by the rejection rate, that is time of the filter per rejection. Filters which never reject a candidate
+    are checked at last in their original order.
+
+    Statistics of a filter are calls, rejections and seconds. The filters are identified with class name in
+    profiles, because a rule has a filter of a class only once.
+
+    """
+
+    # number of filtered candidates between reorders
+    REORDER_PERIOD = 1024
+
+    def __init__(self, filters: Iterable[Filter], profile: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Args:
+            filters: filters of a rule in configured order
+            profile: optional statistics of the filters from previous scans
+
+        """
+        super().__init__(filters)
+        # the statistics are bound to the filter objects to keep them when the list is copied and extended
+        self.__stats: Dict[Filter, List[float]] = {x: [0, 0, 0.0] for x in self}
+        self.__checks = 0
+        if profile:
+            self.merge_profile(profile)
+            self.reorder()
+
+    def check(self, line_data: LineData, target: AnalysisTarget) -> Optional[Filter]:
+        """Runs the filters and measures them.
+
+        Args:
+            line_data: credential candidate data
+            target: multiline target from which line data was obtained
+
+        Return:
+            The filter which rejected the candidate or None
+
+        """
+        result = None
+        profiling = Profiler.enabled
+        for filter_ in self:
+            if (stat := self.__stats.get(filter_)) is None:
+                stat = self.__stats[filter_] = [0, 0, 0.0]
+            start_time = time.perf_counter()
+            rejected = filter_.run(line_data, target)
+            seconds = time.perf_counter() - start_time
+            if profiling:
+                Profiler.add("filter", filter_.__class__.__name__, seconds, rejected)
+            stat[2] += seconds
+            stat[0] += 1
+            if rejected:
+                stat[1] += 1
+                result = filter_
+                break
+        self.__checks += 1
+        if 0 == self.__checks % self.REORDER_PERIOD:
+            self.reorder()
+        return result
+
+    def __get_rank(self, filter_: Filter) -> float:
+        """Time per rejection, the filters without calls are checked first to be measured"""
+        calls, rejections, seconds = self.__stats.get(filter_, (0, 0, 0.0))
+        if not calls:
+            return 0.0
+        if not rejections:
+            return math.inf
+        return seconds / rejections
+
+    def reorder(self) -> None:
+        """Sorts the filters by measured time per rejection, the sort is stable for equal ranks"""
+        self.sort(key=self.__get_rank)
+
+    def get_profile(self) -> List[Dict[str, Any]]:
+        """Returns statistics of the filters in order of the rank"""
+        profile: List[Dict[str, Any]] = []
+        for filter_ in sorted(self, key=self.__get_rank):
+            calls, rejections, seconds = self.__stats.get(filter_, (0, 0, 0.0))
+            profile.append({
+                "filter": filter_.__class__.__name__,
+                "calls": int(calls),
+                "rejections": int(rejections),
+                "seconds": seconds,
+            })
+        return profile
+
+    def merge_profile(self, profile: List[Dict[str, Any]]) -> None:
+        """Adds statistics of a profile to the filters with the same class name"""
+        filters = {x.__class__.__name__: x for x in self}
+        for item in profile:
+            if (filter_ := filters.get(item.get("filter"))) is not None:
+                stat = self.__stats.setdefault(filter_, [0, 0, 0.0])
+                stat[0] += int(item.get("calls", 0))
+                stat[1] += int(item.get("rejections", 0))
+                stat[2] += float(item.get("seconds", 0.0))
+
+    def reset_profile(self) -> None:
+        """Clears the statistics and keeps current order"""
+        self.__stats = {x: [0, 0, 0.0] for x in self}
+        self.__checks = 0
+
+    @staticmethod
+    def sort_by_profile(filters: List[Filter], profile: List[Dict[str, Any]]) -> None:
+        """Sorts the filters in order of the profile, filters which are absent in the profile are checked at last"""
+        order = {str(x.get("filter")): i for i, x in reversed(list(enumerate(profile)))}
+        filters.sort(key=lambda x: order.get(x.__class__.__name__, len(order)))
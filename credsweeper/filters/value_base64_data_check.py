@@ -37,7 +37,8 @@ class ValueBase64DataCheck(Filter):
             else:
                 return True
         # check whether decoded bytes have enough entropy
+        if (decoded := line_data.value_analytics.base64_decoded) is None:
+            return True
         with contextlib.suppress(Exception):
-            decoded = Util.decode_base64(value, padding_safe=True, urlsafe_detect=True)
             return Util.is_ascii_entropy_validate(decoded)
         return True
@@ -7,7 +7,6 @@ from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
 from credsweeper.utils.pem_key_detector import PemKeyDetector
-from credsweeper.utils.util import Util
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +29,10 @@ class ValueBase64EncodedPem(Filter):
 
         """
 
+        if (decoded := line_data.value_analytics.base64_decoded) is None:
+            return True
         try:
-            text = Util.decode_base64(line_data.value, padding_safe=True, urlsafe_detect=True).decode(ASCII)
+            text = decoded.decode(ASCII)
             pem_text = ''
             pem_end_found = False
             for line in text.splitlines():
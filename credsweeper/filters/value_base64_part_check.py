@@ -80,7 +80,7 @@ class ValueBase64PartCheck(Filter):
                 min_entropy_value = ValueEntropyBase64Check.get_min_data_entropy(len_value)
 
                 left_entropy = Util.get_shannon_entropy(left_part)
-                value_entropy = Util.get_shannon_entropy(value)
+                value_entropy = line_data.value_analytics.entropy
                 right_entropy = Util.get_shannon_entropy(right_part)
                 common = left_part + value + right_part
                 common_entropy = Util.get_shannon_entropy(common)
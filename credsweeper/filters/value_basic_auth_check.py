@@ -6,7 +6,6 @@ from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
-from credsweeper.utils.util import Util
 
 
 class ValueBasicAuthCheck(Filter):
@@ -26,10 +25,10 @@ class ValueBasicAuthCheck(Filter):
             True, if need to filter candidate and False if left
 
         """
-        value = line_data.value
+        # Basic encoding -> login:password
+        if (decoded := line_data.value_analytics.base64_decoded) is None:
+            return True
         with contextlib.suppress(Exception):
-            # Basic encoding -> login:password
-            decoded = Util.decode_base64(value, padding_safe=True, urlsafe_detect=True)
             delimiter_pos = decoded.find(b':')
             # check whether the delimiter exists and all chars are decoded
             if 0 < delimiter_pos < len(decoded) - DEFAULT_PATTERN_LEN and decoded.decode(UTF_8):
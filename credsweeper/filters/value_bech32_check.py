@@ -29,7 +29,7 @@ class ValueBech32Check(Filter):
 
         """
         with contextlib.suppress(Exception):
-            if decoded := bech32.bech32_decode(line_data.value.lower()):
+            if decoded := bech32.bech32_decode(line_data.value_analytics.lower):
                 # successful decoded - it is False
                 return not bool(decoded[0] and decoded[1])
         return True
@@ -1,7 +1,6 @@
 import re
 from typing import Optional
 
-from credsweeper.common import static_keyword_checklist
 from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
@@ -32,6 +31,6 @@ class ValueCamelCaseCheck(Filter):
         if line_data.is_well_quoted_value:
             return False
         if self.CAMEL_CASE_PATTERN.fullmatch(line_data.value):
-            return static_keyword_checklist.check_morphemes(line_data.value.lower(), 1)
+            return line_data.value_analytics.check_morphemes(1)
 
         return False
@@ -24,8 +24,9 @@ class ValueDictionaryKeywordCheck(Filter):
             True, if need to filter candidate and False if left
 
         """
-        line_data_value_lower = line_data.value.lower()
-        for keyword in static_keyword_checklist.keyword_list:
+        line_data_value_lower = line_data.value_analytics.lower
+        # only keywords found in the value are checked in order of keyword_list, a longer keyword masks shorter ones
+        for keyword in static_keyword_checklist.get_keywords(line_data_value_lower):
             if keyword in line_data_value_lower:
                 line_data_value_lower = line_data_value_lower.replace(keyword, '\x7F' * len(keyword))
                 ratio = line_data_value_lower.count('\x7F') / len(line_data_value_lower)
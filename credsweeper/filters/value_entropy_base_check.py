@@ -5,7 +5,6 @@ from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
-from credsweeper.utils.util import Util
 
 
 class ValueEntropyBaseCheck(Filter):
@@ -31,7 +30,7 @@ class ValueEntropyBaseCheck(Filter):
             True, when need to filter candidate and False if left
 
         """
-        entropy = Util.get_shannon_entropy(line_data.value)
+        entropy = line_data.value_analytics.entropy
         min_entropy = self.get_min_data_entropy(len(line_data.value))
         if min_entropy > entropy or 0 == min_entropy:
             return True
@@ -1,13 +1,11 @@
 from typing import Optional
 
-from credsweeper.common import static_keyword_checklist
 from credsweeper.common.constants import Chars
 from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
 from credsweeper.filters.value_entropy_base64_check import ValueEntropyBase64Check
-from credsweeper.utils.util import Util
 
 
 class ValueFilePathCheck(Filter):
@@ -47,7 +45,7 @@ class ValueFilePathCheck(Filter):
                     or value.startswith("//") and ':' == line_data.separator):
                 # common case for url definition or aliases
                 # or _keyword_://example.com where : is the separator
-                return static_keyword_checklist.check_morphemes(value.lower(), morpheme_threshold)
+                return line_data.value_analytics.check_morphemes(morpheme_threshold)
             # base64 encoded data might look like linux path
             min_entropy = ValueEntropyBase64Check.get_min_data_entropy(len(value))
             # get minimal entropy to compare with shannon entropy of found value
@@ -58,7 +56,7 @@ class ValueFilePathCheck(Filter):
                     break
             else:
                 # all symbols are from base64 alphabet
-                entropy = Util.get_shannon_entropy(value)
+                entropy = line_data.value_analytics.entropy
                 if 0 == min_entropy or min_entropy > entropy:
                     contains_unix_separator = 1 < value.count('/')
                 else:
@@ -76,5 +74,5 @@ class ValueFilePathCheck(Filter):
                     break
             else:
                 if contains_unix_separator ^ contains_windows_separator:
-                    return static_keyword_checklist.check_morphemes(value.lower(), morpheme_threshold)
+                    return line_data.value_analytics.check_morphemes(morpheme_threshold)
         return False
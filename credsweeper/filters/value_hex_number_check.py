@@ -26,7 +26,7 @@ class ValueHexNumberCheck(Filter):
             True, if need to filter candidate and False if left
 
         """
-        value = line_data.value.lower()
+        value = line_data.value_analytics.lower
         if ValueHexNumberCheck.HEX_08_64_VALUE_REGEX.match(value):
             return True
         return False
@@ -5,7 +5,6 @@ from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
-from credsweeper.utils.util import Util
 
 
 class ValueJsonWebKeyCheck(Filter):
@@ -31,7 +30,7 @@ class ValueJsonWebKeyCheck(Filter):
 
         """
         with contextlib.suppress(Exception):
-            if data := Util.decode_base64(line_data.value, padding_safe=True, urlsafe_detect=True):
+            if data := line_data.value_analytics.base64_decoded:
                 if b'"kty":' in data and (b'"oct"' in data and b'"k":' in data or
                                           (b'"EC"' in data or b'"RSA"' in data) and b'"d":' in data):
                     return False
@@ -1,6 +1,5 @@
 from typing import Optional
 
-from credsweeper.common import static_keyword_checklist
 from credsweeper.common.constants import MAX_LINE_LENGTH
 from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
@@ -40,4 +39,4 @@ class ValueMorphemesCheck(Filter):
         threshold_id = len(line_data.value).bit_length()
         # use the last (max) threshold in very huge value
         threshold = self.thresholds[threshold_id] if len(self.thresholds) > threshold_id else self.thresholds[-1]
-        return static_keyword_checklist.check_morphemes(line_data.value.lower(), threshold)
+        return line_data.value_analytics.check_morphemes(threshold)
@@ -27,7 +27,7 @@ class ValueNumberCheck(Filter):
             True, if need to filter candidate and False if left
 
         """
-        value = line_data.value.lower()
+        value = line_data.value_analytics.lower
         if 22 > len(value) and ValueNumberCheck.HEX_VALUE_REGEX.match(value):
             return True
         if ValueNumberCheck.DEC_VALUE_REGEX.match(value):
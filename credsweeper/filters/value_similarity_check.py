@@ -27,7 +27,7 @@ class ValueSimilarityCheck(Filter):
         """
         if line_data.variable and line_data.value:
             variable_lower = line_data.variable.lower()
-            value_lower = line_data.value.lower()
+            value_lower = line_data.value_analytics.lower
             if len(value_lower) <= len(variable_lower):
                 if value_lower in variable_lower:
                     return True
@@ -7,7 +7,6 @@ from credsweeper.config.config import Config
 from credsweeper.credentials.line_data import LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.filters.filter import Filter
-from credsweeper.utils.hop_stat import HopStat
 
 
 class ValueTokenBaseCheck(Filter):
@@ -28,7 +27,7 @@ class ValueTokenBaseCheck(Filter):
     }
 
     def __init__(self, config: Optional[Config] = None) -> None:
-        self.__hop_stat = HopStat()
+        pass
 
     @staticmethod
     @abstractmethod
@@ -54,8 +53,10 @@ class ValueTokenBaseCheck(Filter):
             True, if need to filter candidate and False if left
 
         """
+        if (hop_stat := line_data.value_analytics.hop_stat) is None:
+            return False
+        hop, dev = hop_stat
         with contextlib.suppress(Exception):
-            hop, dev = self.__hop_stat.stat(line_data.value)
             (min_hop, max_hop), (min_dev, max_dev) = self.get_stat_range(len(line_data.value))
             if not (min_hop <= hop <= max_hop and min_dev <= dev <= max_dev):
                 return True
@@ -5,24 +5,33 @@ import sys
 import time
 from argparse import Namespace
 from pathlib import Path
-from typing import Dict, Tuple, Sequence, Optional, List
-
-from git import Repo, Commit
+from typing import Dict, Tuple, Sequence, Optional, List, Set, TYPE_CHECKING
 
 from credsweeper import __version__
 from credsweeper.app import APP_PATH, CredSweeper
 from credsweeper.cli import parse_arguments
 from credsweeper.common.constants import DiffRowType
+from credsweeper.credentials.candidate import Candidate
 from credsweeper.file_handler.abstract_provider import AbstractProvider
 from credsweeper.file_handler.byte_content_provider import ByteContentProvider
+from credsweeper.file_handler.file_path_extractor import FilePathExtractor
 from credsweeper.file_handler.files_provider import FilesProvider
 from credsweeper.file_handler.patches_provider import PatchesProvider
 from credsweeper.logger.logger import Logger
+from credsweeper.utils.git_blob_reader import GitBlobReader
+from credsweeper.utils.git_scan_index import GitScanIndex
+from credsweeper.utils.profiler import Profiler
 from credsweeper.utils.util import Util
 
+if TYPE_CHECKING:
+    from git import Blob, Repo, Commit
+
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 
+# number of unique changed blobs of several commits which are scanned together in git mode
+DRILL_QUEUE_SIZE = 256
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,22 +68,34 @@ def get_credsweeper(args: Namespace) -> CredSweeper:
         sort_output=args.sort_output,
         use_filters=args.no_filters,
         pool_count=args.jobs,
+        jobs_start_method=args.jobs_start_method,
         ml_batch_size=args.ml_batch_size,
         ml_threshold=args.ml_threshold,
         ml_config=args.ml_config,
         ml_model=args.ml_model,
         ml_providers=args.ml_providers,
         ml_threads_limit=args.ml_threads_limit,
+        ml_in_jobs=args.ml_in_jobs,
         find_by_ext=args.find_by_ext,
         pedantic=args.pedantic,
         depth=args.depth,
         doc=args.doc,
+        whole_file=args.whole_file,
         severity=args.severity,
         size_limit=args.size_limit,
+        parser_timeout=args.parser_timeout,
+        pattern_timeout=args.pattern_timeout,
+        adaptive_filters=args.adaptive_filters,
+        filter_profile=args.filter_profile,
+        profile=args.profile is not None,
         exclude_lines=denylist,
         exclude_values=denylist,
         thrifty=args.thrifty,
         log_level=args.log,
+        cache_path=args.cache_path,
+        cache_size_limit=args.cache_size,
+        cache_age_limit=args.cache_age,
+        stream=args.stream,
     )
 
 
@@ -101,28 +122,151 @@ def scan(args: Namespace, content_provider: AbstractProvider) -> int:
     return -1
 
 
-def get_commit_providers(commit: Commit, repo: Repo) -> Sequence[ByteContentProvider]:
-    """Process a commit and for providers"""
-    result = {}
+def get_commit_blobs(commit: "Commit", repo: "Repo") -> Dict[str, "Blob"]:
+    """Returns changed blobs of a commit by path without reading of the data"""
+    result: Dict[str, "Blob"] = {}
     # use the hardcoded sha1 until sha256 objects are not supported by GitPython
     ancestors = commit.parents or [repo.tree("4b825dc642cb6eb9a060e54bf8d69288fbee4904")]
     for parent in ancestors:
         for diff in parent.diff(commit):
             # only result files
             blob_b = diff.b_blob
-            if blob_b and blob_b.path not in result:
-                try:
-                    result[blob_b.path] = ByteContentProvider(content=blob_b.data_stream.read(),
-                                                              file_path=str(blob_b.path),
-                                                              info=DiffRowType.ADDED.value)
-                except Exception as exc:
-                    logger.warning("A submodule was not properly initialized or commit was removed: %s", exc)
-    return list(result.values())
+            if blob_b and (blob_path := str(blob_b.path)) not in result:
+                result[blob_path] = blob_b
+    return result
+
+
+def get_blobs_providers(credsweeper: CredSweeper, reader: GitBlobReader,
+                        blobs: Sequence[Tuple[str, str]]) -> List[Tuple[str, ByteContentProvider]]:
+    """Reads data of the blobs to providers in bulk.
+
+    Blobs in excluded paths and blobs out of the size limits are skipped before reading of the data.
+
+    Args:
+        credsweeper: instance with configuration to check the paths and the sizes
+        reader: reader of objects of the repository
+        blobs: (blob sha, path) of the blobs
+
+    Returns:
+        list of (blob sha, provider)
+
+    """
+    blobs = [x for x in blobs if not FilePathExtractor.check_exclude_file(credsweeper.config, x[1])]
+    sizes = reader.get_sizes(list(set(x[0] for x in blobs)))
+    blobs = [
+        x for x in blobs
+        if (size := sizes.get(x[0])) is not None and not FilePathExtractor.check_size(credsweeper.config, x[1], size)
+    ]
+    data = reader.read(list(set(x[0] for x in blobs)))
+    result: List[Tuple[str, ByteContentProvider]] = []
+    for sha, path in blobs:
+        if (content := data.get(sha)) is not None:
+            result.append((sha, ByteContentProvider(content=content, file_path=path, info=DiffRowType.ADDED.value)))
+    return result
+
+
+def get_commit_providers(credsweeper: CredSweeper, reader: GitBlobReader, commit: "Commit",
+                         repo: "Repo") -> Sequence[ByteContentProvider]:
+    """Process a commit and for providers"""
+    blobs = [(x.hexsha, path) for path, x in get_commit_blobs(commit, repo).items()]
+    return [x[1] for x in get_blobs_providers(credsweeper, reader, blobs)]
+
+
+def get_scan_rounds(
+        providers: List[Tuple[str, ByteContentProvider]]) -> List[Dict[str, Tuple[str, ByteContentProvider]]]:
+    """Splits providers of blobs to rounds of scan with unique paths.
+
+    Results of scan and post processing are mapped to a blob by the path, so versions of the same file from different
+    commits are placed in different rounds.
+
+    Returns:
+        list of rounds, every round is dictionary of path -> (blob sha, provider)
+
+    """
+    rounds: List[Dict[str, Tuple[str, ByteContentProvider]]] = []
+    for sha, provider in providers:
+        path = str(provider.file_path)
+        for scan_round in rounds:
+            if path not in scan_round:
+                scan_round[path] = (sha, provider)
+                break
+        else:
+            rounds.append({path: (sha, provider)})
+    return rounds
+
+
+def blobs_scan(credsweeper: CredSweeper, reader: GitBlobReader, blobs: Sequence[Tuple[str, str]],
+               git_index: Optional[GitScanIndex]) -> Dict[Tuple[str, str], List[Candidate]]:
+    """Scans unique blobs of several commits at once, so the jobs pool is shared by all the commits.
+
+    The blobs present in the index are not read and scanned.
+
+    Returns:
+        post processed credentials of every blob by (blob sha, path)
+
+    """
+    result: Dict[Tuple[str, str], List[Candidate]] = {}
+    new_blobs: List[Tuple[str, str]] = []
+    for key in blobs:
+        if git_index is not None and (blob_credentials := git_index.get_blob(*key)) is not None:
+            result[key] = blob_credentials
+        else:
+            result[key] = []
+            new_blobs.append(key)
+    for scan_round in get_scan_rounds(get_blobs_providers(credsweeper, reader, new_blobs)):
+        credsweeper.credential_manager.candidates.clear()
+        credsweeper.scan([x[1] for x in scan_round.values()])
+        credsweeper.post_processing()
+        # post processing is performed within a file, so the credentials are stored for every blob separately
+        for candidate in credsweeper.credential_manager.get_credentials():
+            path = candidate.line_data_list[0].path
+            result[(scan_round[path][0], path)].append(candidate)
+        if git_index is not None:
+            for path, (sha, _) in scan_round.items():
+                git_index.add_blob(sha, path, result[(sha, path)])
+    return result
+
+
+def export_commits(
+        credsweeper: CredSweeper,  #
+        reader: GitBlobReader,  #
+        commits: List[Tuple[str, List[Tuple[str, str]], Dict[str, Path]]],  #
+        git_index: Optional[GitScanIndex]) -> int:
+    """Scans blobs of the commits in one queue and exports credentials of every commit to own report
+
+    Args:
+        credsweeper: instance to scan and to export
+        reader: reader of objects of the repository
+        commits: list of (commit sha, (blob sha, path) of changed blobs, report files by attribute of credsweeper)
+        git_index: optional index of scanned commits and blobs
+
+    Returns:
+        number of exported credentials
+
+    """
+    # the same blob may be changed in several commits, e.g. in a merge commit
+    unique_blobs = list(dict.fromkeys(key for _, blobs, _ in commits for key in blobs))
+    blobs_credentials = blobs_scan(credsweeper, reader, unique_blobs, git_index)
+    total_credentials = 0
+    for commit_sha1, blobs, report_paths in commits:
+        if blobs:
+            for attr, path in report_paths.items():
+                setattr(credsweeper, attr, path)
+            credentials = [x for key in blobs for x in blobs_credentials[key]]
+            credsweeper.credential_manager.set_credentials(credentials)
+            credsweeper.export_results()
+            total_credentials += len(credentials)
+        if git_index is not None:
+            git_index.add_commit(commit_sha1)
+    return total_credentials
 
 
 def drill(args: Namespace) -> Tuple[int, int]:
     """Scan repository for branches and commits
 
+    Changed blobs of several commits are scanned in one deduplicated queue with the jobs pool, then credentials are
+    exported for every commit separately. Stream mode scans and exports a commit at once.
+
     Args:
         args: arguments of the application
 
@@ -131,8 +275,11 @@ def drill(args: Namespace) -> Tuple[int, int]:
         total scanned commits
 
     """
+    from git import Repo  # pylint: disable=import-outside-toplevel
     total_credentials = 0
     total_commits = 0
+    git_index: Optional[GitScanIndex] = None
+    reader = GitBlobReader(args.git)
     try:
         # repo init first
         repo = Repo(args.git)
@@ -146,12 +293,17 @@ def drill(args: Namespace) -> Tuple[int, int]:
         logger.info("Git repository %s with commits: %s", args.git, commits_sha1)
         # then - credsweeper
         credsweeper = get_credsweeper(args)
+        if args.git_index_path:
+            git_index = GitScanIndex(args.git_index_path, credsweeper.fingerprint, credsweeper.candidates_serializer)
         # use flat iterations to avoid recursive limits
         to_scan = set(commits_sha1)
         # local speedup for already scanned commits - avoid file system interactive
         scanned = set()
         # to avoid double-check
         skipped = set()
+        # commits whose blobs are waiting in the queue and the number of unique blobs there
+        pending: List[Tuple[str, List[Tuple[str, str]], Dict[str, Path]]] = []
+        pending_blobs: Set[Tuple[str, str]] = set()
         while to_scan:
             commit_sha1 = to_scan.pop()
             if commit_sha1 in scanned:
@@ -162,41 +314,72 @@ def drill(args: Namespace) -> Tuple[int, int]:
                 # add parents only when they were not skipped or scanned previously
                 to_scan.update(x.hexsha for x in commit.parents if x.hexsha not in skipped and x.hexsha not in scanned)
             # check whether the commit has been checked and the report is present
-            skip_already_scanned = False
-            if args.json_filename:
-                json_path = Path(args.json_filename)
-                json_path = json_path.with_suffix(f".{commit_sha1}{json_path.suffix}")
-                if json_path.exists():
-                    skip_already_scanned = True
-                else:
-                    credsweeper.json_filename = json_path
-            if args.xlsx_filename:
-                xlsx_path = Path(args.xlsx_filename)
-                xlsx_path = xlsx_path.with_suffix(f".{commit_sha1}{xlsx_path.suffix}")
-                if xlsx_path.exists():
-                    skip_already_scanned = True
-                else:
-                    credsweeper.xlsx_filename = xlsx_path
+            skip_already_scanned = git_index is not None and git_index.is_commit_scanned(commit_sha1)
+            report_paths: Dict[str, Path] = {}
+            for attr, filename in (("json_filename", args.json_filename), ("xlsx_filename", args.xlsx_filename)):
+                if filename:
+                    report_path = Path(filename)
+                    report_path = report_path.with_suffix(f".{commit_sha1}{report_path.suffix}")
+                    if report_path.exists():
+                        skip_already_scanned = True
+                    else:
+                        report_paths[attr] = report_path
             if skip_already_scanned:
                 skipped.add(commit_sha1)
                 logger.info("Skip already scanned commit: %s %s", commit_sha1, commit.committed_datetime.isoformat())
                 continue
             logger.info("Scan commit: %s %s", commit_sha1, commit.committed_datetime.isoformat())
-            # prepare all files to scan in the commit with bytes->IO transformation to avoid a multiprocess issue
-            if providers := get_commit_providers(commit, repo):
-                credsweeper.credential_manager.candidates.clear()
-                credsweeper.scan(providers)
-                credsweeper.post_processing()
-                credsweeper.export_results()
-                total_credentials += credsweeper.credential_manager.len_credentials()
+            if credsweeper.stream:
+                # prepare all files to scan in the commit with bytes->IO transformation to avoid a multiprocess issue
+                if providers := get_commit_providers(credsweeper, reader, commit, repo):
+                    for attr, report_path in report_paths.items():
+                        setattr(credsweeper, attr, report_path)
+                    total_credentials += credsweeper.stream_scan(providers)
+                if git_index is not None:
+                    git_index.add_commit(commit_sha1)
+            else:
+                blobs = [(x.hexsha, path) for path, x in get_commit_blobs(commit, repo).items()]
+                pending.append((commit_sha1, blobs, report_paths))
+                pending_blobs.update(blobs)
+                if DRILL_QUEUE_SIZE <= len(pending_blobs):
+                    total_credentials += export_commits(credsweeper, reader, pending, git_index)
+                    pending = []
+                    pending_blobs = set()
             total_commits += 1
             scanned.add(commit_sha1)
+        if pending:
+            total_credentials += export_commits(credsweeper, reader, pending, git_index)
     except Exception as exc:
         logger.critical(exc, exc_info=True)
         return -1, total_commits
+    finally:
+        if git_index is not None:
+            git_index.close()
+        reader.close()
     return total_credentials, total_commits
 
 
+def serve(args: Namespace) -> int:
+    """Runs scan server until interruption
+
+    Returns:
+        EXIT_SUCCESS after interruption or EXIT_FAILURE when the server cannot be started
+
+    """
+    # the module is imported only for the mode
+    from credsweeper.server.scan_server import ScanServer  # pylint: disable=import-outside-toplevel
+    try:
+        with ScanServer(get_credsweeper(args), args.serve) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                logger.info("Scan server was interrupted")
+    except Exception as exc:
+        logger.critical(exc, exc_info=True)
+        return EXIT_FAILURE
+    return EXIT_SUCCESS
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Main function"""
     start_time = time.perf_counter()
@@ -237,6 +420,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         summary[f"Detected Credentials in {args.git} for {commits_number} commits "] = credentials_number
         if 0 <= credentials_number:
             result = EXIT_SUCCESS
+    elif args.serve:
+        logger.info("Run scan server on: %s", args.serve)
+        result = serve(args)
     elif args.export_config:
         logger.info("Exporting default config to file: %s", args.export_config)
         config_dict = Util.json_load(APP_PATH / "secret" / "config.json")
@@ -258,6 +444,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f"{k}: {v}")
         print(f"Time Elapsed: {time.perf_counter() - start_time}")
 
+    if EXIT_SUCCESS == result and args.profile:
+        print(Profiler.get_table())
+        Profiler.save(args.profile)
+
     if args.error and EXIT_SUCCESS == result and 0 < credentials_number:
         # override result when credentials were found with the requirement
         result = EXIT_FAILURE
@@ -1,4 +1,5 @@
 import math
+from collections import Counter
 from typing import Dict, List, Set
 
 import numpy as np
@@ -61,3 +62,30 @@ class EntropyEvaluation(Feature):
                     result[n] = 1.0
 
         return result
+
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        """Returns entropies and possible sets of characters for the candidates column by column"""
+        result: np.ndarray = np.zeros(shape=(len(candidates), EntropyEvaluation.RESULT_SIZE), dtype=np.float32)
+        values = [x.line_data_list[0].value[:EntropyEvaluation.HUNK_SIZE] for x in candidates]
+        counters = [Counter(x) for x in values]
+        # rows with counts of unique characters padded with zeros
+        counts: np.ndarray = np.zeros(shape=(len(candidates), max((len(x) for x in counters), default=0)))
+        for i, counter in enumerate(counters):
+            # the same order as np.unique provides
+            counts[i, :len(counter)] = [counter[x] for x in sorted(counter)]
+        sizes = np.array([len(x) for x in values], dtype=np.float64)
+        rows = MIN_DATA_LEN <= sizes
+        if np.any(rows):
+            probabilities = counts[rows] / sizes[rows, np.newaxis]
+            hartley_entropy = np.array([EntropyEvaluation.LOG2_CACHE.get(int(x), -1.0) for x in sizes[rows]])
+            # renyi_entropy alpha=0.5
+            result[rows, 0] = 2 * np.log2(np.sum(probabilities**0.5, axis=1)) / hartley_entropy
+            # shannon_entropy or renyi_entropy alpha=1 - zero padding does not affect the sum
+            log2_probabilities = np.log2(probabilities, out=np.zeros_like(probabilities), where=0 < probabilities)
+            result[rows, 1] = -np.sum(probabilities * log2_probabilities, axis=1) / hartley_entropy
+            # renyi_entropy alpha=2
+            result[rows, 2] = -1 * np.log2(np.sum(probabilities**2, axis=1)) / hartley_entropy
+        for n, char_set in enumerate(EntropyEvaluation.CHAR_SET, start=3):
+            # check charset for non-zero value
+            result[:, n] = [1.0 if counter and char_set.issuperset(counter) else 0.0 for counter in counters]
+        return result
@@ -21,6 +21,18 @@ class Feature(ABC):
         """
         return np.array([self.extract(candidate) for candidate in candidates])
 
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        """Extracts the feature for every candidate as for separate group.
+
+        Args:
+            candidates: list of candidates - the first candidates of groups
+
+        Return:
+            2D array with a row for every candidate
+
+        """
+        return np.array([self.extract(candidate) for candidate in candidates]).reshape((len(candidates), -1))
+
     @abstractmethod
     def extract(self, candidate: Candidate) -> Any:
         """Abstract method of base class"""
@@ -21,5 +21,8 @@ class FileExtension(WordIn):
         extension_set = set(candidate.line_data_list[0].file_type.lower() for candidate in candidates)
         return self.word_in_(extension_set)
 
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        return self.word_in_batch([[x.line_data_list[0].file_type.lower()] for x in candidates])
+
     def extract(self, candidate: Candidate) -> Any:
         raise NotImplementedError
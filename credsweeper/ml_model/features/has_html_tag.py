@@ -1,3 +1,7 @@
+from typing import List
+
+import numpy as np
+
 from credsweeper.common.constants import CHUNK_SIZE
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.ml_model.features.word_in import WordIn
@@ -14,16 +18,25 @@ class HasHtmlTag(WordIn):
     def __init__(self) -> None:
         super().__init__(HasHtmlTag.HTML_WORDS)
 
-    def extract(self, candidate: Candidate) -> float:
+    def get_text(self, candidate: Candidate) -> str:
+        """Returns lowercase subtext of the first line around the value"""
         subtext = Util.subtext(candidate.line_data_list[0].line, candidate.line_data_list[0].value_start, CHUNK_SIZE)
-        candidate_line_data_list_0_line_lower = subtext.lower()
-        if '<' not in candidate_line_data_list_0_line_lower:
+        return subtext.lower()
+
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        return np.array([[self.extract(x)] for x in candidates])
+
+    def extract(self, candidate: Candidate) -> np.ndarray:
+        """Returns scalar array 1.0 when the text has a tag or -1.0"""
+        return np.array(1.0 if self.has_tag(self.get_text(candidate)) else -1.0)
+
+    def has_tag(self, text: str) -> bool:
+        """Checks lowercase text for HTML tags"""
+        if '<' not in text:
             # early check
-            return -1.0
+            return False
         for i in self.words:
-            if i in candidate_line_data_list_0_line_lower:
-                return 1.0
-        if "/>" in candidate_line_data_list_0_line_lower or "</" in candidate_line_data_list_0_line_lower:
-            # possible closed tag
-            return 1.0
-        return -1.0
+            if i in text:
+                return True
+        # possible closed tag
+        return "/>" in text or "</" in text
@@ -1,3 +1,5 @@
+from typing import List
+
 import numpy as np
 
 from credsweeper.common.constants import ML_HUNK
@@ -28,3 +30,10 @@ class LengthOfAttribute(Feature):
             return np.array([1.0])
         # the attribute is empty
         return np.array([0.0])
+
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        """Returns normalized lengths for the candidates in a column"""
+        lengths = np.array([len(getattr(x.line_data_list[0], self.attribute, None) or '') for x in candidates],
+                           dtype=np.float64)
+        # 1.0 means the attribute is oversize
+        return np.minimum(lengths / self.hunk_plus, 1.0).reshape((len(candidates), 1))
@@ -1,4 +1,3 @@
-from credsweeper.common import static_keyword_checklist
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.ml_model.features.feature import Feature
 
@@ -8,16 +7,12 @@ class MorphemeDense(Feature):
 
     def extract(self, candidate: Candidate) -> float:
         density = 0.0
-        if value := candidate.line_data_list[0].value.lower():
+        line_data = candidate.line_data_list[0]
+        if value := line_data.value_analytics.lower:
             morphemes_length = 0
-            for morpheme in static_keyword_checklist.morpheme_set:
-                morpheme_pos = value.find(morpheme)
-                if 0 <= morpheme_pos:
-                    morpheme_len = len(morpheme)
-                    while 0 <= morpheme_pos:
-                        morphemes_length += morpheme_len
-                        morpheme_pos += morpheme_len
-                        morpheme_pos = value.find(morpheme, morpheme_pos)
+            # only morphemes found in the value are counted without overlapping
+            for morpheme in line_data.value_analytics.morphemes:
+                morphemes_length += len(morpheme) * value.count(morpheme)
             # normalization: minimal morpheme length is 3
             density = morphemes_length / len(value)
             if 1.0 < density:
@@ -21,5 +21,8 @@ class RuleName(WordIn):
         candidate_rule_set = set(x.rule_name for x in candidates)
         return self.word_in_(candidate_rule_set)
 
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        return self.word_in_batch([[x.rule_name] for x in candidates])
+
     def extract(self, candidate: Candidate) -> Any:
         raise NotImplementedError
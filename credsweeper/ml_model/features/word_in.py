@@ -1,5 +1,4 @@
-from abc import abstractmethod
-from typing import List, Any, Set, Union
+from typing import List, Set, Union, Sequence
 
 import numpy as np
 
@@ -18,10 +17,20 @@ class WordIn(Feature):
         if len(self.enumerated_words) != self.dimension:
             raise RuntimeError(f"Check duplicates:{words}")
 
-    @abstractmethod
-    def extract(self, candidate: Candidate) -> Any:
+    def get_text(self, candidate: Candidate) -> str:
+        """Returns lowercase text of the candidate to search the words or empty string"""
         raise NotImplementedError
 
+    def extract(self, candidate: Candidate) -> np.ndarray:
+        """Returns array of matching words in text of the candidate"""
+        if text := self.get_text(candidate):
+            return self.word_in_(text)
+        return np.array([self.zero])
+
+    def extract_batch(self, candidates: List[Candidate]) -> np.ndarray:
+        """Returns 2D array of matching words in texts of the candidates"""
+        return self.word_in_batch([self.get_text(candidate) for candidate in candidates])
+
     @property
     def zero(self) -> np.ndarray:
         """Returns zero filled array for case of empty input"""
@@ -34,3 +43,10 @@ class WordIn(Feature):
             if word in iterable_data:
                 result[i] = 1
         return np.array([result])
+
+    def word_in_batch(self, iterable_data_list: Sequence[Union[str, List[str], Set[str]]]) -> np.ndarray:
+        """Returns 2D array with words included in every item - the words are checked column by column"""
+        result: np.ndarray = np.zeros(shape=[len(iterable_data_list), self.dimension], dtype=np.int8)
+        for i, word in self.enumerated_words:
+            result[:, i] = [word in x for x in iterable_data_list]
+        return result
@@ -13,14 +13,20 @@ class WordInPath(WordIn):
 
     def __call__(self, candidates: List[Candidate]) -> np.ndarray:
         # actually there must be one path because the candidates are grouped before
-        if file_path := candidates[0].line_data_list[0].path:
+        if path_without_extension := self.get_text(candidates[0]):
+            return self.word_in_(path_without_extension)
+        return np.array([self.zero])
+
+    def get_text(self, candidate: Candidate) -> str:
+        """Returns normalised lowercase path without extension"""
+        if file_path := candidate.line_data_list[0].path:
             path = Path(file_path)
             # apply ./ for normalised path to detect "/src" for relative path
             posix_lower_path = path.as_posix().lower() if path.is_absolute() else f"./{path.as_posix().lower()}"
             # prevent extra confusion from the same word in extension
             path_without_extension, _ = os.path.splitext(posix_lower_path)
-            return self.word_in_(path_without_extension)
-        return np.array([self.zero])
+            return path_without_extension
+        return ''
 
     def extract(self, candidate: Candidate) -> Any:
         raise NotImplementedError
@@ -1,6 +1,7 @@
 import hashlib
 import json
 import logging
+import time
 from pathlib import Path
 from typing import List, Tuple, Union, Optional, Dict
 
@@ -11,6 +12,7 @@ from credsweeper.common.constants import ThresholdPreset, ML_HUNK
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.credentials.candidate_key import CandidateKey
 from credsweeper.ml_model import features
+from credsweeper.utils.profiler import Profiler
 from credsweeper.utils.util import Util
 
 logger = logging.getLogger(__name__)
@@ -86,6 +88,14 @@ class MlValidator:
             for index, char in enumerate(sorted(list(char_set)), start=len(self.char_dict))
         })
         self.num_classes = len(self.char_dict)
+        # translation table of characters to indexes for str.translate - the rest characters are unknown
+        self.__char_table_size = 1 + max(self.num_classes, max(ord(x) for x in self.char_dict))
+        self.__char_table = {
+            x: self.char_dict.get(chr(x), self.char_dict[MlValidator.FAKE_CHAR])
+            for x in range(self.__char_table_size)
+        }
+        # one-hot vectors of the indexes, the last row is zero vector for padding
+        self.__one_hot = np.eye(self.num_classes + 1, self.num_classes, dtype=np.float32)
 
         self.common_feature_list = []
         self.unique_feature_list = []
@@ -152,19 +162,47 @@ class MlValidator:
                 result_array[i, self.char_dict[MlValidator.FAKE_CHAR]] = 1.0
         return result_array
 
-    def encode_line(self, text: str, position: int):
-        """Encodes line with balancing for position"""
+    def encode_batch(self, texts: List[str], limit: int) -> np.ndarray:
+        """Encodes prepared texts to 3D array at once.
+
+        Characters are translated to indexes with the translation table and one-hot vectors are taken by the indexes
+        from identity matrix. Positions after end of a text are filled with zero vectors.
+
+        """
+        lengths = np.array([min(len(x), limit) for x in texts], dtype=np.int64)
+        indexes: np.ndarray = np.full(shape=(len(texts), limit), fill_value=self.num_classes, dtype=np.int64)
+        if total := int(lengths.sum()):
+            translated = ''.join(x[:limit] for x in texts).translate(self.__char_table)
+            codes = np.fromiter(map(ord, translated), dtype=np.int64, count=total)
+            # characters out of the table were not translated
+            codes[self.__char_table_size <= codes] = self.char_dict[MlValidator.FAKE_CHAR]
+            rows = np.repeat(np.arange(len(texts)), lengths)
+            columns = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            indexes[rows, columns] = codes
+        return np.asarray(self.__one_hot[indexes], dtype=np.float32)
+
+    @staticmethod
+    def prepare_line(text: str, position: int) -> str:
+        """Strips line and cuts subtext with balancing for position"""
         offset = len(text) - len(text.lstrip())
         pos = position - offset
         stripped = text.strip()
         if MlValidator.MAX_LEN < len(stripped):
             stripped = Util.subtext(stripped, pos, ML_HUNK)
-        return self.encode(stripped, MlValidator.MAX_LEN)
+        return stripped
+
+    @staticmethod
+    def prepare_value(text: str) -> str:
+        """Strips text and cuts the head"""
+        return text.strip()[:ML_HUNK]
+
+    def encode_line(self, text: str, position: int):
+        """Encodes line with balancing for position"""
+        return self.encode(self.prepare_line(text, position), MlValidator.MAX_LEN)
 
     def encode_value(self, text: str) -> np.ndarray:
         """Encodes line with balancing for position"""
-        stripped = text.strip()
-        return self.encode(stripped[:ML_HUNK], ML_HUNK)
+        return self.encode(self.prepare_value(text), ML_HUNK)
 
     def _call_model(self, line_input: np.ndarray, variable_input: np.ndarray, value_input: np.ndarray,
                     feature_input: np.ndarray) -> np.ndarray:
@@ -208,14 +246,9 @@ class MlValidator:
                 feature_array = feature_array | new_feature
         return feature_array
 
-    def get_group_features(self, candidates: List[Candidate]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        """
-        `np.newaxis` used to add new dimension if front, so input will be treated as a batch
-        """
-        # all candidates are from the same line
-        default_candidate = candidates[0]
-        line_input = self.encode_line(default_candidate.line_data_list[0].line,
-                                      default_candidate.line_data_list[0].value_start)[np.newaxis]
+    @staticmethod
+    def get_group_variable_value(candidates: List[Candidate]) -> Tuple[str, str]:
+        """Returns first non-empty variable and value of the group"""
         variable = ''
         value = ''
         for candidate in candidates:
@@ -225,29 +258,62 @@ class MlValidator:
                 value = candidate.line_data_list[0].value
             if variable and value:
                 break
-        variable_input = self.encode_value(variable)[np.newaxis]
-        value_input = self.encode_value(value)[np.newaxis]
-        feature_array = self.extract_features(candidates)
+        return variable, value
+
+    def get_group_features(self, candidates: List[Candidate]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The group is processed as a batch of single group
+        """
+        return self.get_groups_features([candidates])
+
+    def get_groups_features(
+            self,  #
+            groups: List[List[Candidate]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Encodes line, variable, value and extracts features for the batch of groups at once
+
+        Args:
+            groups: list of candidate groups
+
+        Return:
+            inputs of the model with a row for every group
+
+        """
+        lines: List[str] = []
+        variables: List[str] = []
+        values: List[str] = []
+        for candidates in groups:
+            # all candidates are from the same line
+            default_line_data = candidates[0].line_data_list[0]
+            lines.append(self.prepare_line(default_line_data.line, default_line_data.value_start))
+            variable, value = self.get_group_variable_value(candidates)
+            variables.append(self.prepare_value(variable))
+            values.append(self.prepare_value(value))
+        line_input = self.encode_batch(lines, MlValidator.MAX_LEN)
+        variable_input = self.encode_batch(variables, ML_HUNK)
+        value_input = self.encode_batch(values, ML_HUNK)
+        feature_array = self.extract_groups_features(groups)
         return line_input, variable_input, value_input, feature_array
 
     def extract_features(self, candidates: List[Candidate]) -> np.ndarray:
         """extracts common and unique features from list of candidates"""
-        common_features = self.extract_common_features(candidates)
-        unique_features = self.extract_unique_features(candidates)
-        feature_hstack = np.hstack([common_features, unique_features])
-        feature_array = np.array([feature_hstack])
-        return feature_array
+        return self.extract_groups_features([candidates])
 
-    def _batch_call_model(self, line_input_list, variable_input_list, value_input_list, features_list) -> np.ndarray:
-        """auxiliary method to invoke twice"""
-        line_inputs_vstack = np.vstack(line_input_list)
-        variable_inputs_vstack = np.vstack(variable_input_list)
-        value_inputs_vstack = np.vstack(value_input_list)
-        feature_array_vstack = np.vstack(features_list)
-        result_call = self._call_model(line_inputs_vstack, variable_inputs_vstack, value_inputs_vstack,
-                                       feature_array_vstack)
-        result = result_call[:, 0]
-        return result
+    def extract_groups_features(self, groups: List[List[Candidate]]) -> np.ndarray:
+        """Extracts features for the batch of groups column by column.
+
+        Common features are extracted for the first candidate of every group.
+        Unique features are extracted for all candidates and joined with or operator in every group.
+
+        """
+        default_candidates = [x[0] for x in groups]
+        feature_list = [feature.extract_batch(default_candidates) for feature in self.common_feature_list]
+        if self.unique_feature_list:
+            all_candidates = [y for x in groups for y in x]
+            offsets = np.cumsum([0] + [len(x) for x in groups[:-1]])
+            for feature in self.unique_feature_list:
+                unique_features = feature.extract_batch(all_candidates).astype(np.int8)
+                feature_list.append(np.bitwise_or.reduceat(unique_features, offsets, axis=0))
+        return np.hstack(feature_list)
 
     def validate_groups(self, group_list: List[Tuple[CandidateKey, List[Candidate]]],
                         batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
@@ -262,31 +328,22 @@ class MlValidator:
             and numpy array with probability predicted by the model
 
         """
-        line_input_list = []
-        variable_input_list = []
-        value_input_list = []
-        features_list = []
         probability: np.ndarray = np.zeros(len(group_list), dtype=np.float32)
-        head = tail = 0
-        for _group_key, candidates in group_list:
-            line_input, variable_input, value_input, feature_array = self.get_group_features(candidates)
-            line_input_list.append(line_input)
-            variable_input_list.append(variable_input)
-            value_input_list.append(value_input)
-            features_list.append(feature_array)
-            tail += 1
-            if 0 == tail % batch_size:
-                # use the approach to reduce memory consumption for huge candidates list
-                probability[head:tail] = self._batch_call_model(line_input_list, variable_input_list, value_input_list,
-                                                                features_list)
-                head = tail
-                line_input_list.clear()
-                variable_input_list.clear()
-                value_input_list.clear()
-                features_list.clear()
-        if head != tail:
-            probability[head:tail] = self._batch_call_model(line_input_list, variable_input_list, value_input_list,
-                                                            features_list)
+        profiling = Profiler.enabled
+        start_time = features_time = 0.0
+        for head in range(0, len(group_list), batch_size):
+            # use the approach to reduce memory consumption for huge candidates list
+            groups = [candidates for _group_key, candidates in group_list[head:head + batch_size]]
+            if profiling:
+                start_time = time.perf_counter()
+            groups_features = self.get_groups_features(groups)
+            if profiling:
+                features_time = time.perf_counter()
+                Profiler.add("ml", "features", features_time - start_time, len(groups))
+            result_call = self._call_model(*groups_features)
+            if profiling:
+                Profiler.add("ml", "inference", time.perf_counter() - features_time, len(groups))
+            probability[head:head + len(groups)] = result_call[:, 0]
         is_cred = self.threshold <= probability
         if logger.isEnabledFor(logging.DEBUG):
             for i, decision in enumerate(is_cred):
@@ -112,11 +112,16 @@ class Rule:
         """confidence getter"""
         return self.__confidence
 
-    @cached_property
+    @property
     def filters(self) -> List[Filter]:
         """filters getter"""
         return self.__filters
 
+    @filters.setter
+    def filters(self, rule_filters: List[Filter]) -> None:
+        """filters setter"""
+        self.__filters = rule_filters
+
     @staticmethod
     def _get_arg(arg: str) -> Union[int, float, str]:
         """Transform given string value to int, then float. In worst case - returns str"""
@@ -0,0 +1,177 @@
+import re
+from bisect import bisect_right
+from typing import List, Set, Optional, Dict, Sequence, Tuple
+
+# a pattern is located in whole text after the number of requests for lines of the text
+LOCATE_THRESHOLD = 16
+# ... and when the pattern is requested for most of the lines
+LOCATE_DENSITY = 0.5
+# number of lines joined to text for single search - limits memory for huge files
+LOCATE_BLOCK_LINES = 1 << 16
+
+# escapes which may distinguish end of a line from newline symbol in the whole text
+LINE_UNSAFE_ESCAPES = re.compile(r"(?<!\\)(?:\\\\)*\\[AZ]")
+# symbols of negative lookaround body which may match newline symbol
+NEWLINE_MATCHING = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[sWDn]|\[\^|\.)")
+# atomic groups and possessive quantifiers do not backtrack, so a match in the whole text may shadow a match in a line
+NO_BACKTRACKING = re.compile(r"(?<!\\)(?:\\\\)*(?:\(\?>|[*+?}]\+)")
+
+
+class PatternLocator:
+    """Locates lines of a text where a pattern may be matched with single regex pass over the whole text.
+
+    The pattern is compiled with MULTILINE flag, so anchors match at the line bounds as they do for a single line.
+    A match for a line is a match for the whole text too, then the located lines are a superset of lines
+    where the original pattern matches. The lines have to be verified with the original pattern.
+
+    """
+
+    def __init__(self, pattern: re.Pattern) -> None:
+        self.__pattern: Optional[re.Pattern] = None
+        if self.is_locatable(pattern.pattern):
+            self.__pattern = re.compile(pattern.pattern, flags=pattern.flags | re.MULTILINE)
+
+    @property
+    def pattern(self) -> Optional[re.Pattern]:
+        """pattern getter - None when the pattern cannot be located in the whole text"""
+        return self.__pattern
+
+    @staticmethod
+    def _get_negative_lookarounds(pattern: str) -> List[str]:
+        """Returns bodies of negative lookahead and lookbehind in the pattern"""
+        result: List[str] = []
+        stack: List[Optional[int]] = []
+        in_class = False
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if '\\' == char:
+                i += 2
+                continue
+            if in_class:
+                if ']' == char:
+                    in_class = False
+            elif '[' == char:
+                in_class = True
+                # first symbol after '[' or '[^' may be ']'
+                if pattern.startswith('^]', i + 1):
+                    i += 2
+                elif pattern.startswith(']', i + 1):
+                    i += 1
+            elif '(' == char:
+                if pattern.startswith("?!", i + 1):
+                    stack.append(i + 3)
+                elif pattern.startswith("?<!", i + 1):
+                    stack.append(i + 4)
+                else:
+                    stack.append(None)
+            elif ')' == char and stack:
+                if (start := stack.pop()) is not None:
+                    result.append(pattern[start:i])
+            i += 1
+        return result
+
+    @staticmethod
+    def is_locatable(pattern: str) -> bool:
+        """Checks whether a match in a line is a match in the whole text with MULTILINE flag"""
+        if LINE_UNSAFE_ESCAPES.search(pattern) or NO_BACKTRACKING.search(pattern):
+            return False
+        for body in PatternLocator._get_negative_lookarounds(pattern):
+            if NEWLINE_MATCHING.search(body):
+                return False
+        return True
+
+    @staticmethod
+    def get_line_starts(lines: Sequence[str]) -> List[int]:
+        """Returns offsets of lines in the text joined with newline symbol"""
+        line_starts: List[int] = []
+        offset = 0
+        for line in lines:
+            line_starts.append(offset)
+            offset += 1 + len(line)
+        return line_starts
+
+    def locate(self, text: str, line_starts: List[int]) -> Set[int]:
+        """Returns positions of lines in which a match of the pattern starts
+
+        Args:
+            text: the lines joined with newline symbol
+            line_starts: offsets of the lines in the text
+
+        Return:
+            set of line positions. The search continues from next line after a match to find all the lines
+            even if the match overlaps the next line.
+
+        """
+        line_positions: Set[int] = set()
+        if self.__pattern is None:
+            return line_positions
+        lines_len = len(line_starts)
+        pos = 0
+        while match := self.__pattern.search(text, pos):
+            line_pos = bisect_right(line_starts, match.start()) - 1
+            line_positions.add(line_pos)
+            if lines_len <= line_pos + 1:
+                break
+            pos = line_starts[line_pos + 1]
+        return line_positions
+
+
+class WholeText:
+    """Lines of a target with lazy located line positions of patterns.
+
+    The lines are joined to text by blocks of LOCATE_BLOCK_LINES, so memory mapped lines of a huge file are never
+    materialized entirely. A match in a line lies in the line, then the blocks are located independently.
+
+    """
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        self.__lines = lines
+        # the text is kept for all patterns when the lines fit single block
+        self.__block: Optional[Tuple[str, List[int]]] = None
+        self.__requests: Dict[int, int] = {}
+        self.__located: Dict[int, Set[int]] = {}
+
+    @property
+    def lines(self) -> Sequence[str]:
+        """lines getter"""
+        return self.__lines
+
+    def __locate(self, locator: PatternLocator) -> Set[int]:
+        """Returns positions of the lines where the pattern of locator may be matched"""
+        lines_len = len(self.__lines)
+        if LOCATE_BLOCK_LINES >= lines_len:
+            if self.__block is None:
+                lines = list(self.__lines)
+                self.__block = ('\n'.join(lines), PatternLocator.get_line_starts(lines))
+            return locator.locate(*self.__block)
+        located: Set[int] = set()
+        for block_start in range(0, lines_len, LOCATE_BLOCK_LINES):
+            lines = list(self.__lines[block_start:block_start + LOCATE_BLOCK_LINES])
+            block_located = locator.locate('\n'.join(lines), PatternLocator.get_line_starts(lines))
+            located.update(block_start + x for x in block_located)
+        return located
+
+    def is_located(self, key: int, locator: PatternLocator, line_pos: int) -> bool:
+        """Checks whether the pattern of locator may be matched in the line
+
+        Args:
+            key: identifier of the locator
+            locator: the locator of a pattern
+            line_pos: position of the line in the lines
+
+        Return:
+            False only when the pattern was located in the whole text and the line has no match.
+            The whole text pass is performed when the pattern was requested for most of lines only,
+            because sparse lines are scanned faster separately.
+
+        """
+        if key in self.__located:
+            return line_pos in self.__located[key]
+        requests = 1 + self.__requests.get(key, 0)
+        if LOCATE_THRESHOLD > requests or LOCATE_DENSITY * (1 + line_pos) > requests:
+            self.__requests[key] = requests
+            return True
+        located = self.__locate(locator)
+        self.__located[key] = located
+        return line_pos in located
@@ -1,5 +1,6 @@
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -7,8 +8,10 @@ from credsweeper.common.constants import RuleType, MIN_DATA_LEN
 from credsweeper.config.config import Config
 from credsweeper.credentials.candidate import Candidate, LineData
 from credsweeper.file_handler.analysis_target import AnalysisTarget
+from credsweeper.filters.adaptive_filters import AdaptiveFilters
 from credsweeper.filters.filter import Filter
 from credsweeper.rules.rule import Rule
+from credsweeper.utils.profiler import Profiler
 
 logger = logging.getLogger(__name__)
 
@@ -57,12 +60,28 @@ class ScanType(ABC):
             logger.debug("Filtered line with empty value in file: %s:%d  in line: %s value: '%s'", line_data.path,
                          line_data.line_num, line_data.line, line_data.value)
             return True
-        for filter_ in filters:
-            if filter_.run(line_data, target):
-                logger.debug("Filtered line with filter: %s in file: %s:%d  in line: %s value: %s",
-                             filter_.__class__.__name__, line_data.path, line_data.line_num, line_data.line,
-                             line_data.value)
-                return True
+        if isinstance(filters, AdaptiveFilters):
+            rejecting_filter = filters.check(line_data, target)
+        elif Profiler.enabled:
+            rejecting_filter = None
+            for filter_ in filters:
+                start_time = time.perf_counter()
+                rejected = filter_.run(line_data, target)
+                Profiler.add("filter", filter_.__class__.__name__, time.perf_counter() - start_time, rejected)
+                if rejected:
+                    rejecting_filter = filter_
+                    break
+        else:
+            rejecting_filter = None
+            for filter_ in filters:
+                if filter_.run(line_data, target):
+                    rejecting_filter = filter_
+                    break
+        if rejecting_filter is not None:
+            logger.debug("Filtered line with filter: %s in file: %s:%d  in line: %s value: %s",
+                         rejecting_filter.__class__.__name__, line_data.path, line_data.line_num, line_data.line,
+                         line_data.value)
+            return True
         return False
 
     @classmethod
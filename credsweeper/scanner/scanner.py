@@ -1,7 +1,8 @@
 import logging
 import re
+import time
 from pathlib import Path
-from typing import List, Type, Tuple, Union, Dict, Generator, Set
+from typing import List, Type, Tuple, Union, Dict, Set, FrozenSet, Generator, Optional, Any
 
 from credsweeper.app import APP_PATH
 from credsweeper.common.constants import RuleType, MIN_VARIABLE_LENGTH, MIN_SEPARATOR_LENGTH, MIN_VALUE_LENGTH, \
@@ -10,12 +11,18 @@ from credsweeper.config.config import Config
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
+from credsweeper.filters.adaptive_filters import AdaptiveFilters
 from credsweeper.rules.rule import Rule
+from credsweeper.scanner.pattern_locator import PatternLocator, WholeText
 from credsweeper.scanner.scan_type.multi_pattern import MultiPattern
 from credsweeper.scanner.scan_type.pem_key_pattern import PemKeyPattern
 from credsweeper.scanner.scan_type.scan_type import ScanType
 from credsweeper.scanner.scan_type.single_pattern import SinglePattern
+from credsweeper.utils.profiler import Profiler
+from credsweeper.utils.regex_risk import RegexRisk
+from credsweeper.utils.substring_matcher import SubstringMatcher
 from credsweeper.utils.util import Util
+from credsweeper.utils.watchdog import Watchdog
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +38,14 @@ class Scanner:
         min_keyword_len: minimal possible length for a string to be matched by any keyword rule
         min_len: Smallest between min_pattern_len and min_keyword_len
         TargetGroup: Type for List[Tuple[AnalysisTarget, str, int]]
+        RULE_OVERRUNS_LIMIT: number of lines which a rule scans longer than pattern_timeout before it is skipped
 
     """
 
     TargetGroup = List[Tuple[AnalysisTarget, str, int]]
 
+    RULE_OVERRUNS_LIMIT = 3
+
     def __init__(self, config: Config, rule_path: Union[None, str, Path]) -> None:
         self.config = config
         # init with MAX_LINE_LENGTH before _set_rules
@@ -43,15 +53,97 @@ class Scanner:
         self.min_pattern_len = MAX_LINE_LENGTH
         self.min_pem_key_len = MAX_LINE_LENGTH
         self.min_multi_len = MAX_LINE_LENGTH
-        self.rules_scanners: List[Tuple[Rule, Type[ScanType]]] = []
+        self.__rules_scanners: List[Tuple[Rule, Type[ScanType]]] = []
+        # prefilter to obtain candidate rules for a line with single pass over the line
+        self.__substring_matcher = SubstringMatcher([])
+        self.__substring_rules: Dict[str, FrozenSet[int]] = {}
+        self.__unconditional_rules: FrozenSet[int] = frozenset()
+        self.__unconditional_rules_order: List[int] = []
+        # locators of pattern rules for whole file mode
+        self.__pattern_locators: Dict[int, PatternLocator] = {}
+        # overruns of pattern_timeout and skipped rules in the process
+        self.__rule_overruns: Dict[int, int] = {}
+        self.__quarantined_rules: Set[int] = set()
         self._set_rules_scanners(rule_path)
         self.min_len = min(self.min_pattern_len, self.min_keyword_len, self.min_pem_key_len, self.min_multi_len,
                            MIN_VARIABLE_LENGTH + MIN_SEPARATOR_LENGTH + MIN_VALUE_LENGTH)
         self.__keyword_rules_required_substrings = self._get_required_substrings(RuleType.KEYWORD)
+        self.__keyword_substring_matcher = SubstringMatcher(self.__keyword_rules_required_substrings)
+
+    @property
+    def rules_scanners(self) -> List[Tuple[Rule, Type[ScanType]]]:
+        """rules_scanners getter"""
+        return self.__rules_scanners
+
+    @rules_scanners.setter
+    def rules_scanners(self, rules_scanners: List[Tuple[Rule, Type[ScanType]]]) -> None:
+        """rules_scanners setter - the prefilter is rebuilt for new rules"""
+        self.__rules_scanners = rules_scanners
+        self._set_prefilter()
+
+    def _set_prefilter(self) -> None:
+        """Compiles required substrings of all rules into single matcher and maps the substrings to rule indexes"""
+        unconditional_rules: Set[int] = set()
+        substring_rules: Dict[str, Set[int]] = {}
+        for index, (rule, _scanner) in enumerate(self.__rules_scanners):
+            if rule.has_required_substrings and all(rule.required_substrings):
+                for substring in rule.required_substrings:
+                    substring_rules.setdefault(substring, set()).add(index)
+            else:
+                # the rule has to be checked for every line
+                unconditional_rules.add(index)
+        self.__substring_matcher = SubstringMatcher(substring_rules.keys())
+        # the matcher returns the longest substring at a position, so all its prefixes are matched too
+        self.__substring_rules = {}
+        for substring in substring_rules:
+            indexes: Set[int] = set()
+            for prefix in self.__substring_matcher.prefixes(substring):
+                indexes.update(substring_rules[prefix])
+            self.__substring_rules[substring] = frozenset(indexes)
+        self.__unconditional_rules = frozenset(unconditional_rules)
+        self.__unconditional_rules_order = sorted(unconditional_rules)
+        self.__rule_overruns = {}
+        self.__quarantined_rules = set()
+        self.__pattern_locators = {}
+        if self.config.whole_file:
+            for index, (rule, _scanner) in enumerate(self.__rules_scanners):
+                if RuleType.PATTERN == rule.rule_type:
+                    locator = PatternLocator(rule.patterns[0])
+                    if locator.pattern is not None:
+                        self.__pattern_locators[index] = locator
+                    else:
+                        logger.debug("Rule %s cannot be located in whole file", rule.rule_name)
+
+    def get_candidate_rules(self, text_lower: str) -> List[int]:
+        """Returns sorted indexes of rules which required substrings are present in the text or not required"""
+        matched: Set[int] = set()
+        for _pos, substring in self.__substring_matcher.iter_longest(text_lower):
+            matched.update(self.__substring_rules[substring])
+        if not matched:
+            return self.__unconditional_rules_order
+        # order of the rules is kept without sorting for every line
+        unconditional_rules = self.__unconditional_rules
+        return [i for i in range(len(self.__rules_scanners)) if i in matched or i in unconditional_rules]
+
+    def yield_rule_scanner(
+            self,  #
+            line_len: int,  #
+            matched_pattern: bool,  #
+            matched_keyword: bool,  #
+            matched_pem_key: bool,  #
+            matched_multi: bool) -> Generator[Tuple[Rule, Type[ScanType]], None, None]:
+        """returns generator for rules and according scanner without the check of required substrings"""
+        for rule, scanner in self.rules_scanners:
+            if line_len >= rule.min_line_len \
+                    and (RuleType.PATTERN == rule.rule_type and matched_pattern
+                         or RuleType.KEYWORD == rule.rule_type and matched_keyword
+                         or RuleType.PEM_KEY == rule.rule_type and matched_pem_key
+                         or RuleType.MULTI == rule.rule_type and matched_multi):
+                yield rule, scanner
 
     def keywords_required_substrings_check(self, text: str) -> bool:
         """check whether `text` has any required substring for all keyword type rules"""
-        return self._substring_check(self.__keyword_rules_required_substrings, text)
+        return self.__keyword_substring_matcher.search(text)
 
     def _get_required_substrings(self, rule_type: RuleType) -> Set[str]:
         """init set of required substrings for custom rule type"""
@@ -60,20 +152,53 @@ class Scanner:
             required_substrings.update(set(rule.required_substrings))
         return required_substrings
 
-    @staticmethod
-    def _substring_check(substrings: Set[str], text: str) -> bool:
-        """checks whether `text` has any required substring. Set is used to reduce extra transformations"""
-        for substring in substrings:
-            if substring in text:
-                return True
-        return False
+    def set_filters_order(self, profile: Optional[Dict[str, List[Dict[str, Any]]]], adaptive: bool) -> None:
+        """Sorts filters of the rules in order of a profile and makes them adaptive when it is required.
+
+        Args:
+            profile: statistics of filters for rule names from previous scans
+            adaptive: the filters are reordered by measured cost and rejection rate during the scan
+
+        """
+        for rule, _scanner in self.__rules_scanners:
+            rule_profile = profile.get(rule.rule_name) if profile else None
+            if adaptive:
+                rule.filters = AdaptiveFilters(rule.filters, rule_profile)
+            elif rule_profile:
+                AdaptiveFilters.sort_by_profile(rule.filters, rule_profile)
+
+    def get_filters_profile(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Returns statistics of adaptive filters for names of the rules which filtered candidates"""
+        profile: Dict[str, List[Dict[str, Any]]] = {}
+        for rule, _scanner in self.__rules_scanners:
+            if isinstance(rule.filters, AdaptiveFilters):
+                rule_profile = rule.filters.get_profile()
+                if any(x["calls"] for x in rule_profile):
+                    profile[rule.rule_name] = rule_profile
+        return profile
+
+    def merge_filters_profile(self, profile: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Adds statistics of a profile to adaptive filters of the rules and reorders them"""
+        for rule, _scanner in self.__rules_scanners:
+            if isinstance(rule.filters, AdaptiveFilters) and (rule_profile := profile.get(rule.rule_name)):
+                rule.filters.merge_profile(rule_profile)
+                rule.filters.reorder()
+
+    def reset_filters_profile(self) -> None:
+        """Clears statistics of adaptive filters and keeps their order"""
+        for rule, _scanner in self.__rules_scanners:
+            if isinstance(rule.filters, AdaptiveFilters):
+                rule.filters.reset_profile()
 
     def _set_rules_scanners(self, rules_path: Union[None, str, Path]) -> None:
         """Auxiliary method to fill rules, determine min_pattern_len and set scanners"""
         if rules_path is None:
             rules_path = RULES_PATH
+        # patterns of custom rules which may backtrack super-linearly are reported to authors of the rules
+        risk_level = logging.DEBUG if RULES_PATH == Path(rules_path) else logging.WARNING
         rule_templates = Util.yaml_load(rules_path)
         if rule_templates and isinstance(rule_templates, list):
+            rules_scanners: List[Tuple[Rule, Type[ScanType]]] = []
             rule_names = set()
             for rule_template in rule_templates:
                 try:
@@ -86,6 +211,11 @@ class Scanner:
                 if rule.rule_name in rule_names:
                     raise RuntimeError(f"Duplicated rule name {rule.rule_name}")
                 rule_names.add(rule.rule_name)
+                if logger.isEnabledFor(risk_level):
+                    for i, pattern in enumerate(rule.patterns):
+                        if risks := RegexRisk.analyze(pattern):
+                            logger.log(risk_level, "Pattern %d of rule %s may backtrack super-linearly (%s)", i,
+                                       rule.rule_name, ", ".join(risks))
                 if 0 < rule.min_line_len:
                     if rule.rule_type == RuleType.KEYWORD:
                         self.min_keyword_len = min(self.min_keyword_len, rule.min_line_len)
@@ -97,7 +227,8 @@ class Scanner:
                         self.min_multi_len = min(self.min_multi_len, rule.min_line_len)
                     else:
                         logger.warning("Unknown rule type:%s", rule.rule_type)
-                self.rules_scanners.append((rule, self.get_scanner(rule)))
+                rules_scanners.append((rule, self.get_scanner(rule)))
+            self.rules_scanners = rules_scanners
         else:
             raise RuntimeError(f"Wrong rules '{rule_templates}' were read from '{rules_path}'")
 
@@ -113,22 +244,6 @@ class Scanner:
                 return True
         return False
 
-    def yield_rule_scanner(
-            self,  #
-            line_len: int,  #
-            matched_pattern: bool,  #
-            matched_keyword: bool,  #
-            matched_pem_key: bool,  #
-            matched_multi: bool) -> Generator[Tuple[Rule, Type[ScanType]], None, None]:
-        """returns generator for rules and according scanner"""
-        for rule, scanner in self.rules_scanners:
-            if line_len >= rule.min_line_len \
-                    and (RuleType.PATTERN == rule.rule_type and matched_pattern
-                         or RuleType.KEYWORD == rule.rule_type and matched_keyword
-                         or RuleType.PEM_KEY == rule.rule_type and matched_pem_key
-                         or RuleType.MULTI == rule.rule_type and matched_multi):
-                yield rule, scanner
-
     def scan(self, provider: ContentProvider) -> List[Candidate]:
         """Run scanning of list of target lines from 'targets' with set of rule from 'self.rules'.
 
@@ -140,7 +255,19 @@ class Scanner:
             list of all detected credential candidates in analyzed targets
 
         """
+        if self.config.pattern_timeout:
+            with Watchdog(self.config.pattern_timeout) as watchdog:
+                return self.__scan_targets(provider, watchdog)
+        return self.__scan_targets(provider, None)
+
+    def __scan_targets(self, provider: ContentProvider, watchdog: Optional[Watchdog]) -> List[Candidate]:
+        """Scans the targets of the provider, every rule is applied to a line with the budget of the watchdog"""
         credentials: List[Candidate] = []
+        quarantined_rules = self.__quarantined_rules
+        # whole text of target lines to locate pattern rules - used with whole_file option only
+        whole_text: Optional[WholeText] = None
+        profiling = Profiler.enabled
+        start_time = 0.0
 
         for target in provider.yield_analysis_target(self.min_len):
             # Trim string from outer spaces to make future `x in str` checks faster
@@ -178,10 +305,22 @@ class Scanner:
             # cached value to skip the same regex verifying
             matched_regex: Dict[re.Pattern, bool] = {}
 
-            for rule, scanner in self.yield_rule_scanner(target_line_stripped_len, matched_pattern, matched_keyword,
-                                                         matched_pem_key, matched_multi):
-                if rule.has_required_substrings \
-                        and not self._substring_check(rule.required_substrings, target_line_stripped_lower):
+            # single pass over the line gives rules which required substrings are present
+            if profiling:
+                start_time = time.perf_counter()
+            candidate_rules = self.get_candidate_rules(target_line_stripped_lower)
+            if profiling:
+                Profiler.add("prefilter", "required_substrings",
+                             time.perf_counter() - start_time, candidate_rules is not self.__unconditional_rules_order)
+            for rule_index in candidate_rules:
+                if quarantined_rules and rule_index in quarantined_rules:
+                    continue
+                rule, scanner = self.__rules_scanners[rule_index]
+                if target_line_stripped_len < rule.min_line_len \
+                        or not (RuleType.PATTERN == rule.rule_type and matched_pattern
+                                or RuleType.KEYWORD == rule.rule_type and matched_keyword
+                                or RuleType.PEM_KEY == rule.rule_type and matched_pem_key
+                                or RuleType.MULTI == rule.rule_type and matched_multi):
                     continue
 
                 # common regex might be triggered for the same target
@@ -189,17 +328,59 @@ class Scanner:
                     if rule.required_regex in matched_regex:
                         regex_result = matched_regex[rule.required_regex]
                     else:
+                        if profiling:
+                            start_time = time.perf_counter()
                         regex_result = bool(rule.required_regex.search(target_line_stripped))
                         matched_regex[rule.required_regex] = regex_result
+                        if profiling:
+                            Profiler.add("required_regex", rule.rule_name,
+                                         time.perf_counter() - start_time, regex_result)
                     if not regex_result:
                         continue
 
-                if new_credentials := scanner.run(self.config, rule, target):
+                if rule_index in self.__pattern_locators and target.offset is None:
+                    # chunks of long lines are scanned separately
+                    if whole_text is None or whole_text.lines is not target.lines:
+                        # targets of the same lines are yielded in a row
+                        whole_text = WholeText(target.lines)
+                    if not whole_text.is_located(rule_index, self.__pattern_locators[rule_index], target.line_pos):
+                        continue
+
+                if profiling:
+                    start_time = time.perf_counter()
+                if watchdog is None:
+                    new_credentials = scanner.run(self.config, rule, target)
+                else:
+                    new_credentials = self.__run_with_watchdog(watchdog, rule_index, target)
+                if profiling:
+                    Profiler.add("rule", rule.rule_name, time.perf_counter() - start_time, bool(new_credentials))
+                if new_credentials:
                     credentials.extend(new_credentials)
                     logger.debug("Credential for rule: %s in file: %s:%d in line: %s", rule.rule_name, target.file_path,
                                  target.line_num, target.line)
         return credentials
 
+    def __run_with_watchdog(self, watchdog: Watchdog, rule_index: int, target: AnalysisTarget) -> List[Candidate]:
+        """Runs the rule for the target with the budget and skips the rule after RULE_OVERRUNS_LIMIT overruns"""
+        rule, scanner = self.__rules_scanners[rule_index]
+        try:
+            watchdog.start()
+            new_credentials = scanner.run(self.config, rule, target)
+            elapsed = watchdog.stop()
+        except Watchdog.Expired as exc:
+            # candidates of the rule in the line are lost, but the scan goes on
+            new_credentials = []
+            elapsed = exc.args[0]
+        if watchdog.seconds < elapsed:
+            overruns = self.__rule_overruns[rule_index] = 1 + self.__rule_overruns.get(rule_index, 0)
+            # the rule name is the last to keep the message clean for the rules when a log file is scanned
+            logger.warning("%s:%d was scanned for %.3f seconds over budget %s by rule %s", target.file_path,
+                           target.line_num, elapsed, watchdog.seconds, rule.rule_name)
+            if self.RULE_OVERRUNS_LIMIT <= overruns:
+                self.__quarantined_rules.add(rule_index)
+                logger.warning("Skip after %d overruns the rule %s", overruns, rule.rule_name)
+        return new_credentials
+
     @staticmethod
     def get_scanner(rule: Rule) -> Type[ScanType]:
         """Choose type of scanner base on rule affiliation.
@@ -0,0 +1,257 @@
+import base64
+import binascii
+import io
+import json
+import logging
+import os
+import re
+import socket
+import socketserver
+import stat
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from credsweeper import __version__
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import DiffRowType, SERVE_LOCAL_HOSTS, SERVE_REQUEST_SIZE_LIMIT
+from credsweeper.credentials.candidate import Candidate
+from credsweeper.file_handler.content_provider import ContentProvider
+from credsweeper.file_handler.files_provider import FilesProvider
+from credsweeper.file_handler.patches_provider import PatchesProvider
+
+logger = logging.getLogger(__name__)
+
+# HOST:PORT, [HOST]:PORT for IPv6 or PORT only for the loopback interface
+TCP_ADDRESS_PATTERN = re.compile(r"^(?:(?:\[(?P<host6>[0-9A-Fa-f:.]+)\]|(?P<host>[\w.-]+)):)?(?P<port>\d{1,5})$")
+
+
+class _ThreadingHTTPServer6(ThreadingHTTPServer):
+    """HTTP server for IPv6 address"""
+    address_family = socket.AF_INET6
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """Handles requests of the scan server:
+
+    GET /health - status and version of the server
+
+    POST /scan - JSON object with any of fields:
+        "paths": list of files or directories to scan on the server side
+        "data": base64 encoded content with optional "file_path" which is used for the extension and the report
+        "diff": text of a patch with optional "change_type": "added" (default) or "deleted"
+
+    Response is JSON object with "credentials" list in the same format as json report
+
+    """
+
+    server_version = f"CredSweeper/{__version__}"
+
+    def __init__(self, *args, scan_server: "ScanServer", **kwargs) -> None:
+        # the base class handles the request in the constructor
+        self.scan_server = scan_server
+        super().__init__(*args, **kwargs)
+
+    def address_string(self) -> str:
+        """Unix socket has no client address"""
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "local"
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Requests are logged with the logger of the module instead of stderr"""
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def send_json(self, status: HTTPStatus, obj: Any) -> None:
+        """Sends the object as JSON response"""
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json_error(self, status: HTTPStatus, message: str) -> None:
+        """Sends the error as JSON response"""
+        self.send_json(status, {"error": message})
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Health check"""
+        if "/health" == self.path:
+            self.send_json(HTTPStatus.OK, {"status": "ok", "version": __version__})
+        else:
+            self.send_json_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}")
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Scan request"""
+        if "/scan" != self.path:
+            self.send_json_error(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}")
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.send_json_error(HTTPStatus.BAD_REQUEST, "Wrong Content-Length")
+            return
+        if not 0 < length <= SERVE_REQUEST_SIZE_LIMIT:
+            self.send_json_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE if 0 < length else HTTPStatus.LENGTH_REQUIRED,
+                                 f"Request body size must be in range 1..{SERVE_REQUEST_SIZE_LIMIT}")
+            return
+        try:
+            request = json.loads(self.rfile.read(length))
+            credentials = self.scan_server.scan(request)
+        except ValueError as exc:
+            # JSONDecodeError is ValueError too
+            self.send_json_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception(exc)
+            self.send_json_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(exc))
+            return
+        self.send_json(HTTPStatus.OK, {"credentials": credentials})
+
+
+class ScanServer:
+    """Long living scan service on local HTTP or Unix socket.
+
+    Rules, filters and deep scanner of the instance are initialized once in the job processes of the internal pool.
+    ML validator is created when a job is started, so requests are scanned without startup delay. Every request is
+    handled in own thread and its tasks are scanned and validated in the jobs concurrently with other requests.
+
+    """
+
+    def __init__(self, cred_sweeper: CredSweeper, address: str) -> None:
+        """
+        Args:
+            cred_sweeper: configured instance, ML validation is performed in the jobs
+            address: HOST:PORT or PORT to listen with HTTP on a loopback interface, or path of a Unix socket
+
+        """
+        self.cred_sweeper = cred_sweeper
+        # candidates of a task are post processed in the job
+        self.cred_sweeper.ml_in_jobs = True
+        self.pool_count = max(1, cred_sweeper.pool_count)
+        self.__pool: Any = None
+        self.__socket_path: Optional[str] = None
+        self.__server = self.__create_server(address)
+
+    def __create_server(self, address: str) -> socketserver.BaseServer:
+        """Creates HTTP server on TCP or Unix socket according to the address"""
+
+        def handler(*args, **kwargs) -> ScanRequestHandler:
+            return ScanRequestHandler(*args, scan_server=self, **kwargs)
+
+        if match := TCP_ADDRESS_PATTERN.match(address):
+            host = match.group("host6") or match.group("host") or "127.0.0.1"
+            if host not in SERVE_LOCAL_HOSTS:
+                raise ValueError(f"Only loopback host {SERVE_LOCAL_HOSTS} may be used for the server: {address}")
+            server_class = _ThreadingHTTPServer6 if ':' in host else ThreadingHTTPServer
+            server: socketserver.BaseServer = server_class((host, int(match.group("port"))), handler)
+        elif hasattr(socketserver, "ThreadingUnixStreamServer"):
+            if os.path.exists(address):
+                if not stat.S_ISSOCK(os.stat(address).st_mode):
+                    raise ValueError(f"{address} exists and is not a socket")
+                # a socket of previous run
+                os.unlink(address)
+            server = socketserver.ThreadingUnixStreamServer(address, handler)
+            # only the user may send requests
+            os.chmod(address, 0o600)
+            self.__socket_path = address
+        else:
+            raise ValueError(f"Unix socket is not supported on the platform: {address}")
+        server.daemon_threads = True  # type: ignore
+        return server
+
+    @property
+    def address(self) -> Union[str, Tuple[Any, ...]]:
+        """Address which the server listens: socket path or (host, port)"""
+        server_address = self.__server.server_address
+        if isinstance(server_address, (str, tuple)):
+            return server_address
+        # unix socket path may be given as bytes
+        return os.fsdecode(bytes(server_address))
+
+    def start(self) -> None:
+        """Starts the jobs"""
+        if self.__pool is None:
+            logger.info("Start %s jobs", self.pool_count)
+            self.__pool = self.cred_sweeper.get_pool_context().Pool(
+                processes=self.pool_count,  #
+                initializer=CredSweeper.pool_warm_up_initializer,  #
+                initargs=self.cred_sweeper.get_pool_initargs())
+
+    def serve_forever(self) -> None:
+        """Handles requests until shutdown() is called"""
+        self.start()
+        logger.info("Serve on %s", self.address)
+        self.__server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stops serve_forever loop. Must be called from another thread"""
+        self.__server.shutdown()
+
+    def close(self) -> None:
+        """Closes the socket and terminates the jobs"""
+        self.__server.server_close()
+        if self.__socket_path and os.path.exists(self.__socket_path):
+            os.unlink(self.__socket_path)
+            self.__socket_path = None
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+
+    def __enter__(self) -> "ScanServer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get_content_providers(self, request: Any) -> Sequence[ContentProvider]:
+        """Creates providers for the scan request
+
+        Raises:
+            ValueError: the request has wrong format
+
+        """
+        if not isinstance(request, dict):
+            raise ValueError("Request must be JSON object")
+        content_providers: List[ContentProvider] = []
+        if (paths := request.get("paths")) is not None:
+            if not isinstance(paths, list) or not all(isinstance(x, str) for x in paths):
+                raise ValueError("'paths' must be list of strings")
+            content_providers.extend(FilesProvider(paths).get_scannable_files(self.cred_sweeper.config))
+        if (data := request.get("data")) is not None:
+            file_path = request.get("file_path") or ""
+            if not isinstance(data, str) or not isinstance(file_path, str):
+                raise ValueError("'data' and 'file_path' must be strings")
+            try:
+                content = base64.b64decode(data, validate=True)
+            except binascii.Error as exc:
+                raise ValueError(f"'data' must be base64 encoded: {exc}") from exc
+            content_providers.extend(
+                FilesProvider([(file_path, io.BytesIO(content))]).get_scannable_files(self.cred_sweeper.config))
+        if (diff := request.get("diff")) is not None:
+            change_type = request.get("change_type", DiffRowType.ADDED.value)
+            if not isinstance(diff, str) or change_type not in [x.value for x in DiffRowType]:
+                raise ValueError(f"'diff' must be string and 'change_type' one of {[x.value for x in DiffRowType]}")
+            patches_provider = PatchesProvider([io.BytesIO(diff.encode())], change_type=DiffRowType(change_type))
+            content_providers.extend(patches_provider.get_scannable_files(self.cred_sweeper.config))
+        if not any(x in request for x in ("paths", "data", "diff")):
+            raise ValueError("Request must contain 'paths', 'data' or 'diff'")
+        return content_providers
+
+    def scan(self, request: Any) -> List[Dict[str, Any]]:
+        """Scans the request in the jobs and returns found credentials in JSON format"""
+        content_providers = self.get_content_providers(request)
+        self.start()
+        async_results = [
+            self.__pool.apply_async(CredSweeper.pool_files_scan, (task, ))
+            for task in CredSweeper.get_pool_tasks(content_providers, self.pool_count)
+        ]
+        credentials: List[Candidate] = []
+        for async_result in async_results:
+            _pid, _busy_time, scan_results = async_result.get()
+            credentials.extend(self.cred_sweeper.candidates_serializer.loads(scan_results))
+        if self.cred_sweeper.sort_output:
+            CredSweeper.sort_credentials(credentials)
+        return [x.to_json(hashed=self.cred_sweeper.hashed, subtext=self.cred_sweeper.subtext) for x in credentials]
@@ -0,0 +1,110 @@
+import contextlib
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union, IO
+
+logger = logging.getLogger(__name__)
+
+
+class GitBlobReader:
+    """Reads objects of a git repository in batches with long-lived ``git cat-file`` processes.
+
+    Object names of a batch are written to the process in a thread while the responses are read, so a batch costs
+    one round trip instead of one round trip per object like GitPython streams do. Sizes are read with
+    ``--batch-check`` without the data, so oversize blobs may be skipped before reading.
+
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Args:
+            path: path to the repository, the processes are started on demand
+
+        """
+        self.__path = str(path)
+        self.__processes: Dict[str, subprocess.Popen] = {}
+        # the processes are waited and their pipes are closed with the stack
+        self.__exit_stack = contextlib.ExitStack()
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminates the git processes"""
+        for process in self.__processes.values():
+            if process.stdin is not None:
+                try:
+                    process.stdin.close()
+                except OSError as exc:
+                    # unwritten requests of a dead process
+                    logger.debug("git cat-file was terminated: %s", exc)
+        self.__processes.clear()
+        self.__exit_stack.close()
+
+    def __get_process(self, batch_option: str) -> subprocess.Popen:
+        """Returns the process of git cat-file with the option, starts it when necessary"""
+        if (process := self.__processes.get(batch_option)) is None or process.poll() is not None:
+            process = self.__exit_stack.enter_context(
+                subprocess.Popen(["git", "-C", self.__path, "cat-file", batch_option],
+                                 stdin=subprocess.PIPE,
+                                 stdout=subprocess.PIPE))
+            self.__processes[batch_option] = process
+        return process
+
+    @staticmethod
+    def __write(stdin: IO[bytes], object_names: Sequence[str]) -> None:
+        """Writes the requests of a batch"""
+        try:
+            stdin.write(''.join(f"{x}\n" for x in object_names).encode())
+            stdin.flush()
+        except OSError as exc:
+            # the process is dead, the reader receives EOF
+            logger.error("Cannot write to git cat-file: %s", exc)
+
+    def __batch(self, batch_option: str, object_names: Sequence[str],
+                read_data: bool) -> Dict[str, Tuple[Optional[int], Optional[bytes]]]:
+        """Sends the object names to the process and reads size and optionally data of every object"""
+        result: Dict[str, Tuple[Optional[int], Optional[bytes]]] = {}
+        if not object_names:
+            return result
+        process = self.__get_process(batch_option)
+        assert process.stdin is not None and process.stdout is not None
+        writer = threading.Thread(target=self.__write, args=(process.stdin, object_names), daemon=True)
+        writer.start()
+        try:
+            for object_name in object_names:
+                # "<sha> <type> <size>" or "<object> missing"
+                fields = process.stdout.readline().split()
+                if not fields:
+                    raise RuntimeError(f"git cat-file {batch_option} was terminated in {self.__path}")
+                if 3 != len(fields):
+                    logger.warning("Object %s is missing in %s", object_name, self.__path)
+                    result[object_name] = (None, None)
+                    continue
+                size = int(fields[2])
+                data: Optional[bytes] = None
+                if read_data:
+                    data = process.stdout.read(size)
+                    # every data is terminated with line feed
+                    process.stdout.read(1)
+                result[object_name] = (size, data)
+        except Exception:
+            # the responses of the process are out of sync with the requests
+            process.kill()
+            raise
+        finally:
+            writer.join()
+        return result
+
+    def get_sizes(self, object_names: Sequence[str]) -> Dict[str, Optional[int]]:
+        """Returns sizes of the objects, None for missing objects"""
+        return {k: v[0] for k, v in self.__batch("--batch-check", object_names, False).items()}
+
+    def read(self, object_names: Sequence[str]) -> Dict[str, Optional[bytes]]:
+        """Returns data of the objects, None for missing objects"""
+        return {k: v[1] for k, v in self.__batch("--batch", object_names, True).items()}
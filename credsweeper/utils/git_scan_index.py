@@ -0,0 +1,85 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Union
+
+from credsweeper.credentials.candidate import Candidate
+from credsweeper.credentials.candidates_serializer import CandidatesSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class GitScanIndex:
+    """Persistent index of scanned git commits and blobs in sqlite database.
+
+    A commit is stored after all its changed blobs were scanned, so reruns skip the commit. Post processed credentials
+    of a blob are stored with the blob sha and the path - rules and filters depend on the path. The same blob in
+    other commits, branches or repositories is not read and scanned again and its credentials are reported for every
+    commit which introduced it. The index is cleared when the fingerprint of settings is changed.
+
+    """
+
+    def __init__(self, path: Union[str, Path], fingerprint: str, serializer: CandidatesSerializer) -> None:
+        """
+        Args:
+            path: file of the database, may be shared between runs for different repositories
+            fingerprint: hash of all settings which affect scan results
+            serializer: serializer of candidates for current rules and config
+
+        """
+        self.__serializer = serializer
+        self.hits = 0
+        self.misses = 0
+        # concurrent runs with the same index wait for a lock
+        self.__connection = sqlite3.connect(str(path), timeout=60)
+        with self.__connection:
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS commits (sha TEXT PRIMARY KEY)")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS blobs"
+                                      " (sha TEXT, path TEXT, credentials BLOB, PRIMARY KEY (sha, path))")
+            row = self.__connection.execute("SELECT value FROM settings WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                if row is not None:
+                    logger.info("Settings were changed, the index %s is cleared", path)
+                self.__connection.execute("DELETE FROM commits")
+                self.__connection.execute("DELETE FROM blobs")
+                self.__connection.execute("INSERT OR REPLACE INTO settings VALUES ('fingerprint', ?)", (fingerprint, ))
+
+    def __enter__(self) -> "GitScanIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database. Blobs of a commit which was not added are discarded"""
+        self.__connection.rollback()
+        self.__connection.close()
+
+    def is_commit_scanned(self, sha: str) -> bool:
+        """Returns True when the commit was added to the index"""
+        return self.__connection.execute("SELECT 1 FROM commits WHERE sha = ?", (sha, )).fetchone() is not None
+
+    def add_commit(self, sha: str) -> None:
+        """Stores the commit and the blobs added before in one transaction"""
+        self.__connection.execute("INSERT OR IGNORE INTO commits VALUES (?)", (sha, ))
+        self.__connection.commit()
+
+    def get_blob(self, sha: str, path: str) -> Optional[List[Candidate]]:
+        """Returns stored credentials of the blob or None if the blob was not scanned or the entry is broken"""
+        row = self.__connection.execute("SELECT credentials FROM blobs WHERE sha = ? AND path = ?",
+                                        (sha, path)).fetchone()
+        if row is not None:
+            try:
+                credentials = self.__serializer.loads(row[0])
+                self.hits += 1
+                return credentials
+            except Exception as exc:
+                logger.warning("Broken index entry %s %s: %s", sha, path, exc)
+        self.misses += 1
+        return None
+
+    def add_blob(self, sha: str, path: str, credentials: List[Candidate]) -> None:
+        """Stores post processed credentials of the blob. The entry is committed with add_commit"""
+        self.__connection.execute("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?)",
+                                  (sha, path, self.__serializer.dumps(credentials)))
@@ -0,0 +1,151 @@
+import codecs
+import contextlib
+import logging
+import mmap
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional, Union, Iterator, List, Tuple
+
+import numpy as np
+
+from credsweeper.common.constants import UTF_8, LATIN_1, MAX_LINE_LENGTH
+from credsweeper.utils.util import Util
+
+logger = logging.getLogger(__name__)
+
+
+class MappedLines(Sequence):
+    """Lines of a memory-mapped file which are decoded on access.
+
+    Only offsets of the lines are kept in memory. Line endings LF, CRLF, CR are processed like in Util.split_text,
+    so the lines are the same as for decoded text. UTF-16 is not supported because line endings are multibyte.
+
+    """
+
+    # size of the mapped data part to be processed at once during encoding check and lines offsets search
+    CHUNK_SIZE = 1 << 24
+
+    def __init__(self, exit_stack: contextlib.ExitStack, data: mmap.mmap, encoding: str) -> None:
+        # the stack closes the map and the file
+        self.__exit_stack = exit_stack
+        self.__data = data
+        self.__encoding = encoding
+        if encoding:
+            self.__starts, self.__ends = self.get_offsets(data)
+        else:
+            # binary data has no lines
+            self.__starts = self.__ends = np.empty(0, dtype=np.int64)
+        # the last decoded line is kept because a line is requested twice for a target
+        self.__last: Tuple[int, str] = (-1, '')
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> Optional["MappedLines"]:
+        """Maps the file and returns lines or None when the file cannot be processed without full decoding"""
+        try:
+            with contextlib.ExitStack() as exit_stack:
+                file = exit_stack.enter_context(open(path, "rb"))
+                data = exit_stack.enter_context(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                head = data[:2]
+                if head.startswith(b"\xFF\xFE") or head.startswith(b"\xFE\xFF") or head.startswith(b'\x00') \
+                        or 1 < len(head) and 0 == head[1]:
+                    # UTF-16 is decoded as whole text
+                    encoding = None
+                else:
+                    encoding = cls.get_encoding(data)
+                if encoding is not None:
+                    # the map and the file are kept open until close of the lines
+                    return cls(exit_stack.pop_all(), data, encoding)
+        except Exception as exc:
+            logger.warning("Cannot map '%s': %s", path, exc)
+        return None
+
+    @classmethod
+    def get_encoding(cls, data: mmap.mmap) -> Optional[str]:
+        """Returns encoding of data like Util.decode_text does or empty string for binary data.
+
+        UTF-8 is validated by chunks without keeping of decoded text. The refurbish test is skipped because
+        encoding of valid UTF-8 and LATIN-1 text always gives the same bytes. LATIN-1 is checked with a sample.
+
+        """
+        decoder = codecs.getincrementaldecoder(UTF_8)(errors="strict")
+        try:
+            for offset in range(0, len(data), cls.CHUNK_SIZE):
+                decoder.decode(data[offset:offset + cls.CHUNK_SIZE])
+            decoder.decode(b'', final=True)
+            return UTF_8
+        except UnicodeError:
+            logger.debug("UnicodeError: Can't decode content as %s.", UTF_8)
+        # binary and LATIN-1 detection uses only begin of data
+        sample = data[:MAX_LINE_LENGTH]
+        if Util.is_binary(sample) or not Util.is_latin1(sample):
+            return ''
+        return LATIN_1
+
+    @classmethod
+    def get_offsets(cls, data: mmap.mmap) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns arrays of start and end offsets of all lines"""
+        size = len(data)
+        ends_list: List[np.ndarray] = []
+        starts_list: List[np.ndarray] = [np.zeros(1, dtype=np.int64)]
+        # CRLF may be split between chunks
+        skip_lf = False
+        for offset in range(0, size, cls.CHUNK_SIZE):
+            # the copy of the part is used to avoid exported buffer of the map
+            chunk = np.frombuffer(data[offset:offset + cls.CHUNK_SIZE + 1], dtype=np.uint8)
+            chunk_size = min(cls.CHUNK_SIZE, size - offset)
+            lf = np.flatnonzero(chunk[:chunk_size] == 0x0A)
+            if skip_lf and lf.size and 0 == lf[0]:
+                lf = lf[1:]
+            cr = np.flatnonzero(chunk[:chunk_size] == 0x0D)
+            skip_lf = bool(chunk_size < chunk.size and 0x0D == chunk[chunk_size - 1] and 0x0A == chunk[chunk_size])
+            if cr.size:
+                # CRLF is a single line ending, the next byte for the last CR is in the copy
+                next_pos = cr + 1
+                crlf = np.zeros(cr.size, dtype=bool)
+                in_range = next_pos < chunk.size
+                crlf[in_range] = 0x0A == chunk[next_pos[in_range]]
+                lf = np.setdiff1d(lf, next_pos[crlf], assume_unique=True)
+                ends = np.concatenate((cr, lf))
+                lengths = np.concatenate((1 + crlf.astype(np.int64), np.ones(lf.size, dtype=np.int64)))
+                order = np.argsort(ends, kind="stable")
+                ends = ends[order].astype(np.int64) + offset
+                starts = ends + lengths[order]
+            else:
+                ends = lf.astype(np.int64) + offset
+                starts = ends + 1
+            ends_list.append(ends)
+            starts_list.append(starts)
+        ends_list.append(np.array([size], dtype=np.int64))
+        return np.concatenate(starts_list), np.concatenate(ends_list)
+
+    @property
+    def encoding(self) -> str:
+        """encoding getter - empty string for binary data"""
+        return self.__encoding
+
+    def close(self) -> None:
+        """Closes the map and the file"""
+        self.__exit_stack.close()
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def __get_line(self, index: int) -> str:
+        if self.__last[0] != index:
+            line = self.__data[int(self.__starts[index]):int(self.__ends[index])].decode(self.__encoding)
+            self.__last = (index, line)
+        return self.__last[1]
+
+    def __getitem__(self, index):  # type: ignore
+        size = len(self)
+        if isinstance(index, slice):
+            return [self.__get_line(x) for x in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("line index out of range")
+        return self.__get_line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.__get_line(index)
@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from credsweeper.utils.util import Util
+
+
+class Profiler:
+    """Counters of calls, hits and time for stages of the scan in the process.
+
+    The stages are grouped in sections: prefilter of required substrings of all rules, required_regex and run of
+    every rule, every filter class, every deep scanner class and ML feature extraction and inference. A hit is
+    a positive result of the stage: a rule is selected, a regex or a rule found something, a filter rejected
+    a candidate, a deep scanner recognised the data. For ML the hits are numbers of validated groups.
+    Time of a rule includes its filters and time of a deep scanner includes nested scans.
+
+    The counters are updated only when `enabled` is True, so instrumented code checks the flag before it reads
+    the clock and the overhead of disabled profiler is a check of a boolean.
+
+    """
+
+    enabled = False
+
+    # section: name: [calls, hits, seconds]
+    __counters: Dict[str, Dict[str, List[float]]] = {}
+
+    @staticmethod
+    def add(section: str, name: str, seconds: float, hits: Union[bool, int]) -> None:
+        """Adds a call of the stage"""
+        section_counters = Profiler.__counters.get(section)
+        if section_counters is None:
+            section_counters = Profiler.__counters[section] = {}
+        counter = section_counters.get(name)
+        if counter is None:
+            counter = section_counters[name] = [0, 0, 0.0]
+        counter[0] += 1
+        counter[1] += hits
+        counter[2] += seconds
+
+    @staticmethod
+    def get_counters() -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Returns the counters to send them to other process or to save"""
+        return {
+            section: {
+                name: {
+                    "calls": int(calls),
+                    "hits": int(hits),
+                    "seconds": seconds
+                }
+                for name, (calls, hits, seconds) in section_counters.items()
+            }
+            for section, section_counters in Profiler.__counters.items()
+        }
+
+    @staticmethod
+    def merge(counters: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Adds counters of other process"""
+        for section, section_counters in counters.items():
+            for name, counter in section_counters.items():
+                own = Profiler.__counters.setdefault(section, {}).setdefault(name, [0, 0, 0.0])
+                own[0] += int(counter.get("calls", 0))
+                own[1] += int(counter.get("hits", 0))
+                own[2] += float(counter.get("seconds", 0.0))
+
+    @staticmethod
+    def reset() -> None:
+        """Clears all counters"""
+        Profiler.__counters = {}
+
+    @staticmethod
+    def get_table() -> str:
+        """Returns text table of the counters sorted by time in descending order"""
+        # section, name, calls, hits, seconds
+        rows: List[Tuple[str, str, float, float, float]] = []
+        for section, section_counters in Profiler.__counters.items():
+            for name, (calls, hits, seconds) in section_counters.items():
+                rows.append((section, name, calls, hits, seconds))
+        rows.sort(key=lambda x: x[4], reverse=True)
+        name_width = max([len("stage")] + [len(f"{x[0]}:{x[1]}") for x in rows])
+        lines = [f"{'stage':<{name_width}} {'calls':>12} {'hits':>12} {'seconds':>12} {'us/call':>10}"]
+        for section, name, calls, hits, seconds in rows:
+            per_call = 1000000 * seconds / calls if calls else 0.0
+            lines.append(f"{section + ':' + name:<{name_width}} {int(calls):>12} {int(hits):>12} {seconds:>12.3f}"
+                         f" {per_call:>10.1f}")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def save(file_path: Union[str, Path]) -> None:
+        """Writes the counters to JSON file"""
+        Util.json_dump(Profiler.get_counters(), file_path)
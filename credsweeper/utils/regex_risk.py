@@ -0,0 +1,85 @@
+import re
+from typing import Any, Iterator, List, Set, Tuple
+
+try:
+    # the parser of re module is the only way to walk a pattern, it is private since python 3.11
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # pragma: no cover
+    # python 3.10
+    import sre_parse  # type: ignore  # pylint: disable=deprecated-module
+
+
+class RegexRisk:
+    """Static analysis of a regular expression for constructions which may backtrack super-linearly.
+
+    The analysis walks the parsed pattern and reports:
+        nested quantifier - a wide repetition of a subpattern which has a variable repetition itself, e.g. (\\w+\\s?)+
+            so the same text may be split between the repetitions in many ways;
+        lookaround in repetition - a lookahead or lookbehind is checked for every repeated item of a wide repetition,
+            e.g. (.(?!x)){4,8000}, then the cost of a match is a product of the lengths;
+        backreference in repetition - the same for a group reference, e.g. (.(?!(?P=lq))){4,8000}.
+
+    A repetition is wide when the difference of its maximal and minimal counts is WIDE_REPEAT or more.
+    The report is a hint for authors of rules: a flagged pattern is not always slow and an unflagged one is not
+    always fast.
+
+    """
+
+    WIDE_REPEAT = 32
+
+    NESTED_QUANTIFIER = "nested quantifier"
+    LOOKAROUND_IN_REPETITION = "lookaround in repetition"
+    BACKREFERENCE_IN_REPETITION = "backreference in repetition"
+
+    __REPEATS = {"MAX_REPEAT", "MIN_REPEAT"}
+    __ASSERTS = {"ASSERT", "ASSERT_NOT"}
+    # python 3.11 and later
+    __NO_BACKTRACKING = {"ATOMIC_GROUP", "POSSESSIVE_REPEAT"}
+
+    @staticmethod
+    def analyze(pattern: re.Pattern) -> List[str]:
+        """Returns sorted names of risky constructions found in the pattern"""
+        risks: Set[str] = set()
+        RegexRisk.__walk(sre_parse.parse(pattern.pattern, pattern.flags), False, risks)
+        return sorted(risks)
+
+    @staticmethod
+    def __items(items: Any) -> Iterator[Tuple[str, Any]]:
+        """Yields names of operations with their arguments, so the walk does not depend on constants of the parser"""
+        for op, av in items:
+            yield op.name, av
+
+    @staticmethod
+    def __walk(items: Any, in_wide_repeat: bool, risks: Set[str]) -> bool:
+        """Collects risks of parsed items and returns True when the items have a variable repetition"""
+        variable = False
+        for op, av in RegexRisk.__items(items):
+            if op in RegexRisk.__REPEATS:
+                min_count, max_count, subpattern = av
+                wide_repeat = RegexRisk.WIDE_REPEAT <= max_count - min_count
+                inner_variable = RegexRisk.__walk(subpattern, in_wide_repeat or wide_repeat, risks)
+                if inner_variable and wide_repeat:
+                    risks.add(RegexRisk.NESTED_QUANTIFIER)
+                variable |= inner_variable or min_count < max_count
+            elif op in RegexRisk.__ASSERTS:
+                if in_wide_repeat:
+                    risks.add(RegexRisk.LOOKAROUND_IN_REPETITION)
+                variable |= RegexRisk.__walk(av[1], in_wide_repeat, risks)
+            elif "GROUPREF" == op:
+                if in_wide_repeat:
+                    risks.add(RegexRisk.BACKREFERENCE_IN_REPETITION)
+            elif "GROUPREF_EXISTS" == op:
+                if in_wide_repeat:
+                    risks.add(RegexRisk.BACKREFERENCE_IN_REPETITION)
+                for branch in av[1:]:
+                    if branch is not None:
+                        variable |= RegexRisk.__walk(branch, in_wide_repeat, risks)
+            elif "SUBPATTERN" == op:
+                variable |= RegexRisk.__walk(av[-1], in_wide_repeat, risks)
+            elif "BRANCH" == op:
+                for branch in av[1]:
+                    variable |= RegexRisk.__walk(branch, in_wide_repeat, risks)
+            elif op in RegexRisk.__NO_BACKTRACKING:
+                # atomic group and possessive repetition of python 3.11 do not give back the matched text
+                RegexRisk.__walk(av if "ATOMIC_GROUP" == op else av[-1], in_wide_repeat, risks)
+        return variable
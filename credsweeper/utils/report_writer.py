@@ -0,0 +1,136 @@
+import contextlib
+import json
+from pathlib import Path
+from typing import List, Optional, Union, Any, TextIO
+
+from colorama import Style
+
+from credsweeper.common.constants import DiffRowType, DEFAULT_ENCODING
+from credsweeper.credentials.candidate import Candidate
+
+# suffix of a report file in JSON Lines format - one compact object per line
+JSONL_SUFFIX = ".jsonl"
+
+
+class ReportWriter:
+    """Writes credentials to the reports incrementally.
+
+    JSON report is written as an array item by item and JSONL report - one object per line, so credentials may be
+    released after writing. XLSX report is created from all rows at once, so the rows are kept until close.
+
+    """
+
+    def __init__(
+            self,  #
+            json_filename: Union[None, str, Path] = None,  #
+            xlsx_filename: Union[None, str, Path] = None,  #
+            stdout: bool = False,  #
+            color: bool = False,  #
+            hashed: bool = False,  #
+            subtext: bool = False,  #
+            change_type: Optional[DiffRowType] = None) -> None:
+        """
+        Args:
+            json_filename: optional path to save result to json or jsonl
+            xlsx_filename: optional path to save result to xlsx
+            stdout: print results to stdout
+            color: print concise results to stdout with colorization
+            hashed: use hash of line, value and variable instead plain text
+            subtext: use subtext of line near variable-value like it performed in ML
+            change_type: flag to know which file should be created for a patch
+
+        """
+        self.__json_path: Optional[Path] = None
+        if json_filename:
+            self.__json_path = Path(json_filename)
+            if isinstance(change_type, DiffRowType):
+                # add suffix for appropriated reports to create two files for the patch scan
+                self.__json_path = self.__json_path.with_suffix(f".{change_type.value}{self.__json_path.suffix}")
+        self.__jsonl = bool(self.__json_path and JSONL_SUFFIX == self.__json_path.suffix.lower())
+        self.__json_file: Optional[TextIO] = None
+        # the report file is kept open between writes and is closed with the stack
+        self.__exit_stack = contextlib.ExitStack()
+        self.__xlsx_filename = xlsx_filename
+        self.__xlsx_rows: List[dict] = []
+        self.__stdout = stdout
+        self.__color = color
+        self.__hashed = hashed
+        self.__subtext = subtext
+        self.__change_type = change_type
+        self.count = 0
+
+    def __enter__(self) -> "ReportWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Creates the json report file"""
+        if self.__json_path and self.__json_file is None:
+            self.__json_file = self.__exit_stack.enter_context(open(self.__json_path, 'w', encoding=DEFAULT_ENCODING))
+            if not self.__jsonl:
+                self.__json_file.write('[\n')
+
+    def write(self, credentials: List[Candidate]) -> None:
+        """Writes the credentials to json and console and keeps rows for xlsx"""
+        if self.__json_file is not None:
+            for credential in credentials:
+                credential_json = credential.to_json(hashed=self.__hashed, subtext=self.__subtext)
+                if self.__jsonl:
+                    self.__json_file.write(json.dumps(credential_json))
+                    self.__json_file.write('\n')
+                else:
+                    if self.count:
+                        self.__json_file.write(",\n")
+                    self.__json_file.write(json.dumps(credential_json, indent=4))
+                self.count += 1
+            self.__json_file.flush()
+        else:
+            self.count += len(credentials)
+
+        if self.__xlsx_filename:
+            for credential in credentials:
+                self.__xlsx_rows.extend(credential.to_dict_list(hashed=self.__hashed, subtext=self.__subtext))
+
+        if self.__color:
+            for credential in credentials:
+                for line_data in credential.line_data_list:
+                    # bright rule name and path or info
+                    if isinstance(credential.ml_probability, float):
+                        ml_probability_info = f" {credential.ml_probability:.6f}"
+                    else:
+                        ml_probability_info = ""
+                    print(Style.BRIGHT + credential.rule_name +
+                          f" {line_data.info or line_data.path}:{line_data.line_num}{ml_probability_info}" +
+                          Style.RESET_ALL)
+                    print(line_data.get_colored_line(hashed=self.__hashed, subtext=self.__subtext))
+
+        if self.__stdout:
+            for credential in credentials:
+                print(credential.to_str(hashed=self.__hashed, subtext=self.__subtext))
+
+    def close(self) -> None:
+        """Finalizes the json report and saves xlsx report"""
+        if self.__json_file is not None:
+            if not self.__jsonl:
+                self.__json_file.write("\n]")
+            self.__json_file = None
+        self.__exit_stack.close()
+
+        if self.__xlsx_filename:
+            # pandas is imported on demand because the import is slow
+            import pandas as pd  # pylint: disable=import-outside-toplevel
+            df = pd.DataFrame(data=self.__xlsx_rows)
+            if isinstance(self.__change_type, DiffRowType):
+                if Path(self.__xlsx_filename).exists():
+                    with pd.ExcelWriter(self.__xlsx_filename, mode='a', engine="openpyxl",
+                                        if_sheet_exists="replace") as writer:
+                        df.to_excel(writer, sheet_name=self.__change_type.value, index=False)
+                else:
+                    df.to_excel(self.__xlsx_filename, sheet_name=self.__change_type.value, index=False)
+            else:
+                df.to_excel(self.__xlsx_filename, sheet_name="report", index=False)
+            self.__xlsx_filename = None
+            self.__xlsx_rows = []
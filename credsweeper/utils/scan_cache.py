@@ -0,0 +1,180 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Union, Tuple, Sequence
+
+from credsweeper.config.config import Config
+from credsweeper.credentials.candidate import Candidate
+from credsweeper.credentials.candidates_serializer import CandidatesSerializer
+from credsweeper.file_handler.content_provider import ContentProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCache:
+    """Persistent on-disk cache of scan results for content providers.
+
+    Entry key is sha256 of the fingerprint of rules, config and ML model, provider descriptor and the content.
+    Every entry is a file with pickled list of candidates. The directory may be writable by others, so only classes
+    of candidates are allowed during unpickling. Modification time of the file is updated on every hit,
+    so eviction by age and by size removes least recently used entries.
+
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(
+            self,  #
+            path: Union[str, Path],  #
+            fingerprint: str,  #
+            config: Config,  #
+            size_limit: Optional[int] = None,  #
+            age_limit: Optional[int] = None,  #
+            pattern_lists: Optional[Sequence[List[re.Pattern]]] = None) -> None:
+        """
+        Args:
+            path: directory of the cache
+            fingerprint: hash of all settings which affect scan results
+            config: current config is not stored in entries and restored from the argument
+            size_limit: maximal total size of entries in bytes
+            age_limit: maximal time in seconds since last access of an entry
+            pattern_lists: patterns of the rules are stored as references too - the fingerprint must cover the rules
+
+        """
+        self.__path = Path(path)
+        self.__fingerprint = fingerprint.encode()
+        self.__serializer = CandidatesSerializer(config, pattern_lists)
+        self.__size_limit = size_limit
+        self.__age_limit = age_limit
+        self.hits = 0
+        self.misses = 0
+        self.__path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path:
+        """path getter"""
+        return self.__path
+
+    @staticmethod
+    def get_fingerprint(*items: Union[None, str, bytes]) -> str:
+        """Returns hash of items to be used as fingerprint of scan settings"""
+        sha256 = hashlib.sha256()
+        for item in items:
+            if item is None:
+                sha256.update(b"\x00")
+            else:
+                data = item.encode() if isinstance(item, str) else item
+                sha256.update(len(data).to_bytes(8, "little"))
+                sha256.update(data)
+        return sha256.hexdigest()
+
+    def get_key(self, content_provider: ContentProvider) -> Optional[str]:
+        """Returns key of the entry for content provider or None if the provider has no data"""
+        try:
+            digest = content_provider.get_digest()
+        except NotImplementedError:
+            # the providers with lines only are not cached
+            return None
+        if digest is None:
+            return None
+        descriptor = content_provider.descriptor
+        return ScanCache.get_fingerprint(self.__fingerprint, descriptor.path, descriptor.extension, descriptor.info,
+                                         digest)
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Entries are distributed in subdirectories to avoid huge directory"""
+        return self.__path / key[:2] / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[List[Candidate]]:
+        """Returns stored candidates for the key or None if the entry is absent or broken"""
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                candidates = self.__serializer.load(f)
+            # update access time for eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as exc:
+            logger.warning("Broken cache entry %s: %s", entry_path, exc)
+            entry_path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return candidates
+
+    def put(self, key: str, candidates: List[Candidate]) -> None:
+        """Stores candidates for the key. The file is written atomically to be shared between processes"""
+        entry_path = self._get_entry_path(key)
+        try:
+            data = self.__serializer.dumps(candidates)
+            entry_path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as exc:
+            logger.warning("Cannot store cache entry %s: %s", entry_path, exc)
+
+    def _get_entries(self) -> List[Tuple[float, int, str]]:
+        """Returns list of access time, size and path of all entries"""
+        entries: List[Tuple[float, int, str]] = []
+        for subdir in os.scandir(self.__path):
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir.path):
+                if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self) -> int:
+        """Removes entries older than age limit and the oldest entries above size limit
+
+        Return:
+            number of removed entries
+
+        """
+        if self.__size_limit is None and self.__age_limit is None:
+            return 0
+        entries = self._get_entries()
+        removed = 0
+        if self.__age_limit is not None:
+            expired = time.time() - self.__age_limit
+            actual_entries = []
+            for entry in entries:
+                if entry[0] < expired:
+                    removed += self._remove(entry[2])
+                else:
+                    actual_entries.append(entry)
+            entries = actual_entries
+        if self.__size_limit is not None:
+            total_size = sum(x[1] for x in entries)
+            # the oldest entries are removed first
+            entries.sort()
+            for _mtime, size, path in entries:
+                if self.__size_limit >= total_size:
+                    break
+                removed += self._remove(path)
+                total_size -= size
+        logger.info("Evicted %d cache entries from %s", removed, self.__path)
+        return removed
+
+    @staticmethod
+    def _remove(path: str) -> int:
+        """Removes the entry file and returns 1 on success"""
+        try:
+            os.remove(path)
+            return 1
+        except OSError as exc:
+            logger.warning("Cannot remove cache entry %s: %s", path, exc)
+        return 0
@@ -0,0 +1,79 @@
+import re
+from typing import Dict, Iterable, Generator, Set, Tuple, Any
+
+
+class SubstringMatcher:
+    """Multi-substring matcher which finds all given words in a text with single pass.
+
+    The words are combined into a trie which is compiled to a regular expression wrapped in a lookahead,
+    so the regex engine checks every position of the text once and returns the longest word starting there.
+    All shorter words which are prefixes of the found one are present at the position too.
+
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.__words: Set[str] = set(x for x in words if x)
+        # every word is mapped to the set of words which are prefixes of the word (including itself)
+        self.__prefixes: Dict[str, Tuple[str, ...]] = {}
+        for word in self.__words:
+            self.__prefixes[word] = tuple(word[:i] for i in range(1, 1 + len(word)) if word[:i] in self.__words)
+        if self.__words:
+            trie: Dict[str, Any] = {}
+            for word in self.__words:
+                node = trie
+                for char in word:
+                    node = node.setdefault(char, {})
+                # empty key marks the end of a word
+                node[''] = {}
+            self.__pattern = re.compile(f"(?=({SubstringMatcher._trie_to_regex(trie)}))", flags=re.DOTALL)
+        else:
+            self.__pattern = None
+
+    @staticmethod
+    def _trie_to_regex(node: Dict[str, Any]) -> str:
+        """Transforms a trie node to regex with longest match preference"""
+        terminal = '' in node
+        branches = [re.escape(k) + SubstringMatcher._trie_to_regex(v) for k, v in sorted(node.items()) if k]
+        if not branches:
+            return ''
+        if 1 == len(branches):
+            result = branches[0]
+            if terminal:
+                result = f"(?:{result})?" if 1 < len(result) else f"{result}?"
+        else:
+            result = f"(?:{'|'.join(branches)})"
+            if terminal:
+                result += '?'
+        return result
+
+    @property
+    def words(self) -> Set[str]:
+        """words getter"""
+        return self.__words
+
+    def prefixes(self, word: str) -> Tuple[str, ...]:
+        """Returns all words which are prefixes of the given word in the matcher"""
+        return self.__prefixes.get(word, ())
+
+    def iter_longest(self, text: str) -> Generator[Tuple[int, str], None, None]:
+        """Yields position and longest word found at the position"""
+        if self.__pattern is not None:
+            for match in self.__pattern.finditer(text):
+                yield match.start(), match.group(1)
+
+    def find_iter(self, text: str) -> Generator[Tuple[int, str], None, None]:
+        """Yields all occurrences (position, word) including overlapped words in order of position"""
+        for pos, longest in self.iter_longest(text):
+            for word in self.__prefixes[longest]:
+                yield pos, word
+
+    def find_all(self, text: str) -> Set[str]:
+        """Returns set of all words found in the text"""
+        result: Set[str] = set()
+        for _pos, longest in self.iter_longest(text):
+            result.update(self.__prefixes[longest])
+        return result
+
+    def search(self, text: str) -> bool:
+        """Returns True if any word is found in the text"""
+        return self.__pattern is not None and self.__pattern.search(text) is not None
@@ -0,0 +1,63 @@
+import logging
+import signal
+import threading
+from types import FrameType
+from typing import Optional, Any
+
+logger = logging.getLogger(__name__)
+
+
+class TimeLimit:
+    """Context manager to interrupt a block of code which is running too long.
+
+    Real-time interval timer of the process raises TimeLimit.Expired in the main thread, so Python code of a parser is
+    interrupted at once and a call of C code is interrupted after return. The limit is not applied on platforms without
+    setitimer, in other threads and inside another limited block - the outer limit is effective for the block.
+
+    """
+
+    class Expired(BaseException):
+        """The time of the block is over. The first argument is the limit which has expired.
+
+        BaseException is used to pass through broad exception handlers of the parsers.
+
+        """
+
+    # the limit with active timer
+    __owner: Optional["TimeLimit"] = None
+
+    def __init__(self, seconds: Optional[float]) -> None:
+        """
+        Args:
+            seconds: time limit of the block, no limit for None or zero
+
+        """
+        self.__seconds = seconds
+        self.__previous_handler: Any = None
+
+    def __enter__(self) -> "TimeLimit":
+        if not self.__seconds or TimeLimit.__owner is not None:
+            return self
+        if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+            logger.debug("Time limit %s is not supported in %s", self.__seconds, threading.current_thread().name)
+            return self
+        self.__previous_handler = signal.signal(signal.SIGALRM, self.__expire)
+        TimeLimit.__owner = self
+        signal.setitimer(signal.ITIMER_REAL, self.__seconds)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if TimeLimit.__owner is self:
+            self.__release()
+
+    def __release(self) -> None:
+        """Stops the timer and restores the signal handler"""
+        TimeLimit.__owner = None
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self.__previous_handler)
+
+    def __expire(self, _signum: int, _frame: Optional[FrameType]) -> None:
+        """SIGALRM handler. The signal may arrive after the exit from the block, then it is ignored"""
+        if TimeLimit.__owner is self:
+            self.__release()
+            raise TimeLimit.Expired(self)
@@ -10,31 +10,20 @@ import re
 import string
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional, Union
+from typing import Any, Dict, List, Tuple, Optional, Union, TYPE_CHECKING
 
 import numpy as np
 import yaml
 from cryptography.utils import CryptographyDeprecationWarning
 
 warnings.filterwarnings("ignore", category=CryptographyDeprecationWarning)  # TODO: remove with DH
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.asymmetric.dh import DHPrivateKey, DHPublicKey
-from cryptography.hazmat.primitives.asymmetric.dsa import DSAPrivateKey, DSAPublicKey
-from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey, EllipticCurvePublicKey
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
-from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey, Ed448PublicKey
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
-from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
-from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey, X25519PrivateKey
-from cryptography.hazmat.primitives.asymmetric.x448 import X448PublicKey, X448PrivateKey
-from cryptography.hazmat.primitives.serialization import load_der_private_key
-from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
-from lxml import etree
 
 from credsweeper.common.constants import AVAILABLE_ENCODINGS, \
     DEFAULT_ENCODING, LATIN_1, CHUNK_SIZE, MAX_LINE_LENGTH, CHUNK_STEP_SIZE, ASCII, UTF_16_LE, UTF_16_BE
 
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
 logger = logging.getLogger(__name__)
 
 
@@ -249,6 +238,9 @@ class Util:
     @staticmethod
     def split_text(text: str) -> List[str]:
         """Splits a text into lines, handling all common line endings (e.g., LF, CRLF, CR)."""
+        if '\r' not in text:
+            # the most common case does not require copies of the text
+            return text.split('\n')
         return text.replace("\r\n", '\n').replace('\r', '\n').split('\n')
 
     @staticmethod
@@ -339,6 +331,7 @@ class Util:
             xml exception
 
         """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         lines = []
         line_nums = []
         tree = etree.fromstringlist(xml_lines)
@@ -435,8 +428,11 @@ class Util:
         return decoded
 
     @staticmethod
-    def load_pk(data: bytes, password: Optional[bytes] = None) -> Optional[PrivateKeyTypes]:
+    def load_pk(data: bytes, password: Optional[bytes] = None) -> Optional["PrivateKeyTypes"]:
         """Try to load private key from PKCS1, PKCS8 and PKCS12 formats"""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives.serialization import load_der_private_key
+        from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
         with contextlib.suppress(Exception):
             # PKCS1, PKCS8 probes
             private_key = load_der_private_key(data, password)
@@ -450,8 +446,19 @@ class Util:
     RANDOM_DATA = random.randbytes(20)
 
     @staticmethod
-    def check_pk(pkey: PrivateKeyTypes) -> bool:
+    def check_pk(pkey: "PrivateKeyTypes") -> bool:
         """Check private key with encrypt-decrypt random data"""
+        # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives.asymmetric.dh import DHPrivateKey, DHPublicKey
+        from cryptography.hazmat.primitives.asymmetric.dsa import DSAPrivateKey, DSAPublicKey
+        from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey, EllipticCurvePublicKey
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+        from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey, Ed448PublicKey
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+        from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey, X25519PrivateKey
+        from cryptography.hazmat.primitives.asymmetric.x448 import X448PublicKey, X448PrivateKey
         if not pkey or isinstance(pkey, (EllipticCurvePublicKey, DSAPublicKey, Ed448PublicKey, Ed25519PublicKey,
                                          DHPublicKey, X448PublicKey, X25519PublicKey)):
             # These aren't the keys we're looking for
@@ -0,0 +1,82 @@
+import logging
+import signal
+import threading
+import time
+from types import FrameType
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Watchdog:
+    """Context manager to interrupt any of many short stages of a block which runs longer than the budget.
+
+    TimeLimit arms the timer for every block and it is too expensive for a rule applied to a line. The watchdog arms
+    the interval timer of user CPU time once for the block, the timer ticks every half of the budget and the handler
+    raises Watchdog.Expired in the main thread when the current stage runs longer than the budget. So a stage costs
+    only two reads of the clock with start() and stop(). The virtual timer does not interfere with the real-time timer
+    of TimeLimit. The stages are measured but not interrupted on platforms without setitimer, in other threads and
+    inside another watchdog block.
+
+    """
+
+    class Expired(BaseException):
+        """The stage is over the budget. The first argument is the elapsed time of the stage in seconds.
+
+        BaseException is used to pass through broad exception handlers of the stage.
+
+        """
+
+    # the watchdog with active timer
+    __owner: Optional["Watchdog"] = None
+
+    def __init__(self, seconds: float) -> None:
+        """
+        Args:
+            seconds: budget of a stage
+
+        """
+        self.__seconds = seconds
+        self.__start_time: Optional[float] = None
+        self.__previous_handler: Any = None
+
+    @property
+    def seconds(self) -> float:
+        """Budget of a stage"""
+        return self.__seconds
+
+    def __enter__(self) -> "Watchdog":
+        if Watchdog.__owner is not None:
+            return self
+        if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+            logger.debug("Watchdog %s is not supported in %s", self.__seconds, threading.current_thread().name)
+            return self
+        self.__previous_handler = signal.signal(signal.SIGVTALRM, self.__expire)
+        Watchdog.__owner = self
+        signal.setitimer(signal.ITIMER_VIRTUAL, self.__seconds / 2, self.__seconds / 2)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.__start_time = None
+        if Watchdog.__owner is self:
+            Watchdog.__owner = None
+            signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+            signal.signal(signal.SIGVTALRM, self.__previous_handler)
+
+    def start(self) -> None:
+        """Starts a stage"""
+        self.__start_time = time.perf_counter()
+
+    def stop(self) -> float:
+        """Stops the stage and returns its elapsed time in seconds"""
+        elapsed = time.perf_counter() - (self.__start_time or 0.0)
+        self.__start_time = None
+        return elapsed
+
+    def __expire(self, _signum: int, _frame: Optional[FrameType]) -> None:
+        """SIGVTALRM handler. The ticks between stages are ignored"""
+        if Watchdog.__owner is self and (start_time := self.__start_time) is not None:
+            elapsed = time.perf_counter() - start_time
+            if self.__seconds < elapsed:
+                self.__start_time = None
+                raise Watchdog.Expired(elapsed)
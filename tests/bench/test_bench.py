@@ -0,0 +1,77 @@
+import copy
+import filecmp
+import tempfile
+import unittest
+from pathlib import Path
+
+from credsweeper.bench.__main__ import main
+from credsweeper.bench.benchmark import Benchmark, run_case, run_pool_startup
+from credsweeper.bench.corpus import CorpusGenerator
+from tests import SAMPLES_PATH
+
+
+class TestBench(unittest.TestCase):
+
+    def test_corpus_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stats = [CorpusGenerator(seed=7).generate(Path(tmp_dir) / x) for x in ["a", "b"]]
+            self.assertDictEqual(stats[0], stats[1])
+            self.assertEqual(stats[0]["files"], len([x for x in (Path(tmp_dir) / "a").rglob("*") if x.is_file()]))
+            comparison = filecmp.dircmp(Path(tmp_dir) / "a", Path(tmp_dir) / "b")
+            self.assertListEqual([], comparison.diff_files)
+            for subdir in comparison.subdirs.values():
+                self.assertListEqual([], subdir.diff_files)
+            other_stats = CorpusGenerator(seed=8).generate(Path(tmp_dir) / "c")
+            self.assertNotEqual(stats[0], other_stats)
+
+    def test_run_case_p(self):
+        result = run_case(SAMPLES_PATH / "password.gradle", {"ml_threshold": 0})
+        self.assertEqual(1, result["providers"])
+        self.assertEqual(1, result["credentials"])
+        self.assertSetEqual({"init", "discovery", "scan", "post_processing", "export"}, set(result["stages"].keys()))
+        self.assertLessEqual(sum(result["stages"].values()), result["time"])
+
+    def test_run_pool_startup_p(self):
+        self.assertLess(0, run_pool_startup("spawn", 2))
+
+    def test_compare_n(self):
+        report = {"corpus": {"files": 1}, "cases": {"plain": {"time": 1.0, "peak_rss": 100, "credentials": 5}}}
+        self.assertListEqual([], Benchmark.compare(report, report, 0.1))
+        baseline = copy.deepcopy(report)
+        baseline["cases"]["plain"]["time"] = 0.5
+        baseline["cases"]["plain"]["peak_rss"] = None
+        regressions = Benchmark.compare(report, baseline, 0.1)
+        self.assertEqual(1, len(regressions))
+        self.assertIn("time", regressions[0])
+        self.assertListEqual([], Benchmark.compare(report, baseline, 1.5))
+        baseline["cases"]["plain"]["credentials"] = 4
+        self.assertEqual(2, len(Benchmark.compare(report, baseline, 0.1)))
+        baseline["corpus"]["files"] = 2
+        self.assertEqual(1, len(Benchmark.compare(report, baseline, 0.1)))
+
+    def test_compare_startup_n(self):
+        report = {"corpus": {"files": 1}, "cases": {}, "startup": {"version": 1.0, "trivial_scan": 2.0}}
+        self.assertListEqual([], Benchmark.compare(report, report, 0.1))
+        baseline = copy.deepcopy(report)
+        baseline["startup"]["version"] = 0.5
+        regressions = Benchmark.compare(report, baseline, 0.1)
+        self.assertEqual(1, len(regressions))
+        self.assertIn("startup version", regressions[0])
+        # old baseline without startup
+        del baseline["startup"]
+        self.assertListEqual([], Benchmark.compare(report, baseline, 0.1))
+
+    def test_main_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = str(Path(tmp_dir) / "report.json")
+            corpus = str(Path(tmp_dir) / "corpus")
+            # startup is measured in separate tests
+            args = ["--path", corpus, "--cases", "plain", "--no-startup"]
+            self.assertEqual(0, main([*args, "--output", output]))
+            self.assertEqual(0, main([*args, "--baseline", output, "--tolerance", "9"]))
+
+    def test_get_scanned_volume_p(self):
+        stats = {"files": 3, "bytes": 1000, "lines": 100, "archived_bytes": 200, "archived_lines": 20}
+        self.assertTupleEqual((100, 1000), Benchmark.get_scanned_volume(stats, {"depth": 0}))
+        self.assertTupleEqual((100, 1000), Benchmark.get_scanned_volume(stats, {"doc": True}))
+        self.assertTupleEqual((120, 1200), Benchmark.get_scanned_volume(stats, {"depth": 3}))
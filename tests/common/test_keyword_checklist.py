@@ -76,3 +76,21 @@ class TestKeywordChecklist(TestCase):
                 f.write(text)
                 f.write('\n')
         self.assertEqual(0, diff, "Morpheme list has been rearranged and updated")
+
+    def test_matchers_p(self):
+        checklist = KeywordChecklist()
+        line = "my_password_is_not_automatically_generated"
+        keywords = checklist.get_keywords(line)
+        self.assertListEqual([x for x in checklist.keyword_list if x in line], keywords)
+        self.assertIn("automatically", keywords)
+        morphemes = checklist.get_morphemes(line)
+        self.assertSetEqual(set(x for x in checklist.morpheme_set if x in line), morphemes)
+        self.assertTrue(checklist.check_morphemes(line, len(morphemes) - 1))
+        self.assertFalse(checklist.check_morphemes(line, len(morphemes)))
+
+    def test_matchers_n(self):
+        checklist = KeywordChecklist()
+        self.assertListEqual([], checklist.get_keywords("x7qz"))
+        self.assertSetEqual(set(), checklist.get_morphemes("x7qz"))
+        self.assertFalse(checklist.check_morphemes("x7qz", 0))
+        self.assertFalse(checklist.check_morphemes("", 0))
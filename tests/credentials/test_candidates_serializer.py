@@ -0,0 +1,53 @@
+import pickle
+import unittest
+
+from credsweeper.app import CredSweeper
+from credsweeper.credentials.candidates_serializer import CandidatesSerializer
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from tests import SAMPLES_PATH
+
+
+class TestCandidatesSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.cred_sweeper = CredSweeper(ml_threshold=0)
+        self.candidates = self.cred_sweeper.file_scan(TextContentProvider(SAMPLES_PATH / "password.gradle"))
+        self.assertTrue(self.candidates)
+
+    def test_serializer_p(self):
+        serializer = self.cred_sweeper.candidates_serializer
+        data = serializer.dumps(self.candidates)
+        # shared objects are stored as references
+        self.assertGreater(len(pickle.dumps(self.candidates, protocol=pickle.HIGHEST_PROTOCOL)), len(data))
+        restored = serializer.loads(data)
+        self.assertEqual(len(self.candidates), len(restored))
+        for candidate, restored_candidate in zip(self.candidates, restored):
+            self.assertIs(self.cred_sweeper.config, restored_candidate.config)
+            self.assertIs(candidate.patterns, restored_candidate.patterns)
+            self.assertIs(candidate.line_data_list[0].pattern, restored_candidate.line_data_list[0].pattern)
+            self.assertDictEqual(candidate.to_json(hashed=False, subtext=False),
+                                 restored_candidate.to_json(hashed=False, subtext=False))
+
+    def test_serializer_pickle_p(self):
+        # the serializer is transferred to job processes with the instance and results are loaded in main process
+        job_cred_sweeper = pickle.loads(pickle.dumps(self.cred_sweeper))
+        candidates = job_cred_sweeper.file_scan(TextContentProvider(SAMPLES_PATH / "password.gradle"))
+        data = job_cred_sweeper.candidates_serializer.dumps(candidates)
+        restored = self.cred_sweeper.candidates_serializer.loads(data)
+        self.assertListEqual([x.to_json(hashed=False, subtext=False) for x in self.candidates],
+                             [x.to_json(hashed=False, subtext=False) for x in restored])
+
+    def test_serializer_n(self):
+        data = self.cred_sweeper.candidates_serializer.dumps(self.candidates)
+        # the patterns of the rules are unknown for another serializer
+        with self.assertRaises(pickle.UnpicklingError):
+            CandidatesSerializer(self.cred_sweeper.config).loads(data)
+
+    def test_serializer_forbidden_n(self):
+        # crafted data must not execute code - only classes of candidates are allowed
+        data = pickle.dumps(Exception("test"))
+        with self.assertRaises(pickle.UnpicklingError):
+            self.cred_sweeper.candidates_serializer.loads(data)
+        # allowed builtin data which are not the list of candidates
+        with self.assertRaises(pickle.UnpicklingError):
+            self.cred_sweeper.candidates_serializer.loads(pickle.dumps({"test": 1}))
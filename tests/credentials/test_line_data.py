@@ -1,3 +1,4 @@
+import pickle
 import re
 import string
 import unittest
@@ -269,3 +270,17 @@ class TestLineDataStartEnd(unittest.TestCase):
             "<i>PASS</i>",
             LineData(None, '<var:x3><a href="localhost">password=<i>PASS</i></a></var>', 0, 1, "", "", "",
                      re.compile(r".*(?P<variable>password)(?P<separator>=)(?P<value>.+)")).value)
+
+    def test_pickle_p(self) -> None:
+        line_data = LineData(
+            None, 'password = "Kd7AwfxQ"', 0, 1, "dir/file.txt", ".txt", "info",
+            re.compile(r"(?P<variable>password)(?P<separator>\s*=\s*)"
+                       r"(?P<value_leftquote>\")(?P<value>\w+)(?P<value_rightquote>\")"))
+        self.assertFalse(hasattr(line_data, "__dict__"))
+        self.assertTrue(line_data.is_well_quoted_value)
+        restored = pickle.loads(pickle.dumps(line_data))
+        self.assertTrue(line_data.compare(restored))
+        self.assertEqual(line_data.value_leftquote, restored.value_leftquote)
+        self.assertTrue(restored.is_well_quoted_value)
+        # strings of different objects are shared after unpickling
+        self.assertIs(restored.path, pickle.loads(pickle.dumps(line_data)).path)
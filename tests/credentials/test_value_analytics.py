@@ -0,0 +1,49 @@
+import base64
+import pickle
+import re
+import unittest
+
+from credsweeper.common import static_keyword_checklist
+from credsweeper.credentials.line_data import LineData
+from credsweeper.credentials.value_analytics import ValueAnalytics
+from credsweeper.utils.util import Util
+
+
+class TestValueAnalytics(unittest.TestCase):
+
+    def test_value_analytics_p(self) -> None:
+        value = base64.b64encode(b"MyPasswordIsStrong").decode()
+        analytics = ValueAnalytics(value)
+        self.assertEqual(value, analytics.value)
+        self.assertEqual(value.lower(), analytics.lower)
+        self.assertIs(analytics.lower, analytics.lower)
+        self.assertEqual(Util.get_shannon_entropy(value), analytics.entropy)
+        self.assertEqual(b"MyPasswordIsStrong", analytics.base64_decoded)
+        self.assertIs(analytics.base64_decoded, analytics.base64_decoded)
+        self.assertIsNotNone(analytics.hop_stat)
+        self.assertEqual(set(x for x in static_keyword_checklist.morpheme_set if x in value.lower()),
+                         analytics.morphemes)
+
+    def test_value_analytics_n(self) -> None:
+        analytics = ValueAnalytics("pass*word")
+        self.assertIsNone(analytics.base64_decoded)
+        self.assertIsNone(analytics.base64_decoded)
+        self.assertEqual({"pass", "word"}, analytics.morphemes & {"pass", "word"})
+        self.assertTrue(analytics.check_morphemes(1))
+        self.assertFalse(analytics.check_morphemes(len(analytics.morphemes)))
+        self.assertFalse(ValueAnalytics("").check_morphemes(0))
+
+    def test_line_data_p(self) -> None:
+        line_data = LineData(None, 'password = "Kd7AwfxQ"', 0, 1, "dir/file.txt", ".txt", "info",
+                             re.compile(r"(?P<variable>password)(?P<separator>\s*=\s*)\"(?P<value>\w+)\""))
+        analytics = line_data.value_analytics
+        self.assertEqual("kd7awfxq", analytics.lower)
+        self.assertIs(analytics, line_data.value_analytics)
+        # analytics of a changed value are calculated again
+        line_data.value = "Kd7Awf"
+        self.assertIsNot(analytics, line_data.value_analytics)
+        self.assertEqual("kd7awf", line_data.value_analytics.lower)
+        # the analytics are not pickled
+        restored = pickle.loads(pickle.dumps(line_data))
+        self.assertEqual("kd7awf", restored.value_analytics.lower)
+        self.assertIsNot(line_data.value_analytics, restored.value_analytics)
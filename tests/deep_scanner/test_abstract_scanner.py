@@ -1,8 +1,19 @@
+import bz2
+import gzip
+import io
+import lzma
 import random
+import tarfile
 import unittest
+import zipfile
+from unittest.mock import patch
 
+from credsweeper.app import CredSweeper
 from credsweeper.deep_scanner.abstract_scanner import AbstractScanner
-from tests import AZ_STRING, AZ_DATA
+from credsweeper.deep_scanner.deep_scanner import DeepScanner
+from credsweeper.file_handler.descriptor import Descriptor
+from credsweeper.file_handler.byte_content_provider import ByteContentProvider
+from tests import AZ_STRING, AZ_DATA, SAMPLES_PATH
 
 
 class TestAbstractScanner(unittest.TestCase):
@@ -70,3 +81,97 @@ class TestAbstractScanner(unittest.TestCase):
                                  "Key": AZ_DATA,
                                  "VALUE": AZ_DATA
                              })))
+
+    @staticmethod
+    def get_stream_text() -> bytes:
+        """Returns text with credentials in random places including multiline keys"""
+        random.seed(42)
+        pem_key = (SAMPLES_PATH / "pem_key").read_bytes()
+        lines = []
+        for n in range(5000):
+            lines.append(f"{n} {AZ_STRING} {random.randbytes(random.randint(0, 32)).hex()}\n".encode())
+            if 0 == random.randrange(100):
+                lines.append(pem_key)
+            if 0 == random.randrange(100):
+                lines.append(b'password = "Xdj@jcN834b"\r\n')
+        return b''.join(lines)
+
+    def test_stream_scan_p(self):
+        text = self.get_stream_text()
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("stream.txt", text)
+        tar_buffer = io.BytesIO()
+        with tarfile.open(fileobj=tar_buffer, mode="w") as tf:
+            tar_info = tarfile.TarInfo("stream.txt")
+            tar_info.size = len(text)
+            tf.addfile(tar_info, io.BytesIO(text))
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1).deep_scanner
+        for file_path, data in [("stream.txt.gz", gzip.compress(text)), ("stream.txt.bz2", bz2.compress(text)),
+                                ("stream.txt.xz", lzma.compress(text)), ("stream.zip", zip_buffer.getvalue()),
+                                ("stream.tar", tar_buffer.getvalue())]:
+            provider = ByteContentProvider(content=data, file_path=file_path)
+            expected = [x.to_json(hashed=False, subtext=False) for x in deep_scanner.scan(provider, 1)]
+            self.assertLess(100, len(expected))
+            # windows are smaller than a pem key with the overlap
+            for stream_scan_size in [1 << 12, 1 << 14]:
+                with patch("credsweeper.deep_scanner.abstract_scanner.STREAM_SCAN_SIZE", stream_scan_size), \
+                        patch("credsweeper.deep_scanner.abstract_scanner.STREAM_HEAD_SIZE", 1 << 10):
+                    candidates = deep_scanner.scan(provider, 1)
+                actual = [x.to_json(hashed=False, subtext=False) for x in candidates]
+                if 1 << 14 == stream_scan_size:
+                    self.assertListEqual(sorted(expected, key=str), sorted(actual, key=str), file_path)
+                else:
+                    # a multiline key over the window is not found, but all found credentials are in their places
+                    self.assertLess(len(expected) // 2, len(actual))
+                    self.assertTrue(all(x in expected for x in actual), file_path)
+
+    def test_is_plain_text_p(self):
+        descriptor = Descriptor("stream.txt", ".txt", "")
+        self.assertTrue(DeepScanner.is_plain_text(AZ_DATA, descriptor, 0))
+        self.assertTrue(DeepScanner.is_plain_text(AZ_DATA, descriptor, -1))
+
+    def test_is_plain_text_n(self):
+        descriptor = Descriptor("stream.txt", ".txt", "")
+        # other scanners are applied to the text at the depth
+        self.assertFalse(DeepScanner.is_plain_text(AZ_DATA, descriptor, 1))
+        self.assertFalse(DeepScanner.is_plain_text(AZ_DATA.decode().encode("utf_16"), descriptor, 0))
+        text = self.get_stream_text()
+        deep_scanner = CredSweeper(ml_threshold=0, depth=2).deep_scanner
+        provider = ByteContentProvider(content=gzip.compress(text), file_path="stream.txt.gz")
+        expected = [x.to_json(hashed=False, subtext=False) for x in deep_scanner.scan(provider, 2)]
+        # the text is not scanned by windows because the depth remains for other scanners
+        with patch("credsweeper.deep_scanner.abstract_scanner.STREAM_SCAN_SIZE", 1 << 12), \
+                patch("credsweeper.deep_scanner.abstract_scanner.STREAM_HEAD_SIZE", 1 << 10):
+            actual = [x.to_json(hashed=False, subtext=False) for x in deep_scanner.scan(provider, 2)]
+        self.assertListEqual(expected, actual)
+
+    def test_read_with_limit_p(self):
+        file = io.BytesIO(AZ_DATA)
+        self.assertEqual(AZ_DATA[:10], AbstractScanner.read_with_limit(file, len(AZ_DATA), 10))
+        self.assertEqual(AZ_DATA[10:], AbstractScanner.read_with_limit(file, len(AZ_DATA) - 10))
+        self.assertEqual(b'', AbstractScanner.read_with_limit(file, 0))
+
+    def test_read_with_limit_n(self):
+        file = io.BytesIO(AZ_DATA)
+        with self.assertRaises(AbstractScanner.LimitError):
+            AbstractScanner.read_with_limit(file, len(AZ_DATA) - 1)
+        # the data over the limit is not read
+        self.assertEqual(len(AZ_DATA), file.tell())
+        file.seek(0)
+        with self.assertRaises(AbstractScanner.LimitError):
+            AbstractScanner.read_with_limit(file, -2)
+        self.assertEqual(0, file.tell())
+
+    def test_decompression_limit_n(self):
+        text = self.get_stream_text()
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1).deep_scanner
+        for file_path, data in [("stream.txt.gz", gzip.compress(text)), ("stream.txt.bz2", bz2.compress(text)),
+                                ("stream.txt.xz", lzma.compress(text))]:
+            provider = ByteContentProvider(content=data, file_path=file_path)
+            self.assertLess(100, len(deep_scanner.scan(provider, 1)))
+            # the limit for compressed and decompressed data
+            limit = len(data) + len(text) // 2
+            self.assertListEqual([], deep_scanner.scan(provider, 1, limit), file_path)
+            with patch("credsweeper.deep_scanner.abstract_scanner.STREAM_SCAN_SIZE", 1 << 12):
+                self.assertListEqual([], deep_scanner.scan(provider, 1, limit), file_path)
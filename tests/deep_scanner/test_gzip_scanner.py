@@ -1,6 +1,10 @@
+import gzip
 import unittest
 
+from credsweeper.app import CredSweeper
 from credsweeper.deep_scanner.gzip_scanner import GzipScanner
+from credsweeper.file_handler.data_content_provider import DataContentProvider
+from tests import AZ_DATA
 
 
 class TestGzipScanner(unittest.TestCase):
@@ -14,3 +18,33 @@ class TestGzipScanner(unittest.TestCase):
             self.assertFalse(GzipScanner.match(None))
         self.assertFalse(GzipScanner.match(b'\x1f\x8b\x00'))
         self.assertFalse(GzipScanner.match(b'\x2f\x8b\x01'))
+
+    def test_get_size_p(self):
+        self.assertEqual(len(AZ_DATA), GzipScanner.get_size(gzip.compress(AZ_DATA)))
+        self.assertEqual(0, GzipScanner.get_size(gzip.compress(b'')))
+        # the size of last member only
+        self.assertEqual(len(AZ_DATA), GzipScanner.get_size(gzip.compress(b'x' * 1000) + gzip.compress(AZ_DATA)))
+
+    def test_get_size_n(self):
+        self.assertEqual(0, GzipScanner.get_size(b''))
+        self.assertEqual(0, GzipScanner.get_size(gzip.compress(AZ_DATA)[:17]))
+
+    def test_data_scan_size_hint_p(self):
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1).deep_scanner
+        data = gzip.compress(b'password = "Xdj@jcN834b"\n')
+        provider = DataContentProvider(data, file_path="test.gz", file_type=".gz")
+        self.assertEqual(1, len(GzipScanner.data_scan(deep_scanner, provider, 1, 1 << 20)))
+        # ISIZE over the limit is only a hint, the data are left to fallback scanners
+        provider = DataContentProvider(data[:-4] + (1 << 31).to_bytes(4, "little"),
+                                       file_path="test.gz",
+                                       file_type=".gz")
+        self.assertIsNone(GzipScanner.data_scan(deep_scanner, provider, 1, 1 << 20))
+
+    def test_data_scan_size_hint_n(self):
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1).deep_scanner
+        data = gzip.compress(AZ_DATA * 1000)
+        # small ISIZE does not bypass the limit of decompressed data
+        provider = DataContentProvider(data[:-4] + len(AZ_DATA).to_bytes(4, "little"),
+                                       file_path="test.gz",
+                                       file_type=".gz")
+        self.assertListEqual([], GzipScanner.data_scan(deep_scanner, provider, 1, 10 * len(AZ_DATA)))
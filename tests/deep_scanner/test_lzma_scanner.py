@@ -1,6 +1,10 @@
+import lzma
 import unittest
 
+from credsweeper.app import CredSweeper
 from credsweeper.deep_scanner.lzma_scanner import LzmaScanner
+from credsweeper.file_handler.data_content_provider import DataContentProvider
+from tests import AZ_DATA
 
 
 class TestLzmaScanner(unittest.TestCase):
@@ -25,3 +29,33 @@ class TestLzmaScanner(unittest.TestCase):
         self.assertFalse(LzmaScanner.match(b"\xFD7zXY\x00"))
         self.assertFalse(LzmaScanner.match(b"\x5D\x00\x01"))
         self.assertFalse(LzmaScanner.match(b"\xFE7zXZ\x00"))
+
+    def test_get_size_p(self):
+        xz_data = lzma.compress(AZ_DATA)
+        self.assertEqual(len(AZ_DATA), LzmaScanner.get_size(xz_data))
+        # concatenated streams with stream padding
+        self.assertEqual(3 * len(AZ_DATA), LzmaScanner.get_size(xz_data + xz_data + b"\x00" * 8 + xz_data))
+        self.assertEqual(0, LzmaScanner.get_size(lzma.compress(b'')))
+        # legacy format with known size
+        lzma_header = b"\x5D\x00\x00\x01\x00" + len(AZ_DATA).to_bytes(8, "little")
+        self.assertEqual(len(AZ_DATA), LzmaScanner.get_size(lzma_header))
+
+    def test_get_size_n(self):
+        # legacy format keeps unknown size
+        self.assertEqual(0, LzmaScanner.get_size(lzma.compress(AZ_DATA, format=lzma.FORMAT_ALONE)))
+        xz_data = lzma.compress(AZ_DATA)
+        self.assertEqual(0, LzmaScanner.get_size(xz_data[:-1]))
+        self.assertEqual(0, LzmaScanner.get_size(xz_data[1:]))
+        self.assertEqual(0, LzmaScanner.get_size(xz_data[:12] + xz_data[-12:]))
+        self.assertEqual(0, LzmaScanner.get_size(b"\xFD7zXZ\x00"))
+
+    def test_data_scan_size_hint_n(self):
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1).deep_scanner
+        data = lzma.compress(b'password = "Xdj@jcN834b"\n', format=lzma.FORMAT_ALONE)
+        provider = DataContentProvider(data, file_path="test.lzma", file_type=".lzma")
+        self.assertEqual(1, len(LzmaScanner.data_scan(deep_scanner, provider, 1, 1 << 20)))
+        # the size from the header over the limit is only a hint, the data are left to fallback scanners
+        provider = DataContentProvider(data[:5] + (1 << 40).to_bytes(8, "little") + data[13:],
+                                       file_path="test.lzma",
+                                       file_type=".lzma")
+        self.assertIsNone(LzmaScanner.data_scan(deep_scanner, provider, 1, 1 << 20))
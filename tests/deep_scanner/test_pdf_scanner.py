@@ -1,6 +1,10 @@
+import time
 import unittest
+from unittest.mock import patch
 
+from credsweeper.app import CredSweeper
 from credsweeper.deep_scanner.pdf_scanner import PdfScanner
+from credsweeper.file_handler.byte_content_provider import ByteContentProvider
 
 
 class TestPdfScanner(unittest.TestCase):
@@ -14,3 +18,17 @@ class TestPdfScanner(unittest.TestCase):
             self.assertFalse(PdfScanner.match(None))
         self.assertFalse(PdfScanner.match(b''))
         self.assertFalse(PdfScanner.match(b'%PDF+'))
+
+    def test_parser_timeout_p(self):
+        data = b'%PDF-1.4\n%\xE2\xE3\xCF\xD3\n1 0 obj\n(password = "Xdj@jcN834b")\nendobj\n%%EOF\n'
+        provider = ByteContentProvider(content=data, file_path="slow.pdf")
+        deep_scanner = CredSweeper(ml_threshold=0, depth=1, parser_timeout=1).deep_scanner
+        start_time = time.monotonic()
+        with patch("pdfminer.high_level.extract_pages", side_effect=lambda *args, **kwargs: time.sleep(60)), \
+                self.assertLogs("credsweeper.deep_scanner.abstract_scanner", level="WARNING") as logs:
+            candidates = deep_scanner.scan(provider, 1)
+        self.assertGreater(10, time.monotonic() - start_time)
+        self.assertIn("PdfScanner was interrupted after 1 seconds", logs.output[0])
+        # the data is scanned with fallback scanner
+        self.assertEqual(1, len(candidates))
+        self.assertEqual("Xdj@jcN834b", candidates[0].line_data_list[0].value)
@@ -1,10 +1,12 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.descriptor import Descriptor
 from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.mapped_lines import MappedLines
 from tests import SAMPLES_PATH
 
 
@@ -75,3 +77,14 @@ class TestTextContentProvider(unittest.TestCase):
         self.assertListEqual([], provider.lines)
         provider.free()
         provider.free()
+
+    def test_mapped_lines_p(self) -> None:
+        target_path = SAMPLES_PATH / "password.gradle"
+        expected = [x.line for x in TextContentProvider(target_path).yield_analysis_target(0)]
+        with patch("credsweeper.file_handler.text_content_provider.MMAP_SIZE_THRESHOLD", 1):
+            content_provider = TextContentProvider(target_path)
+            analysis_targets = [x for x in content_provider.yield_analysis_target(0)]
+        self.assertIsInstance(content_provider.lines, MappedLines)
+        self.assertListEqual(expected, [x.line for x in analysis_targets])
+        content_provider.free()
+        self.assertNotIsInstance(content_provider.lines, MappedLines)
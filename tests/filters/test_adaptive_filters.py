@@ -0,0 +1,53 @@
+import copy
+import pickle
+
+import pytest
+
+from credsweeper.filters import ValueAllowlistCheck, ValueLengthCheck, ValueNumberCheck, ValueSearchCheck
+from credsweeper.filters.adaptive_filters import AdaptiveFilters
+from tests.filters.conftest import LINE_VALUE_PATTERN, DUMMY_ANALYSIS_TARGET
+from tests.test_utils.dummy_line_data import get_line_data
+
+
+class TestAdaptiveFilters:
+
+    def test_adaptive_filters_p(self, file_path: pytest.fixture) -> None:
+        # the number check rejects every number, other filters never reject them
+        filters = AdaptiveFilters([ValueAllowlistCheck(), ValueLengthCheck(max_len=42), ValueNumberCheck()])
+        line_data = get_line_data(file_path, line="0x1234", pattern=LINE_VALUE_PATTERN)
+        for _ in range(AdaptiveFilters.REORDER_PERIOD):
+            assert isinstance(filters.check(line_data, DUMMY_ANALYSIS_TARGET), ValueNumberCheck)
+        assert isinstance(filters[0], ValueNumberCheck)
+        assert [ValueAllowlistCheck, ValueLengthCheck] == [x.__class__ for x in filters[1:]]
+        profile = filters.get_profile()
+        assert "ValueNumberCheck" == profile[0]["filter"]
+        assert AdaptiveFilters.REORDER_PERIOD == profile[0]["calls"] == profile[0]["rejections"]
+        assert 0 == profile[1]["rejections"]
+        # the statistics are sent to other processes
+        restored = pickle.loads(pickle.dumps(filters))
+        assert profile == restored.get_profile()
+        restored.reset_profile()
+        assert isinstance(restored[0], ValueNumberCheck)
+        assert all(0 == x["calls"] for x in restored.get_profile())
+        restored.merge_profile(profile)
+        assert profile == restored.get_profile()
+
+    def test_adaptive_filters_n(self, file_path: pytest.fixture) -> None:
+        filters = AdaptiveFilters([ValueAllowlistCheck(), ValueNumberCheck()])
+        line_data = get_line_data(file_path, line="Crackle4421", pattern=LINE_VALUE_PATTERN)
+        assert filters.check(line_data, DUMMY_ANALYSIS_TARGET) is None
+        # a copy of the filters is extended for a candidate of multi pattern rule
+        extended = copy.deepcopy(filters)
+        extended.append(ValueSearchCheck(None, "Crackle"))
+        assert isinstance(extended.check(line_data, DUMMY_ANALYSIS_TARGET), ValueSearchCheck)
+        assert 2 == len(filters)
+
+    def test_sort_by_profile_p(self) -> None:
+        filters = [ValueAllowlistCheck(), ValueLengthCheck(), ValueNumberCheck()]
+        AdaptiveFilters.sort_by_profile(filters, [{"filter": "ValueNumberCheck"}, {"filter": "ValueAllowlistCheck"}])
+        assert [ValueNumberCheck, ValueAllowlistCheck, ValueLengthCheck] == [x.__class__ for x in filters]
+        profile = [{"filter": "ValueLengthCheck", "calls": 10, "rejections": 5, "seconds": 0.001}]
+        filters = AdaptiveFilters([ValueAllowlistCheck(), ValueLengthCheck()], profile)
+        # the allowlist check was not measured yet
+        assert [ValueAllowlistCheck, ValueLengthCheck] == [x.__class__ for x in filters]
+        assert profile == filters.get_profile()[1:]
@@ -1,9 +1,13 @@
+import copy
 import re
 from unittest import TestCase
 
+import numpy as np
+
 from credsweeper.app import APP_PATH
 from credsweeper.common.constants import Severity, MAX_LINE_LENGTH
 from credsweeper.credentials.candidate import Candidate, LineData
+from credsweeper.ml_model import features
 from credsweeper.ml_model.features.entropy_evaluation import EntropyEvaluation
 from credsweeper.ml_model.features.file_extension import FileExtension
 from credsweeper.ml_model.features.has_html_tag import HasHtmlTag
@@ -341,3 +345,22 @@ class TestFeatures(TestCase):
         self.assertEqual(0.5, RuleSeverity().extract(self.candidate))
         self.candidate.severity = Severity.CRITICAL
         self.assertEqual(1.0, RuleSeverity().extract(self.candidate))
+
+    def test_extract_batch_p(self):
+        candidates = []
+        for value, variable, path in [("the lazy", "brown fox", "src/path.ext"), ("", None, ""),
+                                      ("bace4d19-fa7e-beef-cafe-9129474bcd81", "uuid", "/tmp/test/key.py"),
+                                      ("P@$$w0rdP@$$w0rdP@$$w0rd" * 20, "Password", "tests/passwords.txt"),
+                                      ("12345", "code", "doc/README.MD"), ("\0\0\0", "x", "x")]:
+            candidate = copy.deepcopy(self.candidate)
+            candidate.line_data_list[0].value = value
+            candidate.line_data_list[0].variable = variable
+            candidate.line_data_list[0].path = path
+            candidates.append(candidate)
+        for feature_definition in self.model_config["features"]:
+            feature = getattr(features, feature_definition["type"])(**feature_definition.get("kwargs", {}))
+            batch = feature.extract_batch(candidates)
+            self.assertEqual(len(candidates), batch.shape[0], feature_definition["type"])
+            for i, candidate in enumerate(candidates):
+                single = np.array(feature([candidate])[0]).reshape(-1)
+                self.assertTrue(np.allclose(single, batch[i]), (feature_definition["type"], i, single, batch[i]))
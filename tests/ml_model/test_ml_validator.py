@@ -6,7 +6,7 @@ from typing import Tuple
 import numpy as np
 
 from credsweeper.app import APP_PATH
-from credsweeper.common.constants import Severity, MAX_LINE_LENGTH, MIN_DATA_LEN, ThresholdPreset
+from credsweeper.common.constants import Severity, MAX_LINE_LENGTH, MIN_DATA_LEN, ThresholdPreset, ML_HUNK
 from credsweeper.config.config import Config
 from credsweeper.credentials.candidate import Candidate
 from credsweeper.credentials.candidate_key import CandidateKey
@@ -264,3 +264,11 @@ class TestMlValidator(unittest.TestCase):
                  0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
              ]],
             self.ml_validator.encode("\xFE\xFF \n\t`\0", MIN_DATA_LEN).tolist())
+
+    def test_encode_batch_p(self):
+        texts = ["", AZ_STRING, "\xFE\xFF \n\t`\0", "\U0001F600 emoji", "A" * 300]
+        for limit in [0, MIN_DATA_LEN, ML_HUNK, 2 * ML_HUNK]:
+            batch = self.ml_validator.encode_batch(texts, limit)
+            self.assertEqual((len(texts), limit, self.ml_validator.num_classes), batch.shape)
+            for i, text in enumerate(texts):
+                self.assertTrue(np.array_equal(self.ml_validator.encode(text, limit), batch[i]), (text, limit))
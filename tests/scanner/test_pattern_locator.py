@@ -0,0 +1,86 @@
+import random
+import re
+import unittest
+from unittest.mock import patch
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.files_provider import FilesProvider
+from credsweeper.scanner.pattern_locator import PatternLocator, WholeText, LOCATE_THRESHOLD
+from tests import SAMPLES_PATH
+
+
+class TestPatternLocator(unittest.TestCase):
+
+    def test_is_locatable_p(self):
+        self.assertTrue(PatternLocator.is_locatable("^(?P<value>\\w+)$"))
+        self.assertTrue(PatternLocator.is_locatable("(?<!BBDC-)(?P<value>[MNO]\\w+)(?![0-9A-Za-z_-])"))
+        self.assertTrue(PatternLocator.is_locatable("(?P<value>[\\]\\\\s(]+)(?!-)"))
+
+    def test_is_locatable_n(self):
+        self.assertFalse(PatternLocator.is_locatable("(?P<value>\\w+)\\Z"))
+        self.assertFalse(PatternLocator.is_locatable("\\A(?P<value>\\w+)"))
+        self.assertFalse(PatternLocator.is_locatable("(?<!\\s)(?P<value>\\w+)"))
+        self.assertFalse(PatternLocator.is_locatable("(?P<value>\\w+)(?![^a-z])"))
+        self.assertFalse(PatternLocator.is_locatable("(?P<value>\\w+)(?!.)"))
+        # no backtracking
+        self.assertFalse(PatternLocator.is_locatable("(?>a\\s*)(?P<value>\\w+)"))
+        self.assertFalse(PatternLocator.is_locatable("a\\s*+(?P<value>\\w+)"))
+        self.assertFalse(PatternLocator.is_locatable("a\\s{1,3}+(?P<value>\\w+)"))
+
+    def test_locate_p(self):
+        rnd = random.Random(42)
+        patterns = [
+            re.compile(r"(?:^|[^0-9A-Za-z])(?P<value>ab[0-9]{2,4})(?![0-9A-Za-z])"),
+            re.compile(r"(?P<variable>key)\s*=\s*(?P<value>[0-9a-z]{3,8})$"),
+            re.compile(r"^\s*(?P<value>b[a-z]+)"),
+        ]
+        for pattern in patterns:
+            locator = PatternLocator(pattern)
+            self.assertIsNotNone(locator.pattern)
+            for _ in range(50):
+                lines = [
+                    ''.join(
+                        rnd.choice(["ab", "12", " ", "key", "=", "b", "x", "\t", "-"])
+                        for _ in range(rnd.randint(0, 12))) for _ in range(rnd.randint(1, 20))
+                ]
+                line_starts = PatternLocator.get_line_starts(lines)
+                located = locator.locate('\n'.join(lines), line_starts)
+                for line_pos, line in enumerate(lines):
+                    if pattern.search(line):
+                        self.assertIn(line_pos, located, lines)
+
+    def test_whole_text_p(self):
+        lines = ["abc"] * (2 * LOCATE_THRESHOLD)
+        lines[-1] = "ab12"
+        locator = PatternLocator(re.compile("(?P<value>ab[0-9]+)"))
+        whole_text = WholeText(lines)
+        self.assertIs(lines, whole_text.lines)
+        # the lines are scanned separately before the threshold
+        for line_pos in range(LOCATE_THRESHOLD - 1):
+            self.assertTrue(whole_text.is_located(0, locator, line_pos))
+        # the pattern is located in whole text
+        self.assertFalse(whole_text.is_located(0, locator, LOCATE_THRESHOLD))
+        self.assertTrue(whole_text.is_located(0, locator, len(lines) - 1))
+
+    def test_whole_text_blocks_p(self):
+        lines = ["abc", "ab12", "x ab3"] * 5
+        locator = PatternLocator(re.compile("(?P<value>ab[0-9]+)"))
+        with patch("credsweeper.scanner.pattern_locator.LOCATE_BLOCK_LINES", 4), \
+                patch("credsweeper.scanner.pattern_locator.LOCATE_THRESHOLD", 1):
+            whole_text = WholeText(lines)
+            located = [n for n in range(len(lines)) if whole_text.is_located(0, locator, n)]
+        self.assertListEqual([n for n, x in enumerate(lines) if locator.pattern.search(x)], located)
+
+    def test_shipped_rules_p(self):
+        # every pattern rule is located in whole text from first request - the reports must be equal to line scan
+        with patch("credsweeper.scanner.pattern_locator.LOCATE_THRESHOLD", 1), \
+                patch("credsweeper.scanner.pattern_locator.LOCATE_DENSITY", 0):
+            for doc in (False, True):
+                reports = []
+                for whole_file in (False, True):
+                    cred_sweeper = CredSweeper(ml_threshold=0, doc=doc, whole_file=whole_file, sort_output=True)
+                    cred_sweeper.run(FilesProvider([SAMPLES_PATH]))
+                    credentials = cred_sweeper.credential_manager.get_credentials()
+                    reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+                self.assertTrue(reports[0])
+                self.assertListEqual(reports[0], reports[1], f"doc={doc}")
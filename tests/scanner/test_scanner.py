@@ -0,0 +1,82 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import RuleType
+from credsweeper.file_handler.string_content_provider import StringContentProvider
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.scanner.scanner import Scanner
+from credsweeper.utils.util import Util
+from tests import SAMPLES_PATH
+
+
+class TestScanner(unittest.TestCase):
+
+    @staticmethod
+    def get_checked_rules(scanner: Scanner, text_lower: str) -> List[int]:
+        """Selection of rules with check of required substrings for every rule like it was before the prefilter"""
+        return [
+            n for n, (rule, _) in enumerate(scanner.rules_scanners)
+            if not rule.has_required_substrings or any(x in text_lower for x in rule.required_substrings)
+        ]
+
+    def test_candidate_rules_p(self):
+        for doc in (False, True):
+            scanner = CredSweeper(ml_threshold=0, doc=doc).scanner
+            lines_count = 0
+            for path in sorted(SAMPLES_PATH.rglob("*")):
+                if not path.is_file():
+                    continue
+                for target in TextContentProvider(path).yield_analysis_target(scanner.min_len):
+                    lines_count += 1
+                    text_lower = target.line_lower_strip
+                    self.assertListEqual(self.get_checked_rules(scanner, text_lower),
+                                         scanner.get_candidate_rules(text_lower), f"{path}:{target.line_num}")
+            self.assertLess(1000, lines_count)
+
+    def test_yield_rule_scanner_p(self):
+        scanner = CredSweeper(ml_threshold=0).scanner
+        rules = list(scanner.yield_rule_scanner(100, True, False, False, False))
+        self.assertTrue(rules)
+        self.assertTrue(all(RuleType.PATTERN == x[0].rule_type for x in rules))
+        self.assertListEqual([], list(scanner.yield_rule_scanner(0, True, True, True, True)))
+
+    def test_pattern_timeout_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rules_file = os.path.join(tmp_dir, "rules.yaml")
+            rules = [{
+                "name": "Backtracking",
+                "severity": "high",
+                "confidence": "moderate",
+                "type": "pattern",
+                "min_line_len": 8,
+                "values": ["(?P<value>(a+)+)!"],
+                "target": ["code"],
+            }, {
+                "name": "Dummy Token",
+                "severity": "high",
+                "confidence": "moderate",
+                "type": "pattern",
+                "min_line_len": 8,
+                "values": ["(?P<value>tok_[0-9a-z]{12})"],
+                "target": ["code"],
+            }]
+            Util.yaml_dump(rules, rules_file)
+            with self.assertLogs("credsweeper.scanner.scanner", "WARNING") as logs:
+                cred_sweeper = CredSweeper(rule_path=rules_file, ml_threshold=0, pattern_timeout=0.1)
+            self.assertIn("Pattern 0 of rule Backtracking may backtrack super-linearly (nested quantifier)",
+                          logs.output[0])
+            lines = [f"{'a' * 32} tok_{x:012d}" for x in range(5)]
+            start_time = time.perf_counter()
+            with self.assertLogs("credsweeper.scanner.scanner", "WARNING") as logs:
+                candidates = cred_sweeper.scanner.scan(StringContentProvider(lines, file_path="dummy.txt"))
+            self.assertGreater(10, time.perf_counter() - start_time)
+            # the pathological rule is interrupted for every line until it is skipped
+            self.assertEqual(Scanner.RULE_OVERRUNS_LIMIT + 1, len(logs.output))
+            self.assertTrue(logs.output[0].endswith(" by rule Backtracking"), logs.output[0])
+            self.assertIn("dummy.txt:1 was scanned for", logs.output[0])
+            self.assertIn("Skip after 3 overruns the rule Backtracking", logs.output[-1])
+            self.assertListEqual(["Dummy Token"] * 5, [x.rule_name for x in candidates])
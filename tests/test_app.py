@@ -1,5 +1,5 @@
 import io
-import io
+import json
 import logging
 import os
 import random
@@ -9,6 +9,7 @@ import sys
 import tempfile
 import unittest
 import uuid
+import zipfile
 from pathlib import Path
 from tarfile import ReadError
 from typing import List, Any, Dict
@@ -19,12 +20,14 @@ import psutil
 import pytest
 
 from credsweeper.app import APP_PATH, CredSweeper
-from credsweeper.common.constants import ThresholdPreset, Severity, MIN_DATA_LEN
+from credsweeper.common.constants import ThresholdPreset, Severity, MIN_DATA_LEN, JOB_TASK_SIZE, JOB_TASK_LEN, \
+    JOB_TASKS_PER_PROCESS, JOBS_START_METHODS
 from credsweeper.file_handler.abstract_provider import AbstractProvider
 from credsweeper.file_handler.byte_content_provider import ByteContentProvider
 from credsweeper.file_handler.files_provider import FilesProvider
 from credsweeper.file_handler.string_content_provider import StringContentProvider
 from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.filters.adaptive_filters import AdaptiveFilters
 from credsweeper.utils.util import Util
 from tests import SAMPLES_FILTERED_COUNT, SAMPLES_POST_CRED_COUNT, SAMPLES_PATH, TESTS_PATH, SAMPLES_IN_DEEP_1, \
     SAMPLES_IN_DEEP_3, SAMPLES_IN_DEEP_2, ZERO_ML_THRESHOLD, AZ_DATA, SAMPLE_HTML, SAMPLE_DOCX, SAMPLE_TAR, \
@@ -244,6 +247,7 @@ class TestMain(unittest.TestCase):
             cred_sweeper.run(content_provider=FilesProvider([SAMPLES_PATH]))
             mocked_logger.assert_has_calls([
                 call("Scan in %s processes for %s providers", nproc, SAMPLES_FILES_COUNT - 28),
+                ANY,  # Jobs utilization
                 call("Grouping %s candidates", SAMPLES_FILTERED_COUNT),
                 ANY,  # Run ML Validation for \d+ groups
                 ANY,  # initial ML with various arguments, cannot predict
@@ -258,6 +262,7 @@ class TestMain(unittest.TestCase):
             cred_sweeper.run(content_provider=content_provider)
             mocked_logger.assert_has_calls([
                 call(f"Scan in %s processes for %s providers", nproc, SAMPLES_FILES_COUNT - 28),
+                ANY,  # Jobs utilization
                 call(f"Grouping %s candidates", SAMPLES_FILTERED_COUNT),
                 ANY,  # Run ML Validation for \d+ groups
                 # no init
@@ -267,6 +272,157 @@ class TestMain(unittest.TestCase):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def test_ml_in_jobs_p(self) -> None:
+        cred_sweeper = CredSweeper(pool_count=2, ml_in_jobs=True)
+        with patch('logging.Logger.info') as mocked_logger:
+            cred_sweeper.run(content_provider=FilesProvider([SAMPLES_PATH]))
+            mocked_logger.assert_has_calls([
+                call("ML validation was performed in jobs"),
+                call("Exporting %s credentials", SAMPLES_POST_CRED_COUNT),
+            ])
+        self.assertEqual(SAMPLES_POST_CRED_COUNT, cred_sweeper.credential_manager.len_credentials())
+        self.assertTrue(
+            all(x.ml_probability is not None for x in cred_sweeper.credential_manager.get_credentials() if x.use_ml))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_pool_tasks_p(self) -> None:
+        small = [ByteContentProvider(b"x" * n, file_path=f"small{n}") for n in range(1, 1001)]
+        big = ByteContentProvider(b"x" * (JOB_TASK_SIZE + 1), file_path="big")
+        tasks = CredSweeper.get_pool_tasks([*small[:500], big, *small[500:]], 4)
+        # the biggest provider is the first single task
+        self.assertListEqual([big], tasks[0])
+        # all providers are scheduled once
+        self.assertEqual(1 + len(small), sum(len(x) for x in tasks))
+        self.assertSetEqual({id(x) for x in [big, *small]}, {id(y) for x in tasks for y in x})
+        # the providers are ordered by size
+        sizes = [len(y.data) for x in tasks for y in x]
+        self.assertListEqual(sorted(sizes, reverse=True), sizes)
+        # enough tasks to balance load
+        self.assertLessEqual(4 * JOB_TASKS_PER_PROCESS, len(tasks))
+        self.assertTrue(all(JOB_TASK_LEN >= len(x) for x in tasks))
+        # size of a file is obtained without reading
+        self.assertEqual((SAMPLES_PATH / "password.gradle").stat().st_size,
+                         CredSweeper.get_provider_size(TextContentProvider(SAMPLES_PATH / "password.gradle")))
+        self.assertEqual(0, CredSweeper.get_provider_size(TextContentProvider(SAMPLES_PATH / "not_existed")))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_stream_p(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reports = []
+            for stream, pool_count in [(False, 1), (True, 1), (True, 2)]:
+                json_filename = Path(tmp_dir) / f"{stream}{pool_count}.jsonl"
+                cred_sweeper = CredSweeper(ml_threshold=0,
+                                           json_filename=json_filename,
+                                           pool_count=pool_count,
+                                           stream=stream)
+                with patch("credsweeper.app.STREAM_BATCH_SIZE", 16):
+                    found = cred_sweeper.run(content_provider=FilesProvider([SAMPLES_PATH]))
+                report = [json.loads(x) for x in json_filename.read_text().splitlines()]
+                self.assertEqual(found, len(report))
+                reports.append(sorted(report, key=lambda x: json.dumps(x, sort_keys=True)))
+            self.assertEqual(SAMPLES_FILTERED_COUNT, len(reports[0]))
+            self.assertListEqual(reports[0], reports[1])
+            self.assertListEqual(reports[0], reports[2])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_adaptive_filters_p(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filter_profile = Path(tmp_dir) / "filter_profile.json"
+            reports = []
+            for pool_count in [1, 2]:
+                json_filename = Path(tmp_dir) / f"{pool_count}.json"
+                cred_sweeper = CredSweeper(ml_threshold=0,
+                                           json_filename=json_filename,
+                                           pool_count=pool_count,
+                                           adaptive_filters=True,
+                                           filter_profile=filter_profile)
+                with patch.object(AdaptiveFilters, "REORDER_PERIOD", 16):
+                    cred_sweeper.run(content_provider=FilesProvider([SAMPLES_PATH]))
+                reports.append(sorted(Util.json_load(json_filename), key=lambda x: json.dumps(x, sort_keys=True)))
+                # statistics of the jobs are merged
+                profile = Util.json_load(filter_profile)
+                self.assertLess(0, profile["Password"][0]["rejections"])
+            self.assertEqual(SAMPLES_FILTERED_COUNT, len(reports[0]))
+            self.assertListEqual(reports[0], reports[1])
+            # the order of the profile is applied without the measurement
+            cred_sweeper = CredSweeper(filter_profile=filter_profile)
+            rule = next(x for x, _ in cred_sweeper.scanner.rules_scanners if "Password" == x.rule_name)
+            self.assertNotIsInstance(rule.filters, AdaptiveFilters)
+            self.assertListEqual([x["filter"] for x in profile["Password"]],
+                                 [x.__class__.__name__ for x in rule.filters])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_pool_containers_p(self) -> None:
+        # members of the archives are scanned in the jobs when the archives are large enough
+        paths = [SAMPLES_PATH / x for x in ["pem_key.tar", "pem_key.zip", "sample.docx", "password.gradle"]]
+        reports = []
+        for pool_count, container_size in [(1, 0), (2, 1 << 24), (2, 0)]:
+            cred_sweeper = CredSweeper(ml_threshold=0, depth=3, pool_count=pool_count, sort_output=True)
+            with patch("credsweeper.app.JOB_CONTAINER_SIZE", container_size):
+                cred_sweeper.run(content_provider=FilesProvider(paths))
+            credentials = cred_sweeper.credential_manager.get_credentials()
+            reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+        self.assertTrue(reports[0])
+        self.assertListEqual(reports[0], reports[1])
+        self.assertListEqual(reports[0], reports[2])
+
+    def test_pool_container_single_p(self) -> None:
+        # members of single archive are scanned in the jobs, broken member falls back to scan of whole archive
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            broken_zip = Path(tmp_dir) / "broken.zip"
+            with zipfile.ZipFile(broken_zip, "w", compression=zipfile.ZIP_STORED) as zf:
+                zf.writestr("a/password.gradle", (SAMPLES_PATH / "password.gradle").read_bytes())
+                zf.writestr("b/aws_client_id", (SAMPLES_PATH / "aws_client_id").read_bytes())
+            data = bytearray(broken_zip.read_bytes())
+            # spoil the data of the last member, so CRC check fails
+            data[data.rfind(b"AKIA")] ^= 0x20
+            broken_zip.write_bytes(data)
+            for path in [SAMPLES_PATH / "pem_key.zip", SAMPLES_PATH / "pem_key.tar", broken_zip]:
+                reports = []
+                for pool_count in [1, 2]:
+                    cred_sweeper = CredSweeper(ml_threshold=0, depth=3, pool_count=pool_count, sort_output=True)
+                    with patch("credsweeper.app.JOB_CONTAINER_SIZE", 0), patch("credsweeper.app.JOB_TASK_LEN", 1):
+                        cred_sweeper.run(content_provider=FilesProvider([path]))
+                    credentials = cred_sweeper.credential_manager.get_credentials()
+                    reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+                # fallback scanners do not find the credentials in the broken archive
+                self.assertEqual(broken_zip != path, bool(reports[0]), path)
+                self.assertListEqual(reports[0], reports[1], path)
+
+    def test_pool_container_cache_p(self) -> None:
+        # the archive is looked up in the cache once and the cached candidates are not sent to the jobs
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reports = []
+            for _ in range(2):
+                cred_sweeper = CredSweeper(ml_threshold=0, depth=3, pool_count=2, cache_path=tmp_dir, sort_output=True)
+                with patch("credsweeper.app.JOB_CONTAINER_SIZE", 0):
+                    cred_sweeper.run(content_provider=FilesProvider([SAMPLES_PATH / "pem_key.zip"]))
+                credentials = cred_sweeper.credential_manager.get_credentials()
+                reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+            self.assertEqual(1, cred_sweeper.scan_cache.hits)
+            self.assertEqual(0, cred_sweeper.scan_cache.misses)
+            self.assertTrue(reports[0])
+            self.assertListEqual(reports[0], reports[1])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_jobs_start_method_p(self) -> None:
+        paths = [SAMPLES_PATH / x for x in ["password.gradle", "pem_key", "sample.py", "aws_multi.md"]]
+        reports = []
+        for start_method in JOBS_START_METHODS:
+            cred_sweeper = CredSweeper(ml_threshold=0, pool_count=2, jobs_start_method=start_method, sort_output=True)
+            cred_sweeper.run(content_provider=FilesProvider(paths))
+            credentials = cred_sweeper.credential_manager.get_credentials()
+            reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+        self.assertTrue(reports[0])
+        self.assertListEqual(reports[0], reports[1])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def test_find_by_ext_n(self) -> None:
         # test for finding files by extension
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -978,3 +1134,16 @@ class TestMain(unittest.TestCase):
             # but does not contain in report file
             for x in test_values:
                 self.assertNotIn(x, str(report))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_whole_file_p(self) -> None:
+        # whole file mode must produce the same report as per line scan
+        reports = []
+        for whole_file in (False, True):
+            cred_sweeper = CredSweeper(ml_threshold=0, whole_file=whole_file, sort_output=True)
+            cred_sweeper.run(FilesProvider([SAMPLES_PATH]))
+            credentials = cred_sweeper.credential_manager.get_credentials()
+            reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+        self.assertEqual(SAMPLES_FILTERED_COUNT, len(reports[1]))
+        self.assertListEqual(reports[0], reports[1])
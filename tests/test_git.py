@@ -8,6 +8,9 @@ import tempfile
 import time
 import unittest
 from tarfile import TarFile
+from unittest.mock import patch
+
+from git import Repo
 
 from credsweeper.main import EXIT_SUCCESS, main
 from credsweeper.utils.util import Util
@@ -285,3 +288,57 @@ class TestGit(unittest.TestCase):
             git_report_filename = os.path.join(tmp_dir, "report.9d3df94e8257240aa2b98dee47dc17992c0b7476.json")
             report = Util.json_load(git_report_filename)
             self.assertLessEqual(1, len(report))
+
+    def test_git_size_limit_n(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filename = os.path.join(tmp_dir, "report.json")
+            # the blob with the key is not read
+            args_mock = [
+                "--git",
+                str(self.temp_dir_path), "--ref", "9d3df94e8257240aa2b98dee47dc17992c0b7476", "--size_limit", "16",
+                "--save-json", json_filename
+            ]
+            self.assertEqual(EXIT_SUCCESS, main(args_mock))
+            git_report_filename = os.path.join(tmp_dir, "report.9d3df94e8257240aa2b98dee47dc17992c0b7476.json")
+            self.assertListEqual([], Util.json_load(git_report_filename))
+
+    def test_git_index_p(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            git_index = os.path.join(tmp_dir, "index.sqlite")
+            git_args_mock = ["--git", str(self.temp_dir_path), "--ref", "b7b09c8cdec2904dbb6f77eec2aa6abaef975252"]
+            self.assertEqual(EXIT_SUCCESS, main(git_args_mock + ["--save-json", os.path.join(tmp_dir, "report.json")]))
+            index_args_mock = git_args_mock + ["--git_index", git_index]
+            self.assertEqual(EXIT_SUCCESS, main(index_args_mock + ["--save-json", os.path.join(tmp_dir, "first.json")]))
+            for commit_sha1 in ["9d3df94e8257240aa2b98dee47dc17992c0b7476"]:
+                expected = Util.json_load(os.path.join(tmp_dir, f"report.{commit_sha1}.json"))
+                self.assertLessEqual(1, len(expected))
+                self.assertListEqual(expected, Util.json_load(os.path.join(tmp_dir, f"first.{commit_sha1}.json")))
+            # all commits are in the index - nothing is scanned again
+            self.assertEqual(EXIT_SUCCESS,
+                             main(index_args_mock + ["--save-json", os.path.join(tmp_dir, "second.json")]))
+            self.assertListEqual([], [x for x in os.listdir(tmp_dir) if x.startswith("second.")])
+
+    def test_git_queue_p(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo_path = os.path.join(tmp_dir, "repo")
+            repo = Repo.init(repo_path)
+            with repo.config_writer() as config_writer:
+                config_writer.set_value("user", "name", "Your Name")
+                config_writer.set_value("user", "email", "you@example.com")
+            commits_sha1 = []
+            # versions of the same file in different commits and the same blob in different paths
+            for text in ['password = "Xdj@jcN834b"\n', 'password = "Ydj@jcN834b"\n', 'password = "Xdj@jcN834b"\n']:
+                for name in ["a.py", "b.py"]:
+                    with open(os.path.join(repo_path, name), "w") as f:
+                        f.write(text)
+                repo.index.add(["a.py", "b.py"])
+                commits_sha1.append(repo.index.commit(text).hexsha)
+            git_args = ["--git", repo_path, "--ref", commits_sha1[-1], "--ml_threshold", "0", "--jobs", "2"]
+            self.assertEqual(EXIT_SUCCESS, main(git_args + ["--save-json", os.path.join(tmp_dir, "queue.json")]))
+            # every commit is scanned separately
+            with patch("credsweeper.main.DRILL_QUEUE_SIZE", 1):
+                self.assertEqual(EXIT_SUCCESS, main(git_args + ["--save-json", os.path.join(tmp_dir, "single.json")]))
+            for commit_sha1 in commits_sha1:
+                report = Util.json_load(os.path.join(tmp_dir, f"queue.{commit_sha1}.json"))
+                self.assertEqual(2, len(report))
+                self.assertListEqual(report, Util.json_load(os.path.join(tmp_dir, f"single.{commit_sha1}.json")))
@@ -235,8 +235,10 @@ class TestInt(TestCase):
                    " | --export_config [PATH]" \
                    " | --export_log_config [PATH]" \
                    " | --git PATH" \
+                   " | --serve ADDRESS" \
                    ")" \
                    " [--ref REF]" \
+                   " [--git_index PATH]" \
                    " [--rules PATH]" \
                    " [--severity SEVERITY]" \
                    " [--config PATH]" \
@@ -247,13 +249,18 @@ class TestInt(TestCase):
                    " [--depth POSITIVE_INT]" \
                    " [--no-filters]" \
                    " [--doc]" \
+                   " [--whole-file | --no-whole-file]" \
+                   " [--adaptive_filters]" \
+                   " [--filter_profile PATH]" \
                    " [--ml_threshold THRESHOLD_OR_FLOAT_OR_ZERO]" \
                    " [--ml_batch_size POSITIVE_INT]" \
                    " [--ml_config PATH]" \
                    " [--ml_model PATH]" \
                    " [--ml_providers STR] " \
                    " [--ml_threads_limit POSITIVE_INT] " \
+                   " [--ml_in_jobs]" \
                    " [--jobs POSITIVE_INT]" \
+                   " [--jobs_start_method {spawn,forkserver}]" \
                    " [--thrifty | --no-thrifty]" \
                    " [--skip_ignored]" \
                    " [--error | --no-error]" \
@@ -264,8 +271,15 @@ class TestInt(TestCase):
                    " [--hashed | --no-hashed]" \
                    " [--subtext | --no-subtext]" \
                    " [--sort | --no-sort]" \
+                   " [--stream | --no-stream]" \
                    " [--log LOG_LEVEL]" \
                    " [--size_limit SIZE_LIMIT]" \
+                   " [--parser_timeout POSITIVE_INT]" \
+                   " [--pattern_timeout SECONDS]" \
+                   " [--cache PATH]" \
+                   " [--cache_size CACHE_SIZE]" \
+                   " [--cache_age POSITIVE_INT]" \
+                   " [--profile [PATH]]" \
                    " [--banner] " \
                    " [--version] " \
                    "python -m credsweeper: error: one of the arguments" \
@@ -274,6 +288,7 @@ class TestInt(TestCase):
                    " --export_config" \
                    " --export_log_config" \
                    " --git" \
+                   " --serve" \
                    " is required "
         expected = " ".join(expected.split())
         self.assertEqual(expected, output)
@@ -357,6 +372,18 @@ class TestInt(TestCase):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def test_lazy_import_p(self) -> None:
+        # heavy dependencies are not imported for a plain scan without ML
+        heavy_modules = ["bs4", "docx", "git", "jks", "lxml", "onnxruntime", "pandas", "pdfminer", "pptx", "pygments"]
+        code = ("import sys; from credsweeper.main import main;"
+                f" main(['--path', {str(SAMPLES_PATH / 'password.gradle')!r}, '--ml_threshold', '0', '--no-stdout']);"
+                f" print('imported:', *(x for x in {heavy_modules!r} if x in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=APP_PATH.parent, capture_output=True, text=True)
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual("imported:", result.stdout.splitlines()[-1])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def test_patch_save_json_p(self) -> None:
         target_path = str(SAMPLES_PATH / "password.patch")
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -0,0 +1,35 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from git import Repo
+from gitdb import IStream
+
+from credsweeper.utils.git_blob_reader import GitBlobReader
+
+
+class TestGitBlobReader(unittest.TestCase):
+
+    def test_read_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo = Repo.init(tmp_dir)
+            blobs = {}
+            # large blobs fill the pipes, so the requests are written while the responses are read
+            for n, size in enumerate([0, 1, 1 << 20, 1 << 17, 3]):
+                data = bytes(x % 251 for x in range(size)) + b"\nend\n" * n
+                blobs[repo.odb.store(IStream("blob", len(data), io.BytesIO(data))).hexsha.decode()] = data
+            missing = "0" * 40
+            with GitBlobReader(tmp_dir) as reader:
+                for _ in range(2):
+                    # the processes are reused
+                    sizes = reader.get_sizes([*blobs.keys(), missing])
+                    self.assertDictEqual({**{k: len(v) for k, v in blobs.items()}, missing: None}, sizes)
+                    self.assertDictEqual({**blobs, missing: None}, reader.read([missing, *blobs.keys()]))
+                self.assertDictEqual({}, reader.read([]))
+
+    def test_read_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with GitBlobReader(Path(tmp_dir) / "absent") as reader:
+                with self.assertRaises(RuntimeError):
+                    reader.get_sizes(["0" * 40])
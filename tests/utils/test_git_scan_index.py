@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.git_scan_index import GitScanIndex
+from tests import SAMPLES_PATH
+
+
+class TestGitScanIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.cred_sweeper = CredSweeper(ml_threshold=0)
+        self.serializer = self.cred_sweeper.candidates_serializer
+        self.candidates = self.cred_sweeper.file_scan(TextContentProvider(SAMPLES_PATH / "password.gradle"))
+        self.assertTrue(self.candidates)
+
+    def test_index_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "index.sqlite"
+            with GitScanIndex(path, self.cred_sweeper.fingerprint, self.serializer) as git_index:
+                self.assertFalse(git_index.is_commit_scanned("c0"))
+                git_index.add_blob("b0", "password.gradle", self.candidates)
+                git_index.add_blob("b1", "empty.txt", [])
+                git_index.add_commit("c0")
+            with GitScanIndex(path, self.cred_sweeper.fingerprint, self.serializer) as git_index:
+                self.assertTrue(git_index.is_commit_scanned("c0"))
+                restored = git_index.get_blob("b0", "password.gradle")
+                self.assertListEqual([x.to_json(hashed=False, subtext=False) for x in self.candidates],
+                                     [x.to_json(hashed=False, subtext=False) for x in restored])
+                self.assertListEqual([], git_index.get_blob("b1", "empty.txt"))
+                # the same blob with another path may be scanned differently
+                self.assertIsNone(git_index.get_blob("b0", "password.txt"))
+                self.assertEqual(2, git_index.hits)
+                self.assertEqual(1, git_index.misses)
+
+    def test_index_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "index.sqlite"
+            with GitScanIndex(path, self.cred_sweeper.fingerprint, self.serializer) as git_index:
+                git_index.add_blob("b0", "password.gradle", self.candidates)
+                git_index.add_commit("c0")
+                # blobs of a commit which was not completed are discarded
+                git_index.add_blob("b1", "password.gradle", self.candidates)
+            with GitScanIndex(path, self.cred_sweeper.fingerprint, self.serializer) as git_index:
+                self.assertIsNone(git_index.get_blob("b1", "password.gradle"))
+                self.assertIsNotNone(git_index.get_blob("b0", "password.gradle"))
+            # the index is cleared for other settings
+            with GitScanIndex(path, "other", self.serializer) as git_index:
+                self.assertFalse(git_index.is_commit_scanned("c0"))
+                self.assertIsNone(git_index.get_blob("b0", "password.gradle"))
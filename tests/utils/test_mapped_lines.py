@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from credsweeper.common.constants import UTF_8, LATIN_1
+from credsweeper.utils.mapped_lines import MappedLines
+from credsweeper.utils.util import Util
+
+
+class TestMappedLines(unittest.TestCase):
+
+    def test_lines_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "test.txt")
+            for data in [
+                    b"a", b"\n", b"a\r\nb\rc\nd", b"\r\r\n\n\r", "ключ\r\nзначення\n".encode(UTF_8),
+                    b"caf\xe9\r\npassword = \xa9\n"
+            ]:
+                with open(file_path, "wb") as f:
+                    f.write(data)
+                # small chunks check line endings which are split between chunks
+                for chunk_size in [1, 2, 3, 1 << 16]:
+                    with patch.object(MappedLines, "CHUNK_SIZE", chunk_size):
+                        mapped_lines = MappedLines.open(file_path)
+                    expected = Util.decode_bytes(data)
+                    self.assertListEqual(expected, list(mapped_lines))
+                    self.assertListEqual(expected, mapped_lines[:])
+                    self.assertEqual(len(expected), len(mapped_lines))
+                    self.assertEqual(expected[-1], mapped_lines[-1])
+                    self.assertEqual(LATIN_1 if 0xE9 in data else UTF_8, mapped_lines.encoding)
+                    mapped_lines.close()
+
+    def test_lines_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "test.bin")
+            # UTF-16 is not mapped
+            with open(file_path, "wb") as f:
+                f.write("text".encode("utf_16"))
+            self.assertIsNone(MappedLines.open(file_path))
+            # binary data has no lines
+            with open(file_path, "wb") as f:
+                f.write(b"\x7fELF\x02\x01\x01\x00\x00\x00\x00\xf3\xc3\n\x00\x00\x00\x00")
+            mapped_lines = MappedLines.open(file_path)
+            self.assertEqual('', mapped_lines.encoding)
+            self.assertEqual(0, len(mapped_lines))
+            with self.assertRaises(IndexError):
+                _ = mapped_lines[0]
+            mapped_lines.close()
+            self.assertIsNone(MappedLines.open(os.path.join(tmp_dir, "not_existed")))
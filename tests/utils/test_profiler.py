@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.profiler import Profiler
+from credsweeper.utils.util import Util
+from tests import SAMPLES_PATH
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        Profiler.reset()
+
+    def tearDown(self):
+        Profiler.enabled = False
+        Profiler.reset()
+
+    def test_profiler_p(self):
+        Profiler.add("filter", "ValueLengthCheck", 0.5, True)
+        Profiler.add("filter", "ValueLengthCheck", 0.25, False)
+        Profiler.add("ml", "inference", 2.0, 16)
+        counters = Profiler.get_counters()
+        self.assertDictEqual({"calls": 2, "hits": 1, "seconds": 0.75}, counters["filter"]["ValueLengthCheck"])
+        self.assertDictEqual({"calls": 1, "hits": 16, "seconds": 2.0}, counters["ml"]["inference"])
+        # counters of other process
+        Profiler.merge(counters)
+        counters = Profiler.get_counters()
+        self.assertDictEqual({"calls": 4, "hits": 2, "seconds": 1.5}, counters["filter"]["ValueLengthCheck"])
+        table = Profiler.get_table().splitlines()
+        self.assertEqual(3, len(table))
+        self.assertTrue(table[1].startswith("ml:inference "))
+        self.assertTrue(table[2].startswith("filter:ValueLengthCheck "))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "profile.json")
+            Profiler.save(file_path)
+            self.assertDictEqual(Profiler.get_counters(), Util.json_load(file_path))
+        Profiler.reset()
+        self.assertDictEqual({}, Profiler.get_counters())
+
+    def test_app_profile_p(self):
+        content_provider = TextContentProvider(SAMPLES_PATH / "password.tfvars")
+        CredSweeper(ml_threshold=0).file_scan(content_provider)
+        self.assertDictEqual({}, Profiler.get_counters())
+        CredSweeper(ml_threshold=0, profile=True).file_scan(content_provider)
+        counters = Profiler.get_counters()
+        self.assertEqual(1, counters["prefilter"]["required_substrings"]["hits"])
+        self.assertEqual(1, counters["rule"]["Password"]["hits"])
+        self.assertIn("ValueLengthCheck", counters["filter"])
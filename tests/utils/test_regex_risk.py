@@ -0,0 +1,24 @@
+import re
+import unittest
+
+from credsweeper.common.keyword_pattern import KeywordPattern
+from credsweeper.utils.regex_risk import RegexRisk
+
+
+class TestRegexRisk(unittest.TestCase):
+
+    def test_regex_risk_p(self):
+        self.assertListEqual([RegexRisk.NESTED_QUANTIFIER], RegexRisk.analyze(re.compile(r"(a+)+$")))
+        self.assertListEqual([RegexRisk.NESTED_QUANTIFIER], RegexRisk.analyze(re.compile(r"(?:\w+\s?)*x")))
+        self.assertListEqual([RegexRisk.BACKREFERENCE_IN_REPETITION, RegexRisk.LOOKAROUND_IN_REPETITION],
+                             RegexRisk.analyze(re.compile(r"(?P<lq>['\"])(.(?!(?P=lq))){4,8000}")))
+        self.assertListEqual([RegexRisk.LOOKAROUND_IN_REPETITION], RegexRisk.analyze(re.compile(r"(?:(?<!\\)[^'])*'")))
+        # the template of keyword rules
+        self.assertIn(RegexRisk.BACKREFERENCE_IN_REPETITION,
+                      RegexRisk.analyze(KeywordPattern.get_keyword_pattern("password")))
+
+    def test_regex_risk_n(self):
+        self.assertListEqual([], RegexRisk.analyze(re.compile(r"[^\"]{4,8000}")))
+        self.assertListEqual([], RegexRisk.analyze(re.compile(r"(?:[0-9a-z]+\.){1,5}com")))
+        self.assertListEqual([], RegexRisk.analyze(re.compile(r"(?:x(?!y)){2,3}")))
+        self.assertListEqual([], RegexRisk.analyze(re.compile(r"(?P<value>ghp_[0-9A-Za-z]{36})")))
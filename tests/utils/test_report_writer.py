@@ -0,0 +1,48 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import DiffRowType
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.report_writer import ReportWriter
+from tests import SAMPLES_PATH
+
+
+class TestReportWriter(unittest.TestCase):
+
+    def setUp(self):
+        cred_sweeper = CredSweeper(ml_threshold=0)
+        self.candidates = cred_sweeper.file_scan(TextContentProvider(SAMPLES_PATH / "password.gradle"))
+        self.assertTrue(self.candidates)
+
+    def test_json_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = Path(tmp_dir) / "report.json"
+            with ReportWriter(json_filename=json_path) as report_writer:
+                report_writer.write(self.candidates[:1])
+                report_writer.write([])
+                report_writer.write(self.candidates[1:])
+            self.assertEqual(len(self.candidates), report_writer.count)
+            expected = [x.to_json(hashed=False, subtext=False) for x in self.candidates]
+            self.assertListEqual(expected, json.loads(json_path.read_text()))
+
+    def test_json_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = Path(tmp_dir) / "report.json"
+            with ReportWriter(json_filename=json_path, change_type=DiffRowType.DELETED) as report_writer:
+                report_writer.write([])
+            self.assertEqual(0, report_writer.count)
+            self.assertFalse(json_path.exists())
+            self.assertListEqual([], json.loads((Path(tmp_dir) / "report.deleted.json").read_text()))
+
+    def test_jsonl_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = Path(tmp_dir) / "report.jsonl"
+            with ReportWriter(json_filename=json_path, hashed=True) as report_writer:
+                report_writer.write(self.candidates)
+                # the written lines are available before close
+                self.assertEqual(len(self.candidates), len(json_path.read_text().splitlines()))
+            expected = [x.to_json(hashed=True, subtext=False) for x in self.candidates]
+            self.assertListEqual(expected, [json.loads(x) for x in json_path.read_text().splitlines()])
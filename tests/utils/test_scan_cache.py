@@ -0,0 +1,112 @@
+import io
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.files_provider import FilesProvider
+from credsweeper.file_handler.string_content_provider import StringContentProvider
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.utils.scan_cache import ScanCache
+from tests import SAMPLES_PATH
+
+
+class TestScanCache(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.cred_sweeper = CredSweeper(ml_threshold=0)
+        self.config = self.cred_sweeper.config
+
+    def test_fingerprint_p(self):
+        self.assertEqual(ScanCache.get_fingerprint("a", b"b", None), ScanCache.get_fingerprint(b"a", "b", None))
+        self.assertNotEqual(ScanCache.get_fingerprint("ab", "c"), ScanCache.get_fingerprint("a", "bc"))
+        self.assertNotEqual(ScanCache.get_fingerprint(None), ScanCache.get_fingerprint(""))
+
+    def test_key_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scan_cache = ScanCache(tmp_dir, "test", self.config)
+            # providers without raw data are not cached
+            self.assertIsNone(scan_cache.get_key(StringContentProvider(["password = Xdj@jcN834b"])))
+            self.assertIsNone(scan_cache.get_key(TextContentProvider(Path(tmp_dir) / "not_existed")))
+            self.assertIsNone(scan_cache.get("0123456789abcdef"))
+            self.assertEqual(1, scan_cache.misses)
+
+    def test_put_get_p(self):
+        candidates = self.cred_sweeper.file_scan(TextContentProvider(SAMPLES_PATH / "password.gradle"))
+        self.assertTrue(candidates)
+        provider = TextContentProvider(SAMPLES_PATH / "password.gradle")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scan_cache = ScanCache(tmp_dir, "test", self.config)
+            key = scan_cache.get_key(provider)
+            self.assertEqual(key, scan_cache.get_key(TextContentProvider(SAMPLES_PATH / "password.gradle")))
+            # the file is hashed by chunks without reading the data
+            self.assertNotIn("data", provider.__dict__)
+            data = (SAMPLES_PATH / "password.gradle").read_bytes()
+            io_provider = TextContentProvider((SAMPLES_PATH / "password.gradle", io.BytesIO(data)))
+            self.assertEqual(key, scan_cache.get_key(io_provider))
+            # another fingerprint gives another key
+            self.assertNotEqual(key, ScanCache(tmp_dir, "other", self.config).get_key(provider))
+            scan_cache.put(key, candidates)
+            cached = scan_cache.get(key)
+            self.assertEqual(1, scan_cache.hits)
+            self.assertEqual(len(candidates), len(cached))
+            for candidate, cached_candidate in zip(candidates, cached):
+                # config is not stored but restored with current object
+                self.assertIs(self.config, cached_candidate.config)
+                self.assertIs(self.config, cached_candidate.line_data_list[0].config)
+                self.assertDictEqual(candidate.to_json(hashed=False, subtext=False),
+                                     cached_candidate.to_json(hashed=False, subtext=False))
+            # empty result is cached too
+            scan_cache.put("0" * 64, [])
+            self.assertListEqual([], scan_cache.get("0" * 64))
+
+    def test_broken_n(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scan_cache = ScanCache(tmp_dir, "test", self.config)
+            key = "f" * 64
+            scan_cache.put(key, [])
+            entry_path = Path(tmp_dir) / key[:2] / f"{key}{ScanCache.SUFFIX}"
+            self.assertTrue(entry_path.exists())
+            entry_path.write_bytes(b"broken")
+            self.assertIsNone(scan_cache.get(key))
+            self.assertFalse(entry_path.exists())
+            # pickled exception is not restored
+            scan_cache.put(key, [])
+            entry_path.write_bytes(pickle.dumps(Exception("test")))
+            self.assertIsNone(scan_cache.get(key))
+            self.assertFalse(entry_path.exists())
+
+    def test_evict_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ScanCache(tmp_dir, "test", self.config).put("a" * 64, [])
+            self.assertEqual(0, ScanCache(tmp_dir, "test", self.config).evict())
+            now = time.time()
+            for n, key in enumerate(["a" * 64, "b" * 64, "c" * 64, "d" * 64]):
+                ScanCache(tmp_dir, "test", self.config).put(key, [])
+                entry_path = Path(tmp_dir) / key[:2] / f"{key}{ScanCache.SUFFIX}"
+                # the oldest entry is the first
+                os.utime(entry_path, (now - 86400 * (4 - n), now - 86400 * (4 - n)))
+            entry_size = entry_path.stat().st_size
+            # removed by age
+            self.assertEqual(1, ScanCache(tmp_dir, "test", self.config, age_limit=3 * 86400 + 3600).evict())
+            self.assertFalse((Path(tmp_dir) / "aa").joinpath(f"{'a' * 64}{ScanCache.SUFFIX}").exists())
+            # removed the oldest by size
+            self.assertEqual(2, ScanCache(tmp_dir, "test", self.config, size_limit=entry_size).evict())
+            self.assertTrue((Path(tmp_dir) / "dd").joinpath(f"{'d' * 64}{ScanCache.SUFFIX}").exists())
+
+    def test_app_p(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reports = []
+            for _ in range(2):
+                cred_sweeper = CredSweeper(ml_threshold=0, cache_path=tmp_dir, sort_output=True)
+                cred_sweeper.run(FilesProvider([SAMPLES_PATH / "password.gradle", SAMPLES_PATH / "aws_client_id"]))
+                credentials = cred_sweeper.credential_manager.get_credentials()
+                reports.append([x.to_json(hashed=False, subtext=False) for x in credentials])
+            self.assertEqual(2, cred_sweeper.scan_cache.hits)
+            self.assertEqual(0, cred_sweeper.scan_cache.misses)
+            self.assertTrue(reports[0])
+            self.assertListEqual(reports[0], reports[1])
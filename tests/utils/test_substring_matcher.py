@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from credsweeper.utils.substring_matcher import SubstringMatcher
+
+
+class TestSubstringMatcher(unittest.TestCase):
+
+    def test_empty_n(self):
+        matcher = SubstringMatcher([])
+        self.assertFalse(matcher.search("anything"))
+        self.assertSetEqual(set(), matcher.find_all("anything"))
+        self.assertListEqual([], list(matcher.find_iter("anything")))
+        # empty words are ignored
+        matcher = SubstringMatcher(['', ''])
+        self.assertFalse(matcher.search(""))
+        self.assertSetEqual(set(), matcher.words)
+
+    def test_prefixes_p(self):
+        matcher = SubstringMatcher(["pass", "password", "passwd", "word"])
+        self.assertTupleEqual(("pass", "password"), matcher.prefixes("password"))
+        self.assertTupleEqual(("pass", ), matcher.prefixes("pass"))
+        self.assertTupleEqual((), matcher.prefixes("unknown"))
+
+    def test_find_iter_p(self):
+        matcher = SubstringMatcher(["pass", "password", "word", "sword", "a.b"])
+        self.assertListEqual([(3, "pass"), (3, "password"), (6, "sword"), (7, "word")],
+                             list(matcher.find_iter("my password")))
+        # special symbols are escaped
+        self.assertFalse(matcher.search("axb"))
+        self.assertTrue(matcher.search("xa.bx"))
+        self.assertTrue(matcher.search("pa\nss word"))
+        self.assertFalse(matcher.search("pa\nss wor"))
+
+    def test_find_all_p(self):
+        rnd = random.Random(42)
+        alphabet = "abc\n"
+        words = set(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 5))) for _ in range(50))
+        matcher = SubstringMatcher(words)
+        for _ in range(200):
+            text = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 40)))
+            expected = set(x for x in words if x in text)
+            self.assertSetEqual(expected, matcher.find_all(text), text)
+            self.assertEqual(bool(expected), matcher.search(text), text)
+            expected_iter = sorted((i, x) for x in words for i in range(len(text)) if text.startswith(x, i))
+            self.assertListEqual(expected_iter, sorted(matcher.find_iter(text)), text)
@@ -0,0 +1,62 @@
+import signal
+import threading
+import time
+import unittest
+
+from credsweeper.utils.time_limit import TimeLimit
+
+
+class TestTimeLimit(unittest.TestCase):
+
+    @staticmethod
+    def busy_loop(seconds: float) -> int:
+        """Python code which runs the time"""
+        n = 0
+        end_time = time.monotonic() + seconds
+        while time.monotonic() < end_time:
+            n += 1
+        return n
+
+    def test_time_limit_p(self):
+        start_time = time.monotonic()
+        time_limit = TimeLimit(0.1)
+        with self.assertRaises(TimeLimit.Expired) as context:
+            with time_limit:
+                self.busy_loop(10)
+        self.assertIs(time_limit, context.exception.args[0])
+        self.assertGreater(1, time.monotonic() - start_time)
+        # the timer is stopped and the handler is restored
+        self.assertEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_REAL))
+        self.assertEqual(signal.SIG_DFL, signal.getsignal(signal.SIGALRM))
+        with TimeLimit(1):
+            self.busy_loop(0.1)
+        self.assertEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_REAL))
+
+    def test_time_limit_nested_p(self):
+        outer_limit = TimeLimit(0.2)
+        with self.assertRaises(TimeLimit.Expired) as context:
+            with outer_limit:
+                # the inner limit is not applied
+                with TimeLimit(0.1):
+                    self.busy_loop(0.3)
+                self.busy_loop(10)
+        self.assertIs(outer_limit, context.exception.args[0])
+
+    def test_time_limit_n(self):
+        for seconds in [None, 0]:
+            with TimeLimit(seconds):
+                self.busy_loop(0.1)
+                self.assertEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_REAL))
+        errors = []
+
+        def thread_target():
+            try:
+                with TimeLimit(0.1):
+                    self.busy_loop(0.3)
+            except BaseException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=thread_target)
+        thread.start()
+        thread.join()
+        self.assertListEqual([], errors)
@@ -0,0 +1,50 @@
+import re
+import signal
+import threading
+import time
+import unittest
+
+from credsweeper.utils.watchdog import Watchdog
+
+
+class TestWatchdog(unittest.TestCase):
+
+    def test_watchdog_p(self):
+        pattern = re.compile(r"(a+)+!")
+        with Watchdog(0.1) as watchdog:
+            watchdog.start()
+            self.assertIsNone(pattern.search("aaaa"))
+            self.assertGreater(0.1, watchdog.stop())
+            start_time = time.perf_counter()
+            with self.assertRaises(Watchdog.Expired) as context:
+                watchdog.start()
+                pattern.search('a' * 40)
+            self.assertLess(0.1, context.exception.args[0])
+            self.assertGreater(2, time.perf_counter() - start_time)
+            # ticks between stages are ignored
+            time.sleep(0.2)
+        # the timer is stopped and the handler is restored
+        self.assertEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_VIRTUAL))
+        self.assertEqual(signal.SIG_DFL, signal.getsignal(signal.SIGVTALRM))
+
+    def test_watchdog_n(self):
+        results = []
+
+        def stage():
+            with Watchdog(0.01) as watchdog:
+                watchdog.start()
+                time.sleep(0.05)
+                results.append(watchdog.stop())
+
+        # the stage is only measured in other thread
+        thread = threading.Thread(target=stage)
+        thread.start()
+        thread.join()
+        self.assertLess(0.01, results[0])
+        # inner watchdog does not rearm the timer of outer one
+        with Watchdog(10) as outer:
+            with Watchdog(0.01) as inner:
+                inner.start()
+                self.assertLess(0.0, inner.stop())
+            self.assertNotEqual((0.0, 0.0), signal.getitimer(signal.ITIMER_VIRTUAL))
+            self.assertEqual(10, outer.seconds)